@@ -34,7 +34,7 @@ from pandas.io.pytables import HDFStore
 from pandas.util.testing import debug
 
 from pandas.tools.describe import value_range
-from pandas.tools.merge import merge, concat, ordered_merge
+from pandas.tools.merge import merge, concat, ordered_merge, DataFrameBuilder
 from pandas.tools.pivot import pivot_table, crosstab
 from pandas.tools.plotting import scatter_matrix, plot_params
 from pandas.tools.tile import cut, qcut
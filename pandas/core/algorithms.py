@@ -38,6 +38,81 @@ def match(to_match, values, na_sentinel=-1):
     return _hashtable_algo(f, values.dtype)
 
 
+# largest number of values looked up by binary search in sorted data
+_ISIN_BISECT_CUTOFF = 64
+
+
+def isin(comps, values, is_sorted=False):
+    """
+    Compute boolean array of whether each element of comps is found in the
+    passed values, hashing the values with a typed hash table
+
+    Parameters
+    ----------
+    comps : array-like
+        values to check for membership
+    values : sequence or set of values
+    is_sorted : boolean, default False
+        Whether comps is known to be monotonic increasing. A small number of
+        numeric values is then located by binary search instead of hashing
+
+    Returns
+    -------
+    isin : ndarray (boolean dtype)
+    """
+    comps = np.asarray(comps)
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+        try:
+            values = com._asarray_tuplesafe(values)
+        except ValueError:
+            # e.g. tuples mixed with scalars
+            values = lib.list_to_object_array(values)
+
+    if len(comps) == 0 or len(values) == 0:
+        return np.zeros(len(comps), dtype=bool)
+
+    if com.is_datetime64_dtype(comps):
+        from pandas.tseries.index import DatetimeIndex
+        try:
+            values = DatetimeIndex(values).asi8
+        except (TypeError, ValueError):
+            return isin(DatetimeIndex(comps).asobject, values)
+        comps = comps.view(np.int64)
+
+    if com.is_integer_dtype(comps) and com.is_integer_dtype(values):
+        table_type = lib.Int64HashTable
+        comps = com._ensure_int64(comps)
+        values = com._ensure_int64(values)
+    elif (_is_numeric_dtype(comps) and _is_numeric_dtype(values)):
+        table_type = lib.Float64HashTable
+        comps = com._ensure_float64(comps)
+        values = com._ensure_float64(values)
+    else:
+        table_type = lib.PyObjectHashTable
+        comps = com._ensure_object(comps)
+        values = com._ensure_object(values)
+
+    if (is_sorted and table_type is not lib.PyObjectHashTable
+            and len(values) <= _ISIN_BISECT_CUTOFF):
+        # NaN never matches
+        values = values[values == values]
+        left = comps.searchsorted(values, side='left')
+        right = comps.searchsorted(values, side='right')
+        result = np.zeros(len(comps), dtype=bool)
+        for start, stop in zip(left, right):
+            result[start:stop] = True
+        return result
+
+    table = table_type(min(len(values), 1000000))
+    table.map_locations(values)
+    return table.lookup(comps) != -1
+
+
+def _is_numeric_dtype(arr):
+    return com.is_integer_dtype(arr) or com.is_float_dtype(arr)
+
+
 def unique(values):
     """
     Compute unique values (not necessarily sorted) efficiently from input array
@@ -119,13 +194,16 @@ def factorize(values, sort=False, order=None, na_sentinel=-1):
     is_datetime = com.is_datetime64_dtype(values)
     hash_klass, values = _get_data_algo(values, _hashtables)
 
-    uniques = []
     table = hash_klass(len(values))
-    labels, counts = table.get_labels(values, uniques, 0, na_sentinel)
+    if isinstance(table, lib.PyObjectHashTable):
+        uniques = []
+        labels, counts = table.get_labels(values, uniques, 0, na_sentinel)
+        uniques = com._asarray_tuplesafe(uniques)
+    else:
+        # numeric uniques come back as an ndarray, no list round trip
+        labels, counts, uniques = table.get_labels_array(values, na_sentinel)
 
     labels = com._ensure_platform_int(labels)
-
-    uniques = com._asarray_tuplesafe(uniques)
     if sort and len(counts) > 0:
         sorter = uniques.argsort()
         reverse_indexer = np.empty(len(sorter), dtype=np.int_)
@@ -139,7 +217,7 @@ def factorize(values, sort=False, order=None, na_sentinel=-1):
         counts = counts.take(sorter)
 
     if is_datetime:
-        uniques = np.array(uniques, dtype='M8[ns]')
+        uniques = uniques.view('M8[ns]')
 
     return labels, uniques, counts
 
@@ -160,21 +238,29 @@ def value_counts(values, sort=True, ascending=False):
     -------
     value_counts : Series
     """
+    from pandas.core.categorical import Categorical
     from pandas.core.series import Series
     from collections import defaultdict
 
-    values = np.asarray(values)
-
-    if com.is_integer_dtype(values.dtype):
-        values = com._ensure_int64(values)
-        keys, counts = lib.value_count_int64(values)
-        result = Series(counts, index=keys)
+    if isinstance(values, Categorical):
+        # count the integer labels instead of the values
+        labels = com._ensure_int64(values.labels)
+        keys, counts = lib.value_count_int64(labels[labels != -1])
+        result = Series(counts, index=values.levels.take(keys))
+        result = result.sort_index()
     else:
-        counter = defaultdict(lambda: 0)
-        values = values[com.notnull(values)]
-        for value in values:
-            counter[value] += 1
-        result = Series(counter)
+        values = np.asarray(values)
+
+        if com.is_integer_dtype(values.dtype):
+            values = com._ensure_int64(values)
+            keys, counts = lib.value_count_int64(values)
+            result = Series(counts, index=keys)
+        else:
+            counter = defaultdict(lambda: 0)
+            values = values[com.notnull(values)]
+            for value in values:
+                counter[value] += 1
+            result = Series(counter)
 
     if sort:
         result.sort()
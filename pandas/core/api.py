@@ -9,12 +9,22 @@ from pandas.core.common import isnull, notnull, save, load
 from pandas.core.categorical import Categorical, Factor
 from pandas.core.format import (set_printoptions, reset_printoptions,
                                 set_eng_float_format)
-from pandas.core.index import Index, Int64Index, MultiIndex
+from pandas.core.index import Index, Int64Index, RangeIndex, MultiIndex
+from pandas.core.index import (set_engine_memory_limit, get_engine_memory_limit,
+                               get_engine_stats, reset_engine_stats)
 
 from pandas.core.series import Series, TimeSeries
 from pandas.core.frame import DataFrame
+from pandas.core.generic import (set_item_cache_size, get_item_cache_size,
+                                 get_item_cache_stats, reset_item_cache_stats)
 from pandas.core.panel import Panel
-from pandas.core.groupby import groupby
+from pandas.core.internals import (set_consolidation_policy,
+                                   get_consolidation_policy,
+                                   reset_consolidation_policy,
+                                   get_consolidation_stats,
+                                   reset_consolidation_stats,
+                                   set_na_storage, get_na_storage)
+from pandas.core.groupby import groupby, GroupByAccumulator
 from pandas.core.reshape import (pivot_simple as pivot, get_dummies,
                                  lreshape)
 
@@ -167,6 +167,9 @@ def _view_wrapper(f, wrap_dtype, na_override=None):
 
 _take1d_dict = {
     'float64': _algos.take_1d_float64,
+    'float32': _algos.take_1d_float32,
+    'int8': _algos.take_1d_int8,
+    'int16': _algos.take_1d_int16,
     'int32': _algos.take_1d_int32,
     'int64': _algos.take_1d_int64,
     'object': _algos.take_1d_object,
@@ -177,6 +180,9 @@ _take1d_dict = {
 
 _take2d_axis0_dict = {
     'float64': _algos.take_2d_axis0_float64,
+    'float32': _algos.take_2d_axis0_float32,
+    'int8': _algos.take_2d_axis0_int8,
+    'int16': _algos.take_2d_axis0_int16,
     'int32': _algos.take_2d_axis0_int32,
     'int64': _algos.take_2d_axis0_int64,
     'object': _algos.take_2d_axis0_object,
@@ -187,6 +193,9 @@ _take2d_axis0_dict = {
 
 _take2d_axis1_dict = {
     'float64': _algos.take_2d_axis1_float64,
+    'float32': _algos.take_2d_axis1_float32,
+    'int8': _algos.take_2d_axis1_int8,
+    'int16': _algos.take_2d_axis1_int16,
     'int32': _algos.take_2d_axis1_int32,
     'int64': _algos.take_2d_axis1_int64,
     'object': _algos.take_2d_axis1_object,
@@ -197,6 +206,9 @@ _take2d_axis1_dict = {
 
 _take2d_multi_dict = {
     'float64': _algos.take_2d_multi_float64,
+    'float32': _algos.take_2d_multi_float32,
+    'int8': _algos.take_2d_multi_int8,
+    'int16': _algos.take_2d_multi_int16,
     'int32': _algos.take_2d_multi_int32,
     'int64': _algos.take_2d_multi_int64,
     'object': _algos.take_2d_multi_object,
@@ -206,6 +218,20 @@ _take2d_multi_dict = {
 }
 
 
+# dtypes with a Cython take that raises on NA fill (may need upcasting)
+_take_int_dtypes = ('int8', 'int16', 'int32', 'int64', 'bool')
+
+# dtypes with a Cython take able to hold the NA fill value
+_take_na_dtypes = ('float64', 'float32', 'object', 'datetime64[ns]')
+
+
+def _maybe_cast_to_out(arr, out):
+    # e.g. float32 values taken into a float64 output buffer
+    if out is not None and out.dtype != arr.dtype:
+        arr = arr.astype(out.dtype)
+    return arr
+
+
 def _get_take2d_function(dtype_str, axis=0):
     if axis == 0:
         return _take2d_axis0_dict[dtype_str]
@@ -221,6 +247,10 @@ def take_1d(arr, indexer, out=None, fill_value=np.nan):
     """
     Specialized Cython take which sets NaN values in one pass
     """
+    if isinstance(arr, np.ma.MaskedArray):
+        return take_masked(arr, indexer, axis=0)
+
+    arr = _maybe_cast_to_out(arr, out)
     dtype_str = arr.dtype.name
 
     n = len(indexer)
@@ -230,7 +260,7 @@ def take_1d(arr, indexer, out=None, fill_value=np.nan):
     out_passed = out is not None
     take_f = _take1d_dict.get(dtype_str)
 
-    if dtype_str in ('int32', 'int64', 'bool'):
+    if dtype_str in _take_int_dtypes:
         try:
             if out is None:
                 out = np.empty(n, dtype=arr.dtype)
@@ -248,7 +278,7 @@ def take_1d(arr, indexer, out=None, fill_value=np.nan):
                                     out.dtype)
                 out = _maybe_upcast(out)
                 np.putmask(out, mask, fill_value)
-    elif dtype_str in ('float64', 'object', 'datetime64[ns]'):
+    elif dtype_str in _take_na_dtypes:
         if out is None:
             out = np.empty(n, dtype=arr.dtype)
         take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
@@ -267,11 +297,12 @@ def take_1d(arr, indexer, out=None, fill_value=np.nan):
 
 def take_2d_multi(arr, row_idx, col_idx, fill_value=np.nan, out=None):
 
+    arr = _maybe_cast_to_out(arr, out)
     dtype_str = arr.dtype.name
 
     out_shape = len(row_idx), len(col_idx)
 
-    if dtype_str in ('int32', 'int64', 'bool'):
+    if dtype_str in _take_int_dtypes:
         row_mask = row_idx == -1
         col_mask = col_idx == -1
         needs_masking = row_mask.any() or col_mask.any()
@@ -287,7 +318,7 @@ def take_2d_multi(arr, row_idx, col_idx, fill_value=np.nan, out=None):
                    _ensure_int64(col_idx), out=out,
                    fill_value=fill_value)
             return out
-    elif dtype_str in ('float64', 'object', 'datetime64[ns]'):
+    elif dtype_str in _take_na_dtypes:
         if out is None:
             out = np.empty(out_shape, dtype=arr.dtype)
         take_f = _get_take2d_function(dtype_str, axis='multi')
@@ -307,6 +338,10 @@ def take_2d(arr, indexer, out=None, mask=None, needs_masking=None, axis=0,
     """
     Specialized Cython take which sets NaN values in one pass
     """
+    if isinstance(arr, np.ma.MaskedArray):
+        return take_masked(arr, indexer, axis=axis)
+
+    arr = _maybe_cast_to_out(arr, out)
     dtype_str = arr.dtype.name
 
     out_shape = list(arr.shape)
@@ -316,7 +351,7 @@ def take_2d(arr, indexer, out=None, mask=None, needs_masking=None, axis=0,
     if not isinstance(indexer, np.ndarray):
         indexer = np.array(indexer, dtype=np.int64)
 
-    if dtype_str in ('int32', 'int64', 'bool'):
+    if dtype_str in _take_int_dtypes:
         if mask is None:
             mask = indexer == -1
             needs_masking = mask.any()
@@ -334,7 +369,7 @@ def take_2d(arr, indexer, out=None, mask=None, needs_masking=None, axis=0,
             take_f = _get_take2d_function(dtype_str, axis=axis)
             take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
             return out
-    elif dtype_str in ('float64', 'object', 'datetime64[ns]'):
+    elif dtype_str in _take_na_dtypes:
         if out is None:
             out = np.empty(out_shape, dtype=arr.dtype)
         take_f = _get_take2d_function(dtype_str, axis=axis)
@@ -356,6 +391,39 @@ def take_2d(arr, indexer, out=None, mask=None, needs_masking=None, axis=0,
         return result
 
 
+def take_masked(arr, indexer, axis=0):
+    """
+    Take where -1 in the indexer marks a missing value, returning a
+    numpy.ma.MaskedArray of the input dtype rather than upcasting integer or
+    boolean data to hold NaN. The mask of a masked input is carried along
+
+    Returns
+    -------
+    taken : numpy.ma.MaskedArray
+    """
+    indexer = _ensure_platform_int(indexer)
+    missing = indexer == -1
+
+    # -1 wraps around to the last element, which ends up masked
+    data = np.ma.getdata(arr)
+    if len(indexer) > 0 and data.shape[axis] == 0:
+        data = np.zeros(data.shape[:axis] + (1,) + data.shape[axis + 1:],
+                        dtype=data.dtype)
+    new_data = data.take(indexer, axis=axis)
+
+    shape = [1] * new_data.ndim
+    shape[axis] = len(indexer)
+    new_mask = np.zeros(new_data.shape, dtype=bool)
+    new_mask |= missing.reshape(shape)
+
+    if isinstance(arr, np.ma.MaskedArray) and arr.mask is not np.ma.nomask:
+        old_mask = np.ma.getmaskarray(arr)
+        if old_mask.shape[axis] > 0:
+            new_mask |= old_mask.take(indexer, axis=axis)
+
+    return np.ma.masked_array(new_data, mask=new_mask)
+
+
 def ndtake(arr, indexer, axis=0, out=None):
     return arr.take(_ensure_platform_int(indexer), axis=axis, out=out)
 
@@ -406,6 +474,8 @@ def diff(arr, n, axis=0):
 
 def take_fast(arr, indexer, mask, needs_masking, axis=0, out=None,
               fill_value=np.nan):
+    if isinstance(arr, np.ma.MaskedArray):
+        return take_masked(arr, indexer, axis=axis)
     if arr.ndim == 2:
         return take_2d(arr, indexer, out=out, mask=mask,
                        needs_masking=needs_masking,
@@ -459,7 +529,9 @@ _backfill_2d_datetime = _interp_wrapper(_algos.backfill_2d_inplace_int64,
 
 
 def pad_1d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.pad_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.pad_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _pad_1d_datetime
@@ -475,7 +547,9 @@ def pad_1d(values, limit=None, mask=None):
 
 
 def backfill_1d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.backfill_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.backfill_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _backfill_1d_datetime
@@ -492,7 +566,9 @@ def backfill_1d(values, limit=None, mask=None):
 
 
 def pad_2d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.pad_2d_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.pad_2d_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _pad_2d_datetime
@@ -513,7 +589,9 @@ def pad_2d(values, limit=None, mask=None):
 
 
 def backfill_2d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.backfill_2d_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.backfill_2d_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _backfill_2d_datetime
@@ -561,7 +639,7 @@ def _possibly_cast_item(obj, item, dtype):
     if chunk.values.dtype != dtype:
         if dtype in (np.object_, np.bool_):
             obj[item] = chunk.astype(np.object_)
-        elif not issubclass(dtype, (np.integer, np.bool_)):  # pragma: no cover
+        elif not issubclass(dtype, (np.number, np.bool_)):  # pragma: no cover
             raise ValueError("Unexpected dtype encountered: %s" % dtype)
 
 
@@ -586,11 +664,8 @@ def _is_bool_indexer(key):
     return False
 
 def _default_index(n):
-    from pandas.core.index import Int64Index
-    values = np.arange(n)
-    result = values.view(Int64Index)
-    result.name = None
-    return result
+    from pandas.core.index import RangeIndex
+    return RangeIndex(n)
 
 
 def ensure_float(arr):
@@ -774,6 +849,116 @@ def _shift_indexer(N, periods):
     return indexer
 
 
+def _array_memory_usage(arr, deep=False, seen=None):
+    """
+    Bytes held by an ndarray. Across calls sharing seen, memory of a buffer
+    region already counted (views of the same data, in any order) is counted
+    only once, as is each Python object referenced from an object array
+
+    Parameters
+    ----------
+    arr : ndarray
+    deep : boolean, default False
+        Include the size of the objects referenced by an object array
+    seen : dict, default None
+        Buffer regions (under the 'regions' key), strided views (under
+        'strided') and object ids already counted
+
+    Returns
+    -------
+    nbytes : int
+    """
+    import sys
+
+    if seen is None:
+        seen = {}
+    regions = seen.setdefault('regions', [])
+
+    if isinstance(arr, np.ma.MaskedArray):
+        total = _array_memory_usage(np.ma.getdata(arr), deep=deep, seen=seen)
+        if arr.mask is not np.ma.nomask:
+            total += _array_memory_usage(arr.mask, seen=seen)
+        return total
+
+    total = 0
+    if arr.nbytes > 0:
+        # byte_bounds does not understand datetime64 typestrs
+        if arr.dtype.kind == 'M':
+            arr_bounds = np.asarray(arr).view('i8')
+        else:
+            arr_bounds = arr
+        low, high = np.byte_bounds(arr_bounds)
+        strided = seen.setdefault('strided', {})
+        if arr.flags.c_contiguous or arr.flags.f_contiguous:
+            uncovered = _cover_region(regions, low, high)
+
+            # bytes already counted for strided views inside this region
+            # (seen before their parent) are now part of it
+            for entry in strided.itervalues():
+                view_low, view_high, counted = entry
+                overlap = min(high, view_high) - max(low, view_low)
+                if counted > 0 and overlap > 0:
+                    deduct = min(counted, overlap, uncovered)
+                    entry[2] -= deduct
+                    uncovered -= deduct
+            total += uncovered
+        else:
+            # a strided view only uses part of its bounds, which therefore
+            # are not marked as counted
+            key = (low, high, arr.strides)
+            if key not in strided:
+                uncovered = _cover_region(regions, low, high, mark=False)
+                counted = min(arr.nbytes, uncovered)
+                strided[key] = [low, high, counted]
+                total += counted
+
+    if deep and arr.dtype == np.object_:
+        for obj in np.asarray(arr).ravel():
+            if id(obj) not in seen:
+                seen[id(obj)] = True
+                total += sys.getsizeof(obj)
+
+    return total
+
+
+def _cover_region(regions, low, high, mark=True):
+    """
+    Number of bytes of the buffer region [low, high) not yet in regions, a
+    sorted list of disjoint (low, high) regions. If mark is True the region
+    is merged into regions
+    """
+    covered = 0
+    merged_low, merged_high = low, high
+    untouched = []
+    for region_low, region_high in regions:
+        if region_high < low or region_low > high:
+            untouched.append((region_low, region_high))
+        else:
+            covered += max(min(high, region_high) - max(low, region_low), 0)
+            merged_low = min(merged_low, region_low)
+            merged_high = max(merged_high, region_high)
+
+    if mark:
+        untouched.append((merged_low, merged_high))
+        untouched.sort()
+        regions[:] = untouched
+
+    return (high - low) - covered
+
+
+def _format_nbytes(num):
+    """
+    Human readable size, e.g. 1.5 MB
+    """
+    for unit in ['bytes', 'KB', 'MB', 'GB']:
+        if abs(num) < 1024.0:
+            if unit == 'bytes':
+                return '%d %s' % (num, unit)
+            return '%3.1f %s' % (num, unit)
+        num /= 1024.0
+    return '%3.1f %s' % (num, 'TB')
+
+
 def _asarray_tuplesafe(values, dtype=None):
     from pandas.core.index import Index
 
@@ -930,7 +1115,59 @@ def _all_none(*args):
     return True
 
 
-def save(obj, path):
+_compression_magic = [
+    ('gzip', b'\x1f\x8b'),
+    ('bz2', b'BZh'),
+    ('xz', b'\xfd7zXZ\x00'),
+]
+
+
+def _get_compressed_handle(path, mode, compression):
+    """
+    Open path as a file-like object which compresses (or decompresses) data
+    as it is written (read), so the whole pickle string is never held in
+    memory
+    """
+    if compression is None:
+        return open(path, mode)
+    elif compression == 'gzip':
+        import gzip
+        return gzip.GzipFile(path, mode)
+    elif compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(path, mode)
+    elif compression == 'xz':
+        try:
+            import lzma
+        except ImportError:
+            try:
+                from backports import lzma
+            except ImportError:
+                raise ImportError("xz compression requires the 'lzma' module "
+                                  "(or 'backports.lzma' on Python 2)")
+        return lzma.LZMAFile(path, mode)
+    else:
+        raise ValueError('Unrecognized compression type: %s' % compression)
+
+
+def _infer_compression(path):
+    """
+    Sniff the compression format of path from its leading magic bytes,
+    returning None for an uncompressed file
+    """
+    f = open(path, 'rb')
+    try:
+        head = f.read(6)
+    finally:
+        f.close()
+
+    for compression, magic in _compression_magic:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def save(obj, path, compression=None):
     """
     Pickle (serialize) object to input file path
 
@@ -939,15 +1176,19 @@ def save(obj, path):
     obj : any object
     path : string
         File path
+    compression : {None, 'gzip', 'bz2', 'xz'}, default None
+        Compress the pickle as it is written. The data is streamed through
+        the compressor so the full uncompressed pickle is never built in
+        memory
     """
-    f = open(path, 'wb')
+    f = _get_compressed_handle(path, 'wb', compression)
     try:
         pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
     finally:
         f.close()
 
 
-def load(path):
+def load(path, compression='infer'):
     """
     Load pickled pandas object (or any other pickled object) from the specified
     file path
@@ -956,12 +1197,18 @@ def load(path):
     ----------
     path : string
         File path
+    compression : {'infer', None, 'gzip', 'bz2', 'xz'}, default 'infer'
+        By default the compression (if any) used by save is detected from the
+        file contents
 
     Returns
     -------
     unpickled : type of object stored in file
     """
-    f = open(path, 'rb')
+    if compression == 'infer':
+        compression = _infer_compression(path)
+
+    f = _get_compressed_handle(path, 'rb', compression)
     try:
         return pickle.load(f)
     finally:
@@ -1061,7 +1308,9 @@ def _concat_compat(to_concat, axis=0):
     # filter empty arrays
     to_concat = [x for x in to_concat if x.shape[axis] > 0]
 
-    if all(x.dtype == _NS_DTYPE for x in to_concat):
+    if any(isinstance(x, np.ma.MaskedArray) for x in to_concat):
+        return np.ma.concatenate(to_concat, axis=axis)
+    elif all(x.dtype == _NS_DTYPE for x in to_concat):
         # work around NumPy 1.6 bug
         new_values = np.concatenate([x.view(np.int64) for x in to_concat],
                                     axis=axis)
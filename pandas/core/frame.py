@@ -22,12 +22,14 @@ from numpy import nan as NA
 import numpy as np
 import numpy.ma as ma
 
+from pandas.core.categorical import Categorical
 from pandas.core.common import (isnull, notnull, PandasError, _try_sort,
                                 _default_index, _is_sequence)
-from pandas.core.generic import NDFrame
+from pandas.core.generic import NDFrame, _ItemCache
 from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import _NDFrameIndexer, _maybe_droplevels
-from pandas.core.internals import BlockManager, make_block, form_blocks
+from pandas.core.internals import (BlockManager, make_block, form_blocks,
+                                   get_na_storage, _maskable)
 from pandas.core.series import Series, _radd_compat, _dtype_from_scalar
 from pandas.compat.scipy import scoreatpercentile as _quantile
 from pandas.util import py3compat
@@ -95,6 +97,10 @@ Returns
 
 _doc_exclude_na = "NA/null values are excluded"
 
+# reductions computed block by block for frames with masked blocks
+_block_reductions = {nanops.nansum: 'sum', nanops.nanmean: 'mean',
+                     nanops.nanmin: 'min', nanops.nanmax: 'max'}
+
 _numeric_only_doc = """numeric_only : boolean, default None
     Include only float, int, boolean data. If None, will attempt to use
     everything, then use only numeric data
@@ -376,14 +382,25 @@ class DataFrame(NDFrame):
             mgr = self._init_dict(data, index, columns, dtype=dtype)
         elif isinstance(data, ma.MaskedArray):
             mask = ma.getmaskarray(data)
-            datacopy = ma.copy(data)
-            if issubclass(data.dtype.type, np.datetime64):
-                datacopy[mask] = lib.iNaT
+            if (dtype is None and get_na_storage() == 'mask' and
+                (com.is_integer_dtype(data) or data.dtype == np.bool_)):
+                # keep the dtype, store the mask alongside
+                mgr = self._init_ndarray(ma.getdata(data), index, columns,
+                                         copy=True)
+                blk = mgr.blocks[0]
+                values = ma.masked_array(blk.values,
+                                         mask=_prep_ndarray(mask).T)
+                mgr = BlockManager([make_block(values, blk.items,
+                                               blk.ref_items)], mgr.axes)
             else:
-                datacopy = com._maybe_upcast(datacopy)
-                datacopy[mask] = NA
-            mgr = self._init_ndarray(datacopy, index, columns, dtype=dtype,
-                                     copy=copy)
+                datacopy = ma.copy(data)
+                if issubclass(data.dtype.type, np.datetime64):
+                    datacopy[mask] = lib.iNaT
+                else:
+                    datacopy = com._maybe_upcast(datacopy)
+                    datacopy[mask] = NA
+                mgr = self._init_ndarray(datacopy, index, columns,
+                                         dtype=dtype, copy=copy)
         elif isinstance(data, np.ndarray):
             if data.dtype.names:
                 data_columns, data = _rec_to_dict(data)
@@ -453,7 +470,7 @@ class DataFrame(NDFrame):
             mgr = mgr.copy()
         elif dtype is not None:
             # avoid copy if we can
-            if len(mgr.blocks) > 1 or mgr.blocks[0].values.dtype != dtype:
+            if len(mgr.blocks) > 1 or mgr.blocks[0].dtype != dtype:
                 mgr = mgr.astype(dtype)
         return mgr
 
@@ -1157,7 +1174,8 @@ class DataFrame(NDFrame):
 
         new_blocks = []
         for block in selfsorted._data.blocks:
-            newb = block2d_to_block3d(block.values.T, block.items, shape,
+            values = block.get_values(block.dtype)
+            newb = block2d_to_block3d(values.T, block.items, shape,
                                       major_labels, minor_labels,
                                       ref_items=selfsorted.columns)
             new_blocks.append(newb)
@@ -1176,6 +1194,54 @@ class DataFrame(NDFrame):
 
     to_wide = deprecate('to_wide', to_panel)
 
+    def _get_csvexcel_header(self, cols, header=True, index=True,
+                             index_label=None):
+        """
+        Return the header row written by to_csv / to_excel, or None if no
+        header should be written
+        """
+        has_aliases = isinstance(header, (tuple, list, np.ndarray))
+        if not (has_aliases or header):
+            return None
+
+        if not index:
+            return list(cols)
+
+        # should write something for index label
+        if index_label is not False:
+            if index_label is None:
+                if isinstance(self.index, MultiIndex):
+                    index_label = []
+                    for i, name in enumerate(self.index.names):
+                        if name is None:
+                            name = ''
+                        index_label.append(name)
+                else:
+                    index_label = self.index.name
+                    if index_label is None:
+                        index_label = ['']
+                    else:
+                        index_label = [index_label]
+            elif not isinstance(index_label, (list, tuple, np.ndarray)):
+                # given a string for a DF with Index
+                index_label = [index_label]
+
+            encoded_labels = list(index_label)
+        else:
+            encoded_labels = []
+
+        if has_aliases:
+            if len(header) != len(cols):
+                raise ValueError(('Writing %d cols but got %d aliases'
+                                  % (len(cols), len(header))))
+            else:
+                write_cols = header
+        else:
+            write_cols = cols
+        encoded_cols = list(write_cols)
+
+        return encoded_labels + encoded_cols
+
     def _helper_csvexcel(self, writer, na_rep=None, cols=None,
                          header=True, index=True,
                          index_label=None, float_format=None):
@@ -1186,46 +1252,11 @@ class DataFrame(NDFrame):
         for k, v in self._series.iteritems():
             series[k] = v.values
 
-        has_aliases = isinstance(header, (tuple, list, np.ndarray))
-        if has_aliases or header:
-            if index:
-                # should write something for index label
-                if index_label is not False:
-                    if index_label is None:
-                        if isinstance(self.index, MultiIndex):
-                            index_label = []
-                            for i, name in enumerate(self.index.names):
-                                if name is None:
-                                    name = ''
-                                index_label.append(name)
-                        else:
-                            index_label = self.index.name
-                            if index_label is None:
-                                index_label = ['']
-                            else:
-                                index_label = [index_label]
-                    elif not isinstance(index_label, (list, tuple, np.ndarray)):
-                        # given a string for a DF with Index
-                        index_label = [index_label]
-
-                    encoded_labels = list(index_label)
-                else:
-                    encoded_labels = []
-
-                if has_aliases:
-                    if len(header) != len(cols):
-                        raise ValueError(('Writing %d cols but got %d aliases'
-                                          % (len(cols), len(header))))
-                    else:
-                        write_cols = header
-                else:
-                    write_cols = cols
-                encoded_cols = list(write_cols)
-
-                writer.writerow(encoded_labels + encoded_cols)
-            else:
-                encoded_cols = list(cols)
-                writer.writerow(encoded_cols)
+        header_row = self._get_csvexcel_header(cols, header=header,
+                                               index=index,
+                                               index_label=index_label)
+        if header_row is not None:
+            writer.writerow(header_row)
 
         data_index = self.index
         if isinstance(self.index, PeriodIndex):
@@ -1253,6 +1284,56 @@ class DataFrame(NDFrame):
 
             writer.writerow(row_fields)
 
+    def _helper_excel(self, writer, na_rep='', cols=None, header=True,
+                      index=True, index_label=None, float_format=None,
+                      chunksize=10000, progress=None):
+        """
+        Block-oriented counterpart of _helper_csvexcel: each column is
+        converted to native Excel cell values once, then rows are handed to
+        the writer chunksize at a time
+        """
+        if cols is None:
+            cols = self.columns
+
+        header_row = self._get_csvexcel_header(cols, header=header,
+                                               index=index,
+                                               index_label=index_label)
+        if header_row is not None:
+            writer.writerow(header_row)
+
+        na_value = na_rep
+        if na_value == '':
+            # leave the cell blank
+            na_value = None
+
+        columns = []
+        if index:
+            data_index = self.index
+            if isinstance(data_index, PeriodIndex):
+                data_index = data_index.to_timestamp()
+
+            if isinstance(data_index, MultiIndex):
+                levels = [data_index.get_level_values(i)
+                          for i in range(data_index.nlevels)]
+            else:
+                levels = [data_index]
+
+            for level in levels:
+                columns.append(_excel_cell_values(np.asarray(level),
+                                                  na_value))
+
+        for col in cols:
+            columns.append(_excel_cell_values(self[col].values, na_value,
+                                              float_format=float_format))
+
+        nrows = len(self.index)
+        chunksize = max(int(chunksize), 1)
+        for start in xrange(0, nrows, chunksize):
+            end = min(start + chunksize, nrows)
+            writer.writerows(zip(*[c[start:end] for c in columns]))
+            if progress is not None:
+                progress(end, nrows)
+
     def to_csv(self, path_or_buf, sep=",", na_rep='', float_format=None,
                cols=None, header=True, index=True, index_label=None,
                mode='w', nanRep=None, encoding=None, quoting=None):
@@ -1322,7 +1403,7 @@ class DataFrame(NDFrame):
 
     def to_excel(self, excel_writer, sheet_name='sheet1', na_rep='',
                  float_format=None, cols=None, header=True, index=True,
-                 index_label=None):
+                 index_label=None, chunksize=10000, progress=None):
         """
         Write DataFrame to a excel sheet
 
@@ -1347,6 +1428,11 @@ class DataFrame(NDFrame):
             Column label for index column(s) if desired. If None is given, and
             `header` and `index` are True, then the index names are used. A
             sequence should be given if the DataFrame uses MultiIndex.
+        chunksize : int, default 10000
+            Number of rows handed to the writer at a time
+        progress : function, default None
+            Called as progress(rows_written, total_rows) after each chunk of
+            rows has been written
 
         Notes
         -----
@@ -1364,10 +1450,11 @@ class DataFrame(NDFrame):
             excel_writer = ExcelWriter(excel_writer)
             need_save = True
         excel_writer.cur_sheet = sheet_name
-        self._helper_csvexcel(excel_writer, na_rep=na_rep,
-                              float_format=float_format, cols=cols,
-                              header=header, index=index,
-                              index_label=index_label)
+        self._helper_excel(excel_writer, na_rep=na_rep,
+                           float_format=float_format, cols=cols,
+                           header=header, index=index,
+                           index_label=index_label, chunksize=chunksize,
+                           progress=progress)
         if need_save:
             excel_writer.save()
 
@@ -1471,7 +1558,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=True, buf=None):
+    def info(self, verbose=True, buf=None, memory_usage=True):
         """
         Concise summary of a DataFrame, used in __repr__ when very large.
 
@@ -1480,6 +1567,9 @@ class DataFrame(NDFrame):
         verbose : boolean, default True
             If False, don't print column count summary
         buf : writable buffer, defaults to sys.stdout
+        memory_usage : boolean or 'deep', default True
+            Report the memory held by the data and index. 'deep' includes the
+            size of Python objects in object columns, which is slower
         """
         from pandas.core.format import _put_lines
 
@@ -1516,6 +1606,9 @@ class DataFrame(NDFrame):
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(counts.iteritems())]
         lines.append('dtypes: %s' % ', '.join(dtypes))
+        if memory_usage:
+            nbytes = self.memory_usage(deep=memory_usage == 'deep')
+            lines.append('memory usage: %s' % com._format_nbytes(nbytes))
         _put_lines(buf, lines)
 
     @property
@@ -1577,7 +1670,7 @@ class DataFrame(NDFrame):
             If the DataFrame is heterogeneous and contains booleans or objects,
             the result will be of dtype=object
         """
-        self._consolidate_inplace()
+        self._consolidate_for_values()
         return self._data.as_matrix(columns).T
 
     values = property(fget=as_matrix)
@@ -1626,7 +1719,7 @@ class DataFrame(NDFrame):
             self._unpickle_matrix_compat(state)
 
         # ordinarily created in NDFrame
-        self._item_cache = {}
+        self._item_cache = _ItemCache()
 
     # legacy pickle formats
     def _unpickle_frame_compat(self, state):  # pragma: no cover
@@ -1707,6 +1800,9 @@ class DataFrame(NDFrame):
             otherwise a new object
         """
         try:
+            # the values of a categorical item are a decoded copy
+            if col in self.columns and self._data.decategorize([col]):
+                self._clear_item_cache()
             series = self._get_item_cache(col)
             engine = self.index._engine
             engine.set_value(series, index, value)
@@ -2006,7 +2102,13 @@ class DataFrame(NDFrame):
     def _sanitize_column(self, key, value):
         # Need to make sure new columns (which go into the BlockManager as new
         # blocks) are always copied
-        if _is_sequence(value):
+        if isinstance(value, Categorical):
+            # stored as codes, copied when the block is made
+            if len(value) != len(self.index):
+                raise AssertionError('Length of values does not match '
+                                     'length of index')
+            return value
+        elif _is_sequence(value):
             is_frame = isinstance(value, DataFrame)
             if isinstance(value, Series) or is_frame:
                 if value.index.equals(self.index):
@@ -2152,7 +2254,8 @@ class DataFrame(NDFrame):
                 data = data.copy()
             return data
 
-        self._consolidate_inplace()
+        # a view can only be taken of consolidated data
+        self._consolidate_inplace(force=not copy)
 
         index = self.index
         if isinstance(index, MultiIndex):
@@ -2917,6 +3020,37 @@ class DataFrame(NDFrame):
         duplicated = lib.duplicated(keys, take_last=take_last)
         return Series(duplicated, index=self.index)
 
+    def isin(self, values):
+        """
+        Return boolean DataFrame showing whether each element in the
+        DataFrame is contained in the passed values
+
+        Parameters
+        ----------
+        values : sequence or dict
+            With a dict, each column is checked against the values stored
+            under its label; columns missing from the dict are all False
+
+        Returns
+        -------
+        isin : DataFrame (boolean dtype)
+        """
+        if not isinstance(values, dict):
+            # iterators would be consumed by the first column
+            values = list(values)
+
+        result = np.zeros(self.shape, dtype=bool)
+        for i, col in enumerate(self.columns):
+            if isinstance(values, dict):
+                if col not in values:
+                    continue
+                col_values = values[col]
+            else:
+                col_values = values
+            result[:, i] = algos.isin(self.icol(i).values, col_values)
+
+        return DataFrame(result, index=self.index, columns=self.columns)
+
     #----------------------------------------------------------------------
     # Sorting
 
@@ -3839,7 +3973,15 @@ class DataFrame(NDFrame):
             offset = datetools.to_offset(offset)
 
         def _shift_block(blk, indexer):
-            new_values = blk.values.take(indexer, axis=1)
+            if _maskable(blk):
+                new_values = np.ma.asarray(blk.values).take(indexer, axis=1)
+                if periods > 0:
+                    new_values[:, :periods] = np.ma.masked
+                else:
+                    new_values[:, periods:] = np.ma.masked
+                return make_block(new_values, blk.items, blk.ref_items)
+
+            new_values = blk.get_values(blk.dtype).take(indexer, axis=1)
             # convert integer to float if necessary. need to do a lot more than
             # that, handle boolean etc also
             new_values = com._maybe_upcast(new_values)
@@ -4425,6 +4567,10 @@ class DataFrame(NDFrame):
             if axis == 1:
                 counts = notnull(frame.values).sum(1)
                 result = Series(counts, index=frame._get_agg_axis(axis))
+            elif frame.columns.is_unique:
+                # per block, using the masks of masked blocks
+                counts = frame._data.notnull_counts()
+                result = Series(counts, index=frame._get_agg_axis(axis))
             else:
                 result = DataFrame.apply(frame, Series.count, axis=axis)
 
@@ -4648,6 +4794,14 @@ class DataFrame(NDFrame):
                 filter_type=None, **kwds):
         f = lambda x: op(x, axis=axis, skipna=skipna, **kwds)
         labels = self._get_agg_axis(axis)
+
+        name = _block_reductions.get(op)
+        if (name is not None and axis == 0 and skipna and not kwds and
+                len(self.index) > 0 and self.columns.is_unique and
+                self._data.is_masked_numeric()):
+            # per block, using the masks of masked blocks, so that integer
+            # columns are not upcast to float64
+            return Series(self._data.reduce_blocks(name), index=labels)
         if numeric_only is None:
             try:
                 values = self.values
@@ -5143,7 +5297,7 @@ def extract_index(data):
             elif isinstance(v, dict):
                 have_dicts = True
                 indexes.append(v.keys())
-            elif isinstance(v, (list, tuple, np.ndarray)):
+            elif isinstance(v, (list, tuple, np.ndarray, Categorical)):
                 have_raw_arrays = True
                 raw_lengths.append(len(v))
 
@@ -5334,7 +5488,12 @@ def _homogenize(data, index, dtype=None):
     homogenized = []
 
     for v in data:
-        if isinstance(v, Series):
+        if isinstance(v, Categorical):
+            # kept as codes by form_blocks
+            if len(v) != len(index):
+                raise ValueError('Categorical length %d does not match index '
+                                 'length %d' % (len(v), len(index)))
+        elif isinstance(v, Series):
             if dtype is not None:
                 v = v.astype(dtype)
             if v.index is not index:
@@ -5363,6 +5522,48 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _excel_cell_values(values, na_value=None, float_format=None):
+    """
+    Convert an array to a list of values the Excel writers accept directly
+    (Python numbers, bools, datetimes and strings), dispatching on the dtype
+    once for the whole column rather than per cell. Missing values become
+    na_value, None leaving the cell blank
+    """
+    if com.is_float_dtype(values):
+        mask = isnull(values)
+        if float_format is not None:
+            result = [float_format % v for v in values]
+        else:
+            result = values.tolist()
+    elif com.is_integer_dtype(values) or values.dtype == np.bool_:
+        return values.tolist()
+    elif com.is_datetime64_dtype(values):
+        mask = isnull(values)
+        stamps = values.view('i8')
+        if mask.any():
+            stamps = stamps.copy()
+            stamps[mask] = 0
+        result = list(lib.ints_to_pydatetime(stamps))
+    else:
+        mask = isnull(values)
+        result = [_excel_cell_value(v, float_format) for v in values]
+
+    if mask.any():
+        for i in mask.nonzero()[0]:
+            result[i] = na_value
+    return result
+
+
+def _excel_cell_value(val, float_format=None):
+    if float_format is not None and com.is_float(val):
+        return float_format % val
+    elif isinstance(val, np.datetime64):
+        return lib.Timestamp(val)
+    elif isinstance(val, (np.integer, np.bool_)):
+        return val.item()
+    return val
+
+
 def install_ipython_completers():  # pragma: no cover
     """Register the DataFrame type with IPython's tab completion machinery, so
     that it knows about accessing column names as attributes."""
@@ -1,5 +1,6 @@
 # pylint: disable=W0231,E1101
 from datetime import timedelta
+import weakref
 
 import numpy as np
 
@@ -24,12 +25,12 @@ class PandasObject(object):
     _AXIS_ALIASES = {}
     _AXIS_NAMES = dict((v, k) for k, v in _AXIS_NUMBERS.iteritems())
 
-    def save(self, path):
-        com.save(self, path)
+    def save(self, path, compression=None):
+        com.save(self, path, compression=compression)
 
     @classmethod
-    def load(cls, path):
-        return com.load(path)
+    def load(cls, path, compression='infer'):
+        return com.load(path, compression=compression)
 
     #----------------------------------------------------------------------
     # Axis name business
@@ -458,6 +459,163 @@ class PandasObject(object):
         return rs
 
 
+#----------------------------------------------------------------------
+# Item cache
+
+_item_cache_policy = {
+    'maxsize': 1000
+}
+
+_item_cache_stats = {
+    'hits': 0,
+    'weak_hits': 0,
+    'misses': 0,
+    'evictions': 0
+}
+
+
+def set_item_cache_size(maxsize):
+    """
+    Set the maximum number of boxed items (e.g. the Series for each accessed
+    DataFrame column) each object keeps cached. Least recently used items
+    beyond the limit are evicted; an evicted item is still returned from the
+    cache as long as something else holds a reference to it.
+
+    Parameters
+    ----------
+    maxsize : int or None
+        None means unbounded
+    """
+    if maxsize is not None:
+        maxsize = int(maxsize)
+        if maxsize < 0:
+            raise ValueError('maxsize must be non-negative, got %d' % maxsize)
+    _item_cache_policy['maxsize'] = maxsize
+
+
+def get_item_cache_size():
+    return _item_cache_policy['maxsize']
+
+
+def get_item_cache_stats():
+    """
+    Counters for item cache lookups since the last reset
+
+    Returns
+    -------
+    stats : dict
+        hits : lookups answered from the cache, including weak_hits
+        weak_hits : lookups answered by an evicted item still alive elsewhere
+        misses : lookups which had to box the item again
+        evictions : items dropped to stay within the cache size
+    """
+    return dict(_item_cache_stats)
+
+
+def reset_item_cache_stats():
+    for key in _item_cache_stats:
+        _item_cache_stats[key] = 0
+
+
+class _ItemCache(object):
+    """
+    Least-recently-used mapping of item -> boxed item values, keeping at most
+    get_item_cache_size() strong references. Evicted values are remembered
+    through weak references so that an item the user still holds is not
+    boxed a second time
+    """
+
+    def __init__(self):
+        self._map = {}
+        self._weak = weakref.WeakValueDictionary()
+
+        # circular doubly linked list of [prev, next, key, value] links in
+        # order of use, oldest first
+        self._root = root = []
+        root[:] = [root, root, None, None]
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __getitem__(self, key):
+        link = self._map.get(key)
+        if link is not None:
+            self._move_to_end(link)
+            _item_cache_stats['hits'] += 1
+            return link[3]
+
+        value = self._weak.get(key)
+        if value is not None:
+            _item_cache_stats['hits'] += 1
+            _item_cache_stats['weak_hits'] += 1
+            self[key] = value
+            return value
+
+        _item_cache_stats['misses'] += 1
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        link = self._map.get(key)
+        if link is not None:
+            link[3] = value
+            self._move_to_end(link)
+            return
+
+        root = self._root
+        last = root[0]
+        link = [last, root, key, value]
+        last[1] = root[0] = self._map[key] = link
+        self._weak.pop(key, None)
+
+        maxsize = _item_cache_policy['maxsize']
+        if maxsize is not None:
+            while len(self._map) > maxsize:
+                self._evict_oldest()
+
+    def __delitem__(self, key):
+        link = self._map.pop(key, None)
+        in_weak = self._weak.pop(key, None) is not None
+        if link is None:
+            if not in_weak:
+                raise KeyError(key)
+        else:
+            self._unlink(link)
+
+    def clear(self):
+        self._map.clear()
+        self._weak.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
+
+    def _unlink(self, link):
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+
+    def _move_to_end(self, link):
+        self._unlink(link)
+        root = self._root
+        last = root[0]
+        link[0] = last
+        link[1] = root
+        last[1] = root[0] = link
+
+    def _evict_oldest(self):
+        link = self._root[1]
+        self._unlink(link)
+        key, value = link[2], link[3]
+        del self._map[key]
+        try:
+            self._weak[key] = value
+        except TypeError:
+            # value type does not support weak references
+            pass
+        _item_cache_stats['evictions'] += 1
+
+
 class NDFrame(PandasObject):
     """
     N-dimensional analogue of DataFrame. Store multi-dimensional in a
@@ -483,7 +641,7 @@ class NDFrame(PandasObject):
                 data = data.reindex_axis(ax, axis=i)
 
         object.__setattr__(self, '_data', data)
-        object.__setattr__(self, '_item_cache', {})
+        object.__setattr__(self, '_item_cache', _ItemCache())
 
     def astype(self, dtype):
         """
@@ -601,9 +759,20 @@ class NDFrame(PandasObject):
     #----------------------------------------------------------------------
     # Consolidation of internals
 
-    def _consolidate_inplace(self):
-        self._clear_item_cache()
-        self._data = self._data.consolidate()
+    def _consolidate_inplace(self, force=False):
+        """
+        Implicit consolidation done before operations that prefer
+        consolidated data, subject to the consolidation policy (see
+        set_consolidation_policy) unless force=True
+        """
+        if force:
+            new_data = self._data.consolidate()
+        else:
+            new_data = self._data._maybe_consolidate()
+
+        if new_data is not self._data:
+            self._clear_item_cache()
+            self._data = new_data
 
     def consolidate(self, inplace=False):
         """
@@ -621,7 +790,7 @@ class NDFrame(PandasObject):
         consolidated : type of caller
         """
         if inplace:
-            self._consolidate_inplace()
+            self._consolidate_inplace(force=True)
             return self
         else:
             cons_data = self._data.consolidate()
@@ -629,10 +798,36 @@ class NDFrame(PandasObject):
                 cons_data = cons_data.copy()
             return self._constructor(cons_data)
 
+    def memory_usage(self, deep=False, index=True):
+        """
+        Bytes held by the object's data. Memory shared between columns or
+        with the axes (views) is counted once
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Include the size of the Python objects referenced from object
+            dtype data and axes, rather than only the pointers to them
+        index : boolean, default True
+            Include the axis labels
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return self._data.memory_usage(deep=deep, axes=index)
+
     @property
     def _is_mixed_type(self):
         self._consolidate_inplace()
-        return len(self._data.blocks) > 1
+        return self._data.is_mixed_type
+
+    def _consolidate_for_values(self):
+        """
+        The values of single-dtype data must be a view to be modified in
+        place, which needs a consolidated manager regardless of the policy
+        """
+        self._consolidate_inplace(force=not self._data.is_mixed_type)
 
     def _reindex_axis(self, new_index, fill_method, axis, copy):
         new_data = self._data.reindex_axis(new_index, axis=axis,
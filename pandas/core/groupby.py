@@ -13,6 +13,7 @@ from pandas.util.decorators import cache_readonly, Appender
 import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.lib as lib
+import pandas._algos as _algos
 
 
 class GroupByError(Exception):
@@ -58,6 +59,10 @@ def _first_compat(x, axis=0):
         return _first(x)
 
 
+def _count_compat(x, axis=0):
+    return com.notnull(x).sum(axis)
+
+
 def _last_compat(x, axis=0):
     def _last(x):
         x = np.asarray(x)
@@ -244,6 +249,38 @@ class GroupBy(object):
         inds = self.indices[name]
         return obj.take(inds, axis=self.axis)
 
+    def reuse_on(self, obj):
+        """
+        Group another object indexed like the grouped one by the same keys.
+        The group labels, sort order and result index computed by this
+        GroupBy are shared, so the keys are not factorized again
+
+        Parameters
+        ----------
+        obj : Series or DataFrame
+            Must have the same axis as the grouped object
+
+        Example
+        -------
+        >>> grouped = df.groupby(['A', 'B'])
+        >>> grouped.reuse_on(df2).sum()
+
+        Returns
+        -------
+        grouped : GroupBy
+        """
+        if not self.grouper.is_indexed_like(obj._get_axis(self.axis)):
+            raise ValueError('obj must be indexed like the grouped object')
+
+        kwds = dict(axis=self.axis, grouper=self.grouper, sort=self.sort,
+                    group_keys=self.group_keys)
+        if isinstance(obj, DataFrame):
+            kwds['exclusions'] = [x for x in self.exclusions
+                                  if x in obj.columns]
+            kwds['as_index'] = self.as_index
+
+        return groupby(obj, self.keys, **kwds)
+
     def __iter__(self):
         """
         Groupby iterator
@@ -279,10 +316,19 @@ class GroupBy(object):
         Parameters
         ----------
         func : function
+        n_jobs : int, default None
+            Number of workers to run func in. The groups are split into
+            n_jobs contiguous partitions; each worker receives its partition
+            once and the results are combined in group order. -1 uses one
+            worker per CPU, None or 1 applies func in the calling thread
+        backend : {'process', 'thread'}, default 'process'
+            Kind of worker pool used when n_jobs > 1. With 'process', func,
+            its arguments and its results must be picklable
 
         Notes
         -----
-        See online documentation for full exposition on how to use apply
+        See online documentation for full exposition on how to use apply.
+        The n_jobs and backend keywords are not passed on to func
 
         See also
         --------
@@ -394,12 +440,119 @@ class GroupBy(object):
                 return np.nan
         return self.agg(picker)
 
+    def cumsum(self):
+        """
+        Cumulative sum of each group, excluding missing values, indexed like
+        the grouped object
+        """
+        return self._transform_or_wrap('cumsum')
+
+    def cumprod(self):
+        """
+        Cumulative product of each group, excluding missing values, indexed
+        like the grouped object
+        """
+        return self._transform_or_wrap('cumprod')
+
+    def cummin(self):
+        """
+        Cumulative minimum of each group, excluding missing values, indexed
+        like the grouped object
+        """
+        return self._transform_or_wrap('cummin')
+
+    def cummax(self):
+        """
+        Cumulative maximum of each group, excluding missing values, indexed
+        like the grouped object
+        """
+        return self._transform_or_wrap('cummax')
+
+    def shift(self, periods=1, freq=None):
+        """
+        Shift the values of each group by the desired number of periods,
+        indexed like the grouped object. With freq, the index of each group
+        is shifted instead, see Series.shift
+        """
+        if freq is not None:
+            return self._make_wrapper('shift')(periods, freq=freq)
+        return self._transform_or_wrap('shift', periods=periods)
+
+    def diff(self, periods=1):
+        """
+        1st discrete difference of the values of each group, indexed like
+        the grouped object
+        """
+        return self._transform_or_wrap('diff', periods=periods)
+
+    def rank(self, method='average', ascending=True):
+        """
+        Rank of the values (1 through n) within each group, indexed like the
+        grouped object. Missing values get a NaN rank
+
+        Parameters
+        ----------
+        method : {'average', 'min', 'max', 'first'}
+            How to rank equal values, see Series.rank
+        ascending : boolean, default True
+        """
+        return self._transform_or_wrap('rank', method=method,
+                                       ascending=ascending)
+
+    def cumcount(self):
+        """
+        Number each item in each group from 0 to the length of that group - 1,
+        as a Series indexed like the grouped object
+        """
+        if self.axis != 0 or isinstance(self.grouper, BinGrouper):
+            raise NotImplementedError
+
+        comp_ids, _, ngroups = self.grouper.group_info
+        result = lib.group_cumcount(comp_ids, ngroups)
+        if (comp_ids < 0).any():
+            result = result.astype(np.float64)
+            result[comp_ids < 0] = np.nan
+        return Series(result, index=self.obj.index)
+
+    def _transform_or_wrap(self, how, **kwargs):
+        try:
+            return self._cython_transform(how, **kwargs)
+        except Exception:
+            return self._make_wrapper(how)(**kwargs)
+
+    def _cython_transform(self, how, **kwargs):
+        if self.axis != 0 or isinstance(self.grouper, BinGrouper):
+            raise NotImplementedError
+
+        comp_ids, _, ngroups = self.grouper.group_info
+
+        output = {}
+        names = []
+        for name, obj in self._iterate_slices():
+            if how != 'shift' and not _is_numeric_dtype(obj.dtype):
+                continue
+
+            output[name] = _transform_values(obj.values, how, comp_ids,
+                                             ngroups, **kwargs)
+            names.append(name)
+
+        if len(output) == 0:
+            raise DataError('No numeric types to transform')
+
+        return self._wrap_transformed_output(output, names)
+
+    def _wrap_transformed_output(self, output, names):
+        raise NotImplementedError
+
     def _cython_agg_general(self, how, numeric_only=True):
         output = {}
         for name, obj in self._iterate_slices():
             is_numeric = _is_numeric_dtype(obj.dtype)
             if numeric_only and not is_numeric:
-                continue
+                # timestamps have an order, so min / max are well defined
+                if not (com.is_datetime64_dtype(obj.dtype) and
+                        how in ('min', 'max')):
+                    continue
 
             result, names = self.grouper.aggregate(obj.values, how)
             output[name] = result
@@ -433,28 +586,63 @@ class GroupBy(object):
         return self._wrap_aggregated_output(output)
 
     def _python_apply_general(self, func, *args, **kwargs):
+        n_jobs = kwargs.pop('n_jobs', None)
+        backend = kwargs.pop('backend', 'process')
         func = _intercept_function(func)
 
-        result_keys = []
-        result_values = []
+        if n_jobs is not None and n_jobs != 1:
+            result_keys, result_values, not_indexed_same = \
+                self._apply_parallel(func, args, kwargs, n_jobs, backend)
+        else:
+            result_keys, result_values, not_indexed_same = \
+                _apply_groups((func, self, args, kwargs))
 
-        not_indexed_same = False
-        for key, group in self:
-            object.__setattr__(group, 'name', key)
+        return self._wrap_applied_output(result_keys, result_values,
+                                         not_indexed_same=not_indexed_same)
 
-            # group might be modified
-            group_axes = _get_axes(group)
+    def _apply_parallel(self, func, args, kwargs, n_jobs, backend):
+        """
+        Apply func to contiguous partitions of the groups in a pool of n_jobs
+        workers, returning keys, results and the not_indexed_same flag in
+        group order
+        """
+        if backend == 'process':
+            from multiprocessing import Pool as pool_klass
+        elif backend == 'thread':
+            from multiprocessing.pool import ThreadPool as pool_klass
+        else:
+            raise ValueError("backend must be 'process' or 'thread', got %r"
+                             % backend)
 
-            res = func(group, *args, **kwargs)
+        if n_jobs < 0:
+            from multiprocessing import cpu_count
+            n_jobs = max(cpu_count() + 1 + n_jobs, 1)
 
-            if not _is_indexed_like(res, group_axes):
-                not_indexed_same = True
+        pairs = list(self)
+        n_jobs = min(n_jobs, len(pairs))
+        if n_jobs <= 1:
+            return _apply_groups((func, pairs, args, kwargs))
 
-            result_keys.append(key)
-            result_values.append(res)
+        bounds = np.linspace(0, len(pairs), n_jobs + 1).astype(int)
+        tasks = [(func, pairs[start:end], args, kwargs)
+                 for start, end in zip(bounds[:-1], bounds[1:])]
 
-        return self._wrap_applied_output(result_keys, result_values,
-                                         not_indexed_same=not_indexed_same)
+        pool = pool_klass(n_jobs)
+        try:
+            parts = pool.map(_apply_groups, tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+        keys = []
+        values = []
+        not_indexed_same = False
+        for part_keys, part_values, part_flag in parts:
+            keys.extend(part_keys)
+            values.extend(part_values)
+            not_indexed_same = not_indexed_same or part_flag
+
+        return keys, values, not_indexed_same
 
     def _wrap_applied_output(self, *args, **kwargs):
         raise NotImplementedError
@@ -482,7 +670,7 @@ class GroupBy(object):
         return result
 
 
-def _generate_groups(obj, group_index, ngroups, axis=0):
+def _generate_groups(obj, group_index, ngroups, axis=0, indexer=None):
     if isinstance(obj, NDFrame) and not isinstance(obj, DataFrame):
         factory = obj._constructor
         obj = obj._data
@@ -490,7 +678,7 @@ def _generate_groups(obj, group_index, ngroups, axis=0):
         factory = None
 
     return generate_groups(obj, group_index, ngroups,
-                           axis=axis, factory=factory)
+                           axis=axis, factory=factory, indexer=indexer)
 
 
 @Appender(GroupBy.__doc__)
@@ -505,6 +693,34 @@ def groupby(obj, by, **kwds):
     return klass(obj, by, **kwds)
 
 
+def _apply_groups(task):
+    """
+    Apply func to each group of an iterable of (key, group) pairs, returning
+    the keys, the results and whether any result is not indexed like its
+    group. Takes a single tuple so that it can be mapped over a worker pool
+    """
+    func, pairs, args, kwargs = task
+
+    keys = []
+    results = []
+    not_indexed_same = False
+    for key, group in pairs:
+        object.__setattr__(group, 'name', key)
+
+        # group might be modified
+        group_axes = _get_axes(group)
+
+        res = func(group, *args, **kwargs)
+
+        if not _is_indexed_like(res, group_axes):
+            not_indexed_same = True
+
+        keys.append(key)
+        results.append(res)
+
+    return keys, results, not_indexed_same
+
+
 def _get_axes(group):
     if isinstance(group, Series):
         return [group.index]
@@ -523,6 +739,34 @@ def _is_indexed_like(obj, axes):
     return False
 
 
+def _nth_kernel(f, rank):
+    return lambda a, b, c, d: f(a, b, c, d, rank)
+
+
+def _get_typed_functions(bins=False):
+    """
+    Look up the generated kernels which aggregate int32, int64, float32 and
+    datetime64 values without casting them to float64
+    """
+    infix = '_bin' if bins else ''
+    ordered = ['float32', 'int32', 'int64', 'datetime64']
+
+    table = {}
+    for how, name, dtypes in [('add', 'add', ['float32', 'int64']),
+                              ('min', 'min', ordered),
+                              ('max', 'max', ordered),
+                              ('first', 'nth', ordered),
+                              ('last', 'last', ordered),
+                              ('count', 'count', ['float64'] + ordered +
+                               ['object'])]:
+        for dtype in dtypes:
+            f = getattr(_algos, 'group_%s%s_%s' % (name, infix, dtype))
+            if how == 'first':
+                f = _nth_kernel(f, 1)
+            table[how, dtype] = f
+    return table
+
+
 class Grouper(object):
     """
 
@@ -574,7 +818,8 @@ class Grouper(object):
             mapper = _KeyMapper(comp_ids, ngroups, label_list, level_list)
 
             for label, group in _generate_groups(data, comp_ids, ngroups,
-                                                 axis=axis):
+                                                 axis=axis,
+                                                 indexer=self._sort_idx):
                 key = mapper.get_key(label)
                 yield key, group
 
@@ -641,7 +886,8 @@ class Grouper(object):
         else:
             if len(all_labels) > 1:
                 group_index = get_group_index(all_labels, self.shape)
-                comp_ids, obs_group_ids = _compress_group_index(group_index)
+                comp_ids, obs_group_ids = _compress_group_index(group_index,
+                                                                sort=self.sort)
             else:
                 ping = self.groupings[0]
                 comp_ids = ping.labels
@@ -651,6 +897,19 @@ class Grouper(object):
 
             return comp_ids, obs_group_ids
 
+    @cache_readonly
+    def _sort_idx(self):
+        # stable order of the rows by group id, reused by every aggregation
+        comp_ids, _, ngroups = self.group_info
+        return lib.groupsort_indexer(comp_ids, ngroups)[0]
+
+    def is_indexed_like(self, axis):
+        """
+        Whether this grouper can group an object with the given axis, i.e.
+        the axis is the one it was built from
+        """
+        return axis is self.axis or axis.equals(self.axis)
+
     @cache_readonly
     def _overflow_possible(self):
         return _int64_overflow_possible(self.shape)
@@ -661,9 +920,45 @@ class Grouper(object):
 
     @cache_readonly
     def result_index(self):
+        if (not self.sort and len(self.groupings) > 1 and
+                not self._overflow_possible):
+            return self._get_unsorted_result_index()
+
         recons = self.get_group_levels()
         return MultiIndex.from_arrays(recons, names=self.names)
 
+    def _get_unsorted_result_index(self):
+        # the keys are hashed once by the groupings; build the MultiIndex
+        # from their uniques instead of factorizing the reconstructed keys
+        # again. The levels are sorted (only the uniques, and the labels
+        # remapped) so that sortlevel / unstack behave as with sort=True,
+        # while the rows stay in order of appearance
+        obs_ids = self.group_info[1]
+        recons_labels = decons_group_index(obs_ids, self.shape)
+
+        levels = []
+        labels = []
+        for ping, labs in zip(self.groupings, recons_labels):
+            labs = com._ensure_int64(labs)
+            level = ping.group_index
+
+            observed = np.bincount(labs, minlength=len(level)) > 0
+            if not observed.all():
+                level = level[observed]
+                labs = com.ndtake(observed.cumsum() - 1, labs)
+
+            sorter = level.argsort()
+            if not (np.diff(sorter) == 1).all():
+                reverse_indexer = np.empty(len(sorter), dtype=np.int64)
+                reverse_indexer.put(sorter, np.arange(len(sorter)))
+                level = level.take(sorter)
+                labs = com.ndtake(reverse_indexer, labs)
+
+            levels.append(level)
+            labels.append(labs)
+
+        return MultiIndex(levels=levels, labels=labels, names=self.names)
+
     def get_group_levels(self):
         obs_ids = self.group_info[1]
 
@@ -703,6 +998,9 @@ class Grouper(object):
         'last': lib.group_last_object
     }
 
+    # kernels which keep the dtype of the values, keyed by (how, dtype)
+    _cython_typed_functions = _get_typed_functions(bins=False)
+
     _cython_transforms = {
         'std': np.sqrt
     }
@@ -732,32 +1030,36 @@ class Grouper(object):
                 raise NotImplementedError
             out_shape = (self.ngroups,) + values.shape[1:]
 
-        if _is_numeric_dtype(values.dtype):
-            values = com.ensure_float(values)
-            is_numeric = True
-        else:
-            if issubclass(values.dtype.type, np.datetime64):
-                raise Exception('Cython not able to handle this case')
-
-            values = values.astype(object)
-            is_numeric = False
+        values, kind = self._convert_values(values, how)
+        is_numeric = kind != 'object'
 
         # will be filled in Cython function
-        result = np.empty(out_shape, dtype=values.dtype)
+        if how == 'count':
+            result = np.empty(out_shape, dtype=np.int64)
+        else:
+            result = np.empty(out_shape, dtype=values.dtype)
         counts = np.zeros(self.ngroups, dtype=np.int64)
 
-        result = self._aggregate(result, counts, values, how, is_numeric)
+        result = self._aggregate(result, counts, values, how, is_numeric,
+                                 kind=kind)
 
         if self._filter_empty_groups:
-            if result.ndim == 2:
-                if is_numeric:
-                    result = lib.row_bool_subset(result,
-                                                 (counts > 0).view(np.uint8))
-                else:
-                    result = lib.row_bool_subset_object(result,
-                                 (counts > 0).view(np.uint8))
+            if result.ndim == 2 and result.dtype == np.float64:
+                result = lib.row_bool_subset(result,
+                                             (counts > 0).view(np.uint8))
+            elif result.ndim == 2 and result.dtype == np.object_:
+                result = lib.row_bool_subset_object(result,
+                             (counts > 0).view(np.uint8))
             else:
                 result = result[counts > 0]
+        elif (how != 'count' and com.is_integer_dtype(result) and
+              kind != 'datetime64' and (counts == 0).any()):
+            # integers have no NA value for the empty groups
+            result = result.astype(np.float64)
+            result[counts == 0] = np.nan
+
+        if kind == 'datetime64' and how != 'count':
+            result = result.view('M8[ns]')
 
         if vdim == 1 and arity == 1:
             result = result[:, 0]
@@ -773,11 +1075,51 @@ class Grouper(object):
 
         return result, names
 
-    def _aggregate(self, result, counts, values, how, is_numeric):
-        if not is_numeric:
-            agg_func = self._cython_object_functions[how]
+    def _convert_values(self, values, how):
+        """
+        Cast values for the Cython kernel used to compute `how`
+
+        Returns
+        -------
+        (values, kind) : kind names the dtype of the kernel and is one of
+            the dtypes of _cython_typed_functions, 'float64' or 'object'
+        """
+        typed = self._cython_typed_functions
+        dtype = values.dtype
+
+        if com.is_datetime64_dtype(dtype):
+            if (how, 'datetime64') not in typed:
+                raise Exception('Cython not able to handle this case')
+            return values.view('i8'), 'datetime64'
+
+        if com.is_integer_dtype(dtype) and dtype.kind == 'i':
+            # sums accumulate in 64 bits, like np.sum
+            if how == 'add' or dtype.itemsize > 4:
+                kind = 'int64'
+            else:
+                kind = 'int32'
+
+            if (how, kind) in typed:
+                return values.astype(kind), kind
+        elif dtype == np.float32 and (how, 'float32') in typed:
+            return values, 'float32'
+
+        if _is_numeric_dtype(dtype):
+            return com.ensure_float(values), 'float64'
+
+        return values.astype(object), 'object'
+
+    def _get_aggregate_function(self, how, is_numeric, kind):
+        if (how, kind) in self._cython_typed_functions:
+            return self._cython_typed_functions[how, kind]
+        elif not is_numeric:
+            return self._cython_object_functions[how]
         else:
-            agg_func = self._cython_functions[how]
+            return self._cython_functions[how]
+
+    def _aggregate(self, result, counts, values, how, is_numeric,
+                   kind='float64'):
+        agg_func = self._get_aggregate_function(how, is_numeric, kind)
 
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
@@ -794,6 +1136,64 @@ class Grouper(object):
 
         return trans_func(result)
 
+    def aggregate_stats(self, values, stats):
+        """
+        Compute several statistics of 1-d float64 values in one pass
+
+        Parameters
+        ----------
+        values : ndarray (float64)
+        stats : sequence of names in _fused_stats
+
+        Returns
+        -------
+        results : dict of {stat : ndarray}
+        """
+        out = np.empty((self.ngroups, 7), dtype=np.float64)
+        counts = np.zeros(self.ngroups, dtype=np.int64)
+
+        self._aggregate_stats(out, counts, com._ensure_float64(values))
+
+        nobs, sumx, sumxx, minx, maxx, first, last = out.T
+        empty = nobs == 0
+        for arr in (sumx, minx, maxx):
+            arr[empty] = np.nan
+
+        results = {}
+        for stat in stats:
+            if stat == 'count':
+                res = nobs.astype(np.int64)
+            elif stat == 'sum':
+                res = sumx
+            elif stat == 'mean':
+                res = sumx / np.where(empty, 1, nobs)
+            elif stat in ('var', 'std'):
+                ct = np.where(nobs < 2, 2, nobs)
+                res = (ct * sumxx - sumx * sumx) / (ct * ct - ct)
+                res[nobs < 2] = np.nan
+                if stat == 'std':
+                    res = np.sqrt(res)
+            elif stat == 'min':
+                res = minx
+            elif stat == 'max':
+                res = maxx
+            elif stat == 'first':
+                res = first
+            elif stat == 'last':
+                res = last
+            else:
+                raise ValueError('cannot compute %s in one pass' % stat)
+
+            if self._filter_empty_groups:
+                res = res[counts > 0]
+            results[stat] = res
+
+        return results
+
+    def _aggregate_stats(self, out, counts, values):
+        comp_ids, _, _ = self.group_info
+        lib.group_stats(out, counts, values, comp_ids)
+
     def agg_series(self, obj, func):
         try:
             return self._aggregate_series_fast(obj, func)
@@ -810,7 +1210,7 @@ class Grouper(object):
 
         # avoids object / Series creation overhead
         dummy = obj[:0].copy()
-        indexer = lib.groupsort_indexer(group_index, ngroups)[0]
+        indexer = self._sort_idx
         obj = obj.take(indexer)
         group_index = com.ndtake(group_index, indexer)
         grouper = lib.SeriesGrouper(obj, func, group_index, ngroups,
@@ -827,7 +1227,8 @@ class Grouper(object):
         group_index, _, ngroups = self.group_info
 
         for label, group in _generate_groups(obj, group_index, ngroups,
-                                             axis=self.axis):
+                                             axis=self.axis,
+                                             indexer=self._sort_idx):
             res = func(group)
             if result is None:
                 if isinstance(res, np.ndarray) or isinstance(res, list):
@@ -934,6 +1335,9 @@ class BinGrouper(Grouper):
     def ngroups(self):
         return len(self.binlabels)
 
+    def is_indexed_like(self, axis):
+        return len(self.bins) == 0 or self.bins[-1] <= len(axis)
+
     @cache_readonly
     def result_index(self):
         return self.binlabels
@@ -967,17 +1371,17 @@ class BinGrouper(Grouper):
         'last': lib.group_last_bin_object
     }
 
+    _cython_typed_functions = _get_typed_functions(bins=True)
+
     _name_functions = {
         'ohlc': lambda *args: ['open', 'high', 'low', 'close']
     }
 
     _filter_empty_groups = True
 
-    def _aggregate(self, result, counts, values, how, is_numeric=True):
-        fdict = self._cython_functions
-        if not is_numeric:
-            fdict = self._cython_object_functions
-        agg_func = fdict[how]
+    def _aggregate(self, result, counts, values, how, is_numeric=True,
+                   kind='float64'):
+        agg_func = self._get_aggregate_function(how, is_numeric, kind)
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         if values.ndim > 3:
@@ -991,6 +1395,9 @@ class BinGrouper(Grouper):
 
         return trans_func(result)
 
+    def _aggregate_stats(self, out, counts, values):
+        lib.group_stats_bin(out, counts, values, self.bins)
+
     def agg_series(self, obj, func):
         dummy = obj[:0]
         grouper = lib.SeriesBinGrouper(obj, func, self.bins, dummy)
@@ -1074,7 +1481,7 @@ class Grouping(object):
                 # Is there any way to avoid this?
                 self.grouper = np.asarray(factor)
 
-                self._labels = factor.labels
+                self._labels = com._ensure_int64(factor.labels)
                 self._group_index = factor.levels
                 if self.name is None:
                     self.name = factor.name
@@ -1158,6 +1565,8 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
         gpr = key.get_grouper(obj)
         return gpr, []
     elif isinstance(key, Grouper):
+        if not key.is_indexed_like(group_axis):
+            raise ValueError('Grouper was built from a different axis')
         return key, []
 
     if not isinstance(key, (tuple, list)):
@@ -1204,7 +1613,11 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
         if _is_label_like(gpr) or in_axis:
             exclusions.append(gpr)
             name = gpr
-            gpr = obj[gpr]
+            if isinstance(obj, DataFrame) and obj._data.is_categorical(gpr):
+                # group on the stored codes directly
+                gpr = obj._data.get_categorical(gpr)
+            else:
+                gpr = obj[gpr]
         ping = Grouping(group_axis, gpr, name=name, level=level, sort=sort)
         groupings.append(ping)
 
@@ -1238,6 +1651,9 @@ def _convert_grouper(axis, grouper):
 
 class SeriesGroupBy(GroupBy):
 
+    count = _groupby_function('count', 'count', _count_compat,
+                              numeric_only=False)
+
     def aggregate(self, func_or_funcs, *args, **kwargs):
         """
         Apply aggregation function or functions to groups, yielding most likely
@@ -1336,16 +1752,36 @@ class SeriesGroupBy(GroupBy):
             arg = zip(columns, arg)
 
         results = {}
+        fused = self._aggregate_stats([func for _, func in arg])
 
         for name, func in arg:
             if name in results:
                 raise SpecificationError('Function names must be unique, '
                                          'found multiple named %s' % name)
 
-            results[name] = self.aggregate(func)
+            if fused is not None:
+                results[name] = fused[_get_stat_name(func)]
+            else:
+                results[name] = self.aggregate(func)
 
         return DataFrame(results, columns=columns)
 
+    def _aggregate_stats(self, funcs):
+        """
+        Compute the statistics funcs of float64 data in one pass over the
+        values. Returns None unless there are several and they all have a
+        fused kernel
+        """
+        stats = [_get_stat_name(f) for f in funcs]
+        if (len(stats) < 2 or self.obj.dtype != np.float64 or
+                not all(stat in _fused_stats for stat in stats)):
+            return None
+
+        results = self.grouper.aggregate_stats(self.obj.values, stats)
+        index = self.grouper.result_index
+        return dict((stat, Series(res, index=index, name=self.name))
+                    for stat, res in results.iteritems())
+
     def _wrap_aggregated_output(self, output, names=None):
         # sort of a kludge
         output = output[self.name]
@@ -1356,6 +1792,10 @@ class SeriesGroupBy(GroupBy):
         else:
             return Series(output, index=index, name=self.name)
 
+    def _wrap_transformed_output(self, output, names):
+        return Series(output[self.name], index=self.obj.index,
+                      name=self.name)
+
     def _wrap_applied_output(self, keys, values, not_indexed_same=False):
         if len(keys) == 0:
             return Series([])
@@ -1478,16 +1918,13 @@ class NDFrameGroupBy(GroupBy):
         new_blocks = []
 
         for block in data.blocks:
-            values = block.values
+            values = block.get_values(block.dtype)
 
             is_numeric = _is_numeric_dtype(values.dtype)
 
             if numeric_only and not is_numeric:
                 continue
 
-            if is_numeric:
-                values = com.ensure_float(values)
-
             result, _ = self.grouper.aggregate(values, how, axis=agg_axis)
             newb = make_block(result, block.items, block.ref_items)
             new_blocks.append(newb)
@@ -1889,6 +2326,9 @@ class DataFrameGroupBy(NDFrameGroupBy):
 
         return result
 
+    def _wrap_transformed_output(self, output, names):
+        return DataFrame(output, index=self.obj.index, columns=names)
+
     def _wrap_agged_blocks(self, blocks):
         obj = self._obj_with_exclusions
 
@@ -2011,14 +2451,245 @@ class NDArrayGroupBy(GroupBy):
     pass
 
 
+#----------------------------------------------------------------------
+# Aggregating data which arrives in chunks
+
+_accumulator_stats = frozenset(['count', 'sum', 'mean', 'var', 'std', 'min',
+                                'max'])
+
+
+class GroupByAccumulator(object):
+    """
+    Group by group aggregation of a DataFrame which is read in chunks, e.g.
+    with read_csv(chunksize=...) or from an HDFStore. Only a partial state per
+    group (count, sum, mean, sum of squared deviations, min, max) is kept
+    between chunks, so the data never has to fit in memory at once
+
+    Parameters
+    ----------
+    keys : column name or list of column names
+        Passed to DataFrame.groupby for each chunk
+    arg : dict of {column -> statistic name or list of statistic names}
+        Statistics among 'count', 'sum', 'mean', 'var', 'std', 'min' and
+        'max'
+
+    Examples
+    --------
+    >>> acc = GroupByAccumulator(['A', 'B'], {'C' : ['sum', 'mean', 'var']})
+    >>> for chunk in read_csv(path, chunksize=100000):
+    ...     acc.update(chunk)
+    >>> result = acc.result()
+
+    Notes
+    -----
+    The result is laid out like DataFrame.groupby(keys).agg(arg) of all the
+    chunks. Means and variances of the chunks are merged with the pairwise
+    update of Chan, Golub and LeVeque
+    """
+    def __init__(self, keys, arg):
+        if not isinstance(arg, dict) or len(arg) == 0:
+            raise ValueError('arg must be a non-empty dict of '
+                             '{column -> statistics}')
+
+        self.keys = keys
+        self.arg = arg
+
+        self._stats = {}
+        for col, stats in arg.iteritems():
+            if isinstance(stats, basestring):
+                stats = [stats]
+            for stat in stats:
+                if stat not in _accumulator_stats:
+                    raise ValueError('cannot accumulate %s, must be one of %s'
+                                     % (stat, sorted(_accumulator_stats)))
+            self._stats[col] = list(stats)
+
+        self._index = None
+        self._states = None
+
+    def update(self, chunk):
+        """
+        Merge the partial aggregates of a chunk of data into the state
+
+        Parameters
+        ----------
+        chunk : DataFrame
+        """
+        if len(chunk) == 0:
+            return
+
+        grouped = chunk.groupby(self.keys)
+
+        index = None
+        states = {}
+        for col, stats in self._stats.iteritems():
+            part = grouped[col].agg(_partial_stats(stats))
+            index = part.index
+
+            counts = part['count'].values.astype(np.int64)
+            state = {'count': counts}
+            if 'sum' in part:
+                # empty groups hold 0 until the result is computed
+                state['sum'] = np.where(counts > 0, part['sum'].values, 0)
+            if 'mean' in part:
+                state['mean'] = np.where(counts > 0, part['mean'].values, 0.)
+            if 'var' in part:
+                var = part['var'].values
+                state['m2'] = np.where(counts > 1, var * (counts - 1), 0.)
+            for stat in ('min', 'max'):
+                if stat in part:
+                    state[stat] = part[stat].values
+            states[col] = state
+
+        if self._index is None:
+            self._index = index
+            self._states = states
+            return
+
+        new_index = self._index.union(index)
+        left = new_index.get_indexer(self._index)
+        right = new_index.get_indexer(index)
+
+        for col, state in self._states.iteritems():
+            self._states[col] = _merge_partial_states(state, states[col],
+                                                      left, right,
+                                                      len(new_index))
+        self._index = new_index
+
+    def result(self):
+        """
+        Compute the statistics of all the chunks passed to update
+
+        Returns
+        -------
+        aggregated : DataFrame
+        """
+        from pandas.tools.merge import concat
+
+        if self._index is None:
+            raise ValueError('No chunks have been passed to update')
+
+        results = {}
+        keys = []
+        for col, stats in self._stats.iteritems():
+            state = self._states[col]
+            counts = state['count']
+            empty = counts == 0
+
+            output = {}
+            for stat in stats:
+                if stat == 'count':
+                    res = counts
+                elif stat == 'sum':
+                    res = state['sum']
+                    if empty.any():
+                        res = res.astype(np.float64)
+                        res[empty] = np.nan
+                elif stat == 'mean':
+                    res = state['mean'].copy()
+                    res[empty] = np.nan
+                elif stat in ('var', 'std'):
+                    res = state['m2'] / np.where(counts > 1, counts - 1, 1)
+                    res[counts < 2] = np.nan
+                    if stat == 'std':
+                        res = np.sqrt(res)
+                else:
+                    res = state[stat]
+                output[stat] = res
+
+            results[col] = DataFrame(output, index=self._index, columns=stats)
+            keys.append(col)
+
+        if any(isinstance(x, (list, tuple)) for x in self.arg.values()):
+            return concat([results[k] for k in keys], keys=keys, axis=1)
+        else:
+            return DataFrame(dict((k, v[self.arg[k]])
+                                  for k, v in results.iteritems()))
+
+
+def _partial_stats(stats):
+    """
+    Statistics of a chunk needed to merge it into the accumulated stats
+    """
+    needed = ['count']
+    if 'sum' in stats:
+        needed.append('sum')
+    if 'mean' in stats or 'var' in stats or 'std' in stats:
+        needed.append('mean')
+    if 'var' in stats or 'std' in stats:
+        needed.append('var')
+    for stat in ('min', 'max'):
+        if stat in stats:
+            needed.append(stat)
+    return needed
+
+
+def _merge_partial_states(left_state, right_state, left, right, n):
+    """
+    Merge two partial states aligned to n groups by the indexers left and
+    right
+    """
+    na = np.zeros(n, dtype=np.float64)
+    na[left] = left_state['count']
+    nb = np.zeros(n, dtype=np.float64)
+    nb[right] = right_state['count']
+    total = na + nb
+
+    merged = {'count': total.astype(np.int64)}
+
+    if 'sum' in left_state:
+        merged['sum'] = _merge_aligned(left_state['sum'], right_state['sum'],
+                                       left, right, n, np.add)
+
+    if 'mean' in left_state:
+        ma = np.zeros(n, dtype=np.float64)
+        ma[left] = left_state['mean']
+        mb = np.zeros(n, dtype=np.float64)
+        mb[right] = right_state['mean']
+
+        # a side without observations has mean 0 and weight 0
+        delta = mb - ma
+        denom = np.where(total > 0, total, 1)
+        merged['mean'] = ma + delta * nb / denom
+
+        if 'm2' in left_state:
+            m2 = np.zeros(n, dtype=np.float64)
+            m2[left] = left_state['m2']
+            m2[right] += right_state['m2']
+            merged['m2'] = m2 + delta * delta * na * nb / denom
+
+    # fmin / fmax skip the NaN of groups without observations
+    if 'min' in left_state:
+        merged['min'] = _merge_aligned(left_state['min'], right_state['min'],
+                                       left, right, n, np.fmin)
+    if 'max' in left_state:
+        merged['max'] = _merge_aligned(left_state['max'], right_state['max'],
+                                       left, right, n, np.fmax)
+
+    return merged
+
+
+def _merge_aligned(a, b, left, right, n, op):
+    dtype = np.find_common_type([a.dtype, b.dtype], [])
+    out = np.zeros(n, dtype=dtype)
+    has_left = np.zeros(n, dtype=bool)
+    out[left] = a
+    has_left[left] = True
+    out[right] = np.where(has_left[right], op(out[right], b), b)
+    return out
+
+
 #----------------------------------------------------------------------
 # Grouping generator for BlockManager
 
-def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x):
+def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x,
+                    indexer=None):
     """
     Parameters
     ----------
     data : BlockManager
+    indexer : ndarray (int64), optional
+        Result of lib.groupsort_indexer(group_index, ngroups), if known
 
     Returns
     -------
@@ -2026,7 +2697,8 @@ def generate_groups(data, group_index, ngroups, axis=0, factory=lambda x: x):
     """
     group_index = com._ensure_int64(group_index)
 
-    indexer = lib.groupsort_indexer(group_index, ngroups)[0]
+    if indexer is None:
+        indexer = lib.groupsort_indexer(group_index, ngroups)[0]
     group_index = com.ndtake(group_index, indexer)
 
     if isinstance(data, BlockManager):
@@ -2268,6 +2940,68 @@ def _intercept_cython(func):
     return _cython_table.get(func)
 
 
+# statistics which Grouper.aggregate_stats computes together in one pass
+_fused_stats = frozenset(['sum', 'count', 'mean', 'var', 'std', 'min', 'max',
+                          'first', 'last'])
+
+
+def _get_stat_name(func):
+    if isinstance(func, basestring):
+        return func
+    return _intercept_cython(func)
+
+
+def _transform_values(values, how, labels, ngroups, periods=1,
+                      method='average', ascending=True):
+    """
+    Compute a group-wise transform of 1-d values in one pass over the group
+    labels, returning an array aligned with values
+    """
+    if how in ('cumsum', 'cumprod', 'cummin', 'cummax'):
+        if com.is_integer_dtype(values):
+            kind = 'int64'
+            values = com._ensure_int64(values)
+        else:
+            kind = 'float64'
+            values = com._ensure_float64(values)
+
+        result = np.empty_like(values)
+        func = getattr(_algos, 'group_%s_%s' % (how, kind))
+        func(result, values, labels, ngroups)
+
+        if kind == 'int64' and (labels < 0).any():
+            result = result.astype(np.float64)
+            result[labels < 0] = np.nan
+        return result
+    elif how == 'shift':
+        indexer = lib.group_shift_indexer(labels, ngroups, periods)
+        if com.is_datetime64_dtype(values):
+            result = com.take_1d(values.view('i8'), indexer,
+                                 fill_value=lib.iNaT)
+            return result.view(values.dtype)
+        return com.take_1d(values, indexer)
+    elif how == 'diff':
+        values = com._ensure_float64(values)
+        indexer = lib.group_shift_indexer(labels, ngroups, periods)
+        return values - com.take_1d(values, indexer)
+    elif how == 'rank':
+        values = com._ensure_float64(values)
+        if not ascending:
+            values = -values
+
+        # stable sort by value, then a counting sort by label
+        order = values.argsort(kind='mergesort')
+        by_label = lib.groupsort_indexer(labels.take(order), ngroups)[0]
+        order = com._ensure_int64(order.take(by_label))
+
+        result = np.empty(len(values), dtype=np.float64)
+        lib.group_rank_float64(result, values, labels, order,
+                               ties_method=method)
+        return result
+    else:
+        raise ValueError('no Cython transform for %s' % how)
+
+
 def _groupby_indices(values):
     return lib.groupby_indices(com._ensure_object(values))
 
@@ -8,6 +8,7 @@ import numpy as np
 
 from pandas.core.common import ndtake
 from pandas.util.decorators import cache_readonly
+import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.lib as lib
 import pandas._algos as _algos
@@ -32,12 +33,81 @@ def _indexOp(opname):
     return wrapper
 
 
+def _views_same_labels(left, right):
+    """
+    Whether two indexes view the very same memory as their labels
+    """
+    if not isinstance(right, Index):
+        return False
+    return (left.__array_interface__['data'][0] ==
+            right.__array_interface__['data'][0] and
+            left.shape == right.shape and left.strides == right.strides and
+            left.dtype == right.dtype)
+
+
+def set_engine_memory_limit(max_bytes):
+    """
+    Set the memory budget for the hash tables indexes build for label
+    lookups. Beyond it the oldest populated tables are cleared, and rebuilt
+    by the next lookup that needs them. The table being built is always
+    kept, even if it alone exceeds the budget.
+
+    Parameters
+    ----------
+    max_bytes : int or None
+        None means unbounded
+    """
+    if max_bytes is not None:
+        max_bytes = int(max_bytes)
+        if max_bytes < 0:
+            raise ValueError('max_bytes must be non-negative, got %d'
+                             % max_bytes)
+        lib._evict_engines(None, max_bytes)
+    lib._engine_policy['max_bytes'] = max_bytes
+
+
+def get_engine_memory_limit():
+    return lib._engine_policy['max_bytes']
+
+
+def get_engine_stats():
+    """
+    Counters for the lookup engines of indexes
+
+    Returns
+    -------
+    stats : dict
+        populated : engines currently holding a hash table
+        bytes : memory taken by those hash tables
+        evictions : tables cleared to stay within the memory limit
+        shared : engines reused by an index viewing the same labels
+    """
+    return dict(lib._engine_stats)
+
+
+def reset_engine_stats():
+    """
+    Reset the evictions and shared counters; populated and bytes describe
+    the engines currently alive and are left as is
+    """
+    lib._engine_stats['evictions'] = 0
+    lib._engine_stats['shared'] = 0
+
+
 class InvalidIndexError(Exception):
     pass
 
 _o_dtype = np.dtype(object)
 
 
+# float labels are held in object indexes, these merge them as float64
+_float64_merge_kernels = {
+    'inner': _algos.inner_join_indexer_float64,
+    'outer': _algos.outer_join_indexer_float64,
+    'diff': _algos.setdiff_indexer_float64
+}
+
+
 def _shouldbe_timestamp(obj):
     return (lib.is_datetime_array(obj) or lib.is_datetime64_array(obj)
             or lib.is_timestamp_array(obj))
@@ -71,6 +141,7 @@ class Index(np.ndarray):
     _left_indexer = _algos.left_join_indexer_object
     _inner_indexer = _algos.inner_join_indexer_object
     _outer_indexer = _algos.outer_join_indexer_object
+    _setdiff_indexer = _algos.setdiff_indexer_object
 
     _box_scalars = False
 
@@ -79,6 +150,9 @@ class Index(np.ndarray):
 
     _engine_type = lib.ObjectEngine
 
+    # index viewing the same labels whose engine this one reuses
+    _engine_source = None
+
     def __new__(cls, data, dtype=None, copy=False, name=None):
         if isinstance(data, np.ndarray):
             if issubclass(data.dtype.type, np.datetime64):
@@ -130,7 +204,9 @@ class Index(np.ndarray):
         self.name = getattr(obj, 'name', None)
 
     def _shallow_copy(self):
-        return self.view()
+        result = self.view()
+        result._engine_source = self
+        return result
 
     def __repr__(self):
         if len(self) > 6 and len(self) > np.get_printoptions()['threshold']:
@@ -200,6 +276,24 @@ class Index(np.ndarray):
         # to disable groupby tricks in MultiIndex
         return False
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes held by the Index values
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Include the size of the Python objects in an object Index
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return self._memory_usage(deep=deep, seen={})
+
+    def _memory_usage(self, deep=False, seen=None):
+        return com._array_memory_usage(self, deep=deep, seen=seen)
+
     def summary(self, name=None):
         if len(self) > 0:
             index_summary = ', %s to %s' % (com.pprint_thing(self[0]),
@@ -257,6 +351,10 @@ class Index(np.ndarray):
     @cache_readonly
     def _engine(self):
         # property, for now, slow to look up
+        source = self._engine_source
+        if source is not None and source._engine_type is self._engine_type:
+            lib._engine_stats['shared'] += 1
+            return source._engine
         return self._engine_type(lambda: self.values, len(self))
 
     def _get_level_number(self, level):
@@ -330,7 +428,16 @@ class Index(np.ndarray):
             if result.ndim > 1:
                 return result
 
-            return Index(result, name=self.name)
+            result = Index(result, name=self.name)
+            if isinstance(key, slice) and _views_same_labels(result, self):
+                result._engine_source = self
+            return result
+
+    def __getslice__(self, i, j):
+        result = np.ndarray.__getslice__(self, i, j)
+        if _views_same_labels(result, self):
+            result._engine_source = self
+        return result
 
     def append(self, other):
         """
@@ -555,7 +662,8 @@ class Index(np.ndarray):
 
         if self.is_monotonic and other.is_monotonic:
             try:
-                result = self._outer_indexer(self, other.values)[0]
+                sv, ov, outer = self._merge_kernel(other, 'outer')
+                result = outer(sv, ov)[0]
             except TypeError:
                 # incomparable objects
                 result = list(self.values)
@@ -618,7 +726,8 @@ class Index(np.ndarray):
 
         if self.is_monotonic and other.is_monotonic:
             try:
-                result = self._inner_indexer(self, other.values)[0]
+                sv, ov, inner = self._merge_kernel(other, 'inner')
+                result = inner(sv, ov)[0]
                 return self._wrap_union_result(other, result)
             except TypeError:
                 pass
@@ -649,12 +758,53 @@ class Index(np.ndarray):
         if self.equals(other):
             return Index([])
 
-        if not isinstance(other, Index):
-            other = np.asarray(other)
+        other = _ensure_index(other)
+
+        # labels compare by value only for matching dtypes (and for
+        # datetimes, both tz-naive or both tz-aware)
+        if (self.dtype == other.dtype and
+                (getattr(self, 'tz', None) is None) ==
+                (getattr(other, 'tz', None) is None)):
+            if self.is_monotonic and other.is_monotonic:
+                try:
+                    sv, ov, setdiff = self._merge_kernel(other, 'diff')
+                    return self._wrap_diff_result(setdiff(sv, ov))
+                except TypeError:
+                    pass
+            elif self.is_unique and other.is_unique:
+                indexer = (other.get_indexer(self) == -1).nonzero()[0]
+                try:
+                    order = self.take(indexer).argsort()
+                    return self._wrap_diff_result(indexer.take(order))
+                except TypeError:
+                    pass
 
         theDiff = sorted(set(self) - set(other))
         return Index(theDiff)
 
+    def _merge_kernel(self, other, kind):
+        """
+        Values of two monotonic indexes with the merge kernel of the given
+        kind ('inner', 'outer' or 'diff') combining them. Float labels held
+        in object indexes go through the typed float64 kernels
+        """
+        if (self.dtype == np.object_ and other.dtype == np.object_ and
+                self.inferred_type == 'floating' and
+                other.inferred_type == 'floating'):
+            return (self.values.astype(np.float64),
+                    other.values.astype(np.float64),
+                    _float64_merge_kernels[kind])
+
+        kernels = {'inner': self._inner_indexer,
+                   'outer': self._outer_indexer,
+                   'diff': self._setdiff_indexer}
+        return self, other.values, kernels[kind]
+
+    def _wrap_diff_result(self, indexer):
+        result = self.take(indexer)
+        result.name = None
+        return result
+
     def unique(self):
         """
         Return array of unique values in the Index. Significantly faster than
@@ -797,8 +947,9 @@ class Index(np.ndarray):
         -------
         is_contained : ndarray (boolean dtype)
         """
-        value_set = set(values)
-        return lib.ismember(self._array_values(), value_set)
+        # monotonic numeric labels let few values use binary search
+        is_sorted = self.dtype != np.object_ and self.is_monotonic
+        return algos.isin(self._array_values(), values, is_sorted=is_sorted)
 
     def _array_values(self):
         return self
@@ -1168,6 +1319,7 @@ class Int64Index(Index):
     _left_indexer = _algos.left_join_indexer_int64
     _inner_indexer = _algos.inner_join_indexer_int64
     _outer_indexer = _algos.outer_join_indexer_int64
+    _setdiff_indexer = _algos.setdiff_indexer_int64
 
     _engine_type = lib.Int64Engine
 
@@ -1238,6 +1390,298 @@ class Int64Index(Index):
         return Int64Index(joined, name=name)
 
 
+class RangeIndex(Int64Index):
+    """
+    Int64Index holding an arithmetic progression of integers, the default
+    index for pandas objects constructed without one. Label lookups,
+    slicing, take and set operations between ranges are computed from the
+    start and step rather than from a hash table, so the lookup engine is
+    never built for these indexes
+
+    Parameters
+    ----------
+    start : int, default 0
+        If stop is not given, used as stop and the range starts at 0
+    stop : int, optional
+    step : int, default 1
+    name : object
+        Name to be stored in the index
+
+    Notes
+    -----
+    Arrays derived from a RangeIndex by other means (ufuncs, fancy
+    indexing, ...) forget the range and behave as plain Int64Index objects
+    """
+    _start = None
+    _step = None
+
+    def __new__(cls, start=0, stop=None, step=1, name=None):
+        if stop is None:
+            start, stop = 0, start
+
+        start, stop, step = int(start), int(stop), int(step)
+        if step == 0:
+            raise ValueError('step must not be zero')
+
+        values = np.arange(start, stop, step, dtype=np.int64)
+        return cls._simple_new(values, start, step, name)
+
+    @classmethod
+    def _simple_new(cls, values, start, step, name=None):
+        result = values.view(cls)
+        result.name = name
+        result._start = start
+        result._step = step
+        return result
+
+    def __array_finalize__(self, obj):
+        Int64Index.__array_finalize__(self, obj)
+        # only arrays made through _simple_new know their bounds
+        self._start = None
+        self._step = None
+
+    def __array_wrap__(self, result, context=None):
+        result = np.ndarray.__array_wrap__(self, result, context)
+        return result.view(Int64Index)
+
+    @property
+    def _is_range(self):
+        return self._step is not None
+
+    @property
+    def _stop(self):
+        return self._start + len(self) * self._step
+
+    def _shallow_copy(self):
+        if not self._is_range:
+            return Int64Index._shallow_copy(self)
+        return RangeIndex._simple_new(self.view(np.ndarray), self._start,
+                                      self._step, self.name)
+
+    def __reduce__(self):
+        if not self._is_range:
+            return self.view(Int64Index).__reduce__()
+        return (RangeIndex, (self._start, self._stop, self._step, self.name))
+
+    @property
+    def is_monotonic(self):
+        if not self._is_range:
+            return self._engine.is_monotonic
+        return self._step > 0 or len(self) <= 1
+
+    @property
+    def is_unique(self):
+        if not self._is_range:
+            return self._engine.is_unique
+        return True
+
+    def _range_loc(self, key):
+        """
+        Position of key in the range, -1 if it is not an integer label of
+        the range. Float keys are truncated, as the Int64Index engine does
+        """
+        try:
+            ikey = int(key)
+        except (TypeError, ValueError, OverflowError):
+            return -1
+
+        if ikey != key and not isinstance(key, (float, np.floating)):
+            return -1
+
+        loc, rem = divmod(ikey - self._start, self._step)
+        if rem != 0 or loc < 0 or loc >= len(self):
+            return -1
+        return loc
+
+    def __contains__(self, key):
+        if not self._is_range:
+            return Int64Index.__contains__(self, key)
+        hash(key)
+        return self._range_loc(key) != -1
+
+    def get_loc(self, key):
+        """
+        Get integer location for requested label
+
+        Returns
+        -------
+        loc : int
+        """
+        if not self._is_range:
+            return Int64Index.get_loc(self, key)
+
+        loc = self._range_loc(key)
+        if loc == -1:
+            hash(key)
+            raise KeyError(key)
+        return loc
+
+    def get_value(self, series, key):
+        """
+        Fast lookup of value from 1-dimensional ndarray. Only use this if you
+        know what you're doing
+        """
+        if not self._is_range or len(self) == 0:
+            return Int64Index.get_value(self, series, key)
+
+        try:
+            hash(key)
+        except TypeError:
+            raise InvalidIndexError(key)
+
+        loc = self._range_loc(key)
+        if loc == -1:
+            raise KeyError(key)
+        return lib.get_value_at(series, loc)
+
+    def set_value(self, arr, key, value):
+        """
+        Fast lookup of value from 1-dimensional ndarray. Only use this if you
+        know what you're doing
+        """
+        if not self._is_range:
+            return Int64Index.set_value(self, arr, key, value)
+
+        loc = self.get_loc(key)
+        lib.set_value_at(arr, loc, lib.convert_scalar(arr, value))
+
+    def get_indexer(self, target, method=None, limit=None):
+        target = _ensure_index(target)
+        if (not self._is_range or method is not None or
+                target.dtype != np.int64):
+            return Int64Index.get_indexer(self, target, method=method,
+                                          limit=limit)
+
+        offset = target.values - self._start
+        locs = offset // self._step
+        valid = ((offset - locs * self._step) == 0) & (locs >= 0)
+        valid &= locs < len(self)
+        locs[~valid] = -1
+        return com._ensure_platform_int(locs)
+
+    def __getitem__(self, key):
+        if self._is_range and isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            values = self.view(np.ndarray)[key]
+            return RangeIndex._simple_new(values,
+                                          self._start + start * self._step,
+                                          self._step * step, self.name)
+        return Int64Index.__getitem__(self, key)
+
+    def take(self, indexer, axis=0):
+        """
+        Analogous to ndarray.take
+        """
+        if not self._is_range:
+            return Int64Index.take(self, indexer, axis=axis)
+
+        indexer = com._ensure_platform_int(indexer)
+        n = len(self)
+        if ((indexer < -n) | (indexer >= n)).any():
+            raise IndexError('index out of bounds')
+
+        indexer = np.where(indexer < 0, indexer + n, indexer)
+        taken = self._start + indexer.astype(np.int64) * self._step
+        return Int64Index(taken, name=self.name)
+
+    def _wrap_union_result(self, other, result):
+        name = self.name if self.name == other.name else None
+        return Int64Index(result, name=name)
+
+    def _both_ranges(self, other):
+        return (self._is_range and isinstance(other, RangeIndex) and
+                other._is_range)
+
+    def equals(self, other):
+        """
+        Determines if two Index objects contain the same elements.
+        """
+        if self._both_ranges(other):
+            if len(self) != len(other):
+                return False
+            if len(self) == 0:
+                return True
+            return (self._start == other._start and
+                    (len(self) == 1 or self._step == other._step))
+        return Int64Index.equals(self, other)
+
+    def union(self, other):
+        """
+        Form the union of two Index objects and sorts if possible. The union
+        of two overlapping or adjacent ranges with the same positive step is
+        again a RangeIndex
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        union : Index
+        """
+        if (self._both_ranges(other) and len(self) > 0 and len(other) > 0
+                and self._step > 0 and self._step == other._step
+                and (other._start - self._start) % self._step == 0
+                and max(self._start, other._start) <=
+                    min(self._stop, other._stop)):
+            name = self.name if self.name == other.name else None
+            return RangeIndex(min(self._start, other._start),
+                              max(self._stop, other._stop),
+                              self._step, name=name)
+        return Int64Index.union(self, other)
+
+    def intersection(self, other):
+        """
+        Form the intersection of two Index objects. The intersection of two
+        ranges with positive steps is computed arithmetically and is again a
+        RangeIndex
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        intersection : Index
+        """
+        if not (self._both_ranges(other) and self._step > 0 and
+                other._step > 0):
+            return Int64Index.intersection(self, other)
+
+        name = self.name if self.name == other.name else None
+        first = max(self._start, other._start)
+        last = min(self._stop, other._stop)
+        if first >= last:
+            return RangeIndex(0, name=name)
+
+        # solve x = self._start (mod self._step), x = other._start
+        # (mod other._step) with the extended Euclidean algorithm
+        gcd, s, _ = _extended_gcd(self._step, other._step)
+        diff = other._start - self._start
+        if diff % gcd:
+            return RangeIndex(0, name=name)
+
+        lcm = self._step // gcd * other._step
+        x = self._start + (diff // gcd) * s * self._step
+        first = first + (x - first) % lcm
+        return RangeIndex(first, max(first, last), lcm, name=name)
+
+
+def _extended_gcd(a, b):
+    """
+    Returns (g, s, t) with g = gcd(a, b) = a * s + b * t
+    """
+    s, old_s = 0, 1
+    t, old_t = 1, 0
+    r, old_r = b, a
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_s, s = s, old_s - quotient * s
+        old_t, t = t, old_t - quotient * t
+    return old_r, old_s, old_t
+
+
 class MultiIndex(Index):
     """
     Implements multi-level, a.k.a. hierarchical, index object for pandas
@@ -1404,6 +1848,23 @@ class MultiIndex(Index):
             self._tuples = lib.fast_zip(values)
             return self._tuples
 
+    def _memory_usage(self, deep=False, seen=None):
+        if seen is None:
+            seen = {}
+
+        total = com._array_memory_usage(self.view(np.ndarray), deep=deep,
+                                        seen=seen)
+        for lev in self.levels:
+            total += lev._memory_usage(deep=deep, seen=seen)
+        for lab in self.labels:
+            total += com._array_memory_usage(lab, seen=seen)
+
+        # tuples materialized by values
+        if self._tuples is not None:
+            total += com._array_memory_usage(self._tuples, deep=deep,
+                                             seen=seen)
+        return total
+
     # fml
     @property
     def _is_v1(self):
@@ -1425,17 +1886,157 @@ class MultiIndex(Index):
         """
         Return True if there are no unique groups
         """
-        # has duplicates
-        shape = [len(lev) for lev in self.levels]
-        group_index = np.zeros(len(self), dtype='i8')
-        for i in xrange(len(shape)):
-            stride = np.prod([x for x in shape[i + 1:]], dtype='i8')
-            group_index += self.labels[i] * stride
+        return not self.is_unique
 
-        if len(np.unique(group_index)) < len(group_index):
-            return True
+    @cache_readonly
+    def _codes(self):
+        """
+        One int64 key per row combining the level labels, so that rows can
+        be compared without materializing tuples
+        """
+        return _encode_labels(self.labels, self.levshape)
 
-        return False
+    @property
+    def _codes_overflow(self):
+        # keys were compressed and are not a simple function of the labels
+        from pandas.core.groupby import _int64_overflow_possible
+        return _int64_overflow_possible([n + 1 for n in self.levshape])
+
+    @cache_readonly
+    def _code_engine(self):
+        return lib.Int64Engine(lambda: self._codes, len(self))
+
+    @cache_readonly
+    def is_unique(self):
+        if not self._codes_overflow:
+            return self._code_engine.is_unique
+        return not self.duplicated().any()
+
+    def duplicated(self, take_last=False):
+        """
+        Return boolean array denoting duplicate index values
+
+        Parameters
+        ----------
+        take_last : boolean, default False
+            Take the last observed index value in a group. Default first
+
+        Returns
+        -------
+        duplicated : ndarray (bool)
+        """
+        n = len(self)
+        comp_ids, uniques = lib.Int64HashTable(n).get_labels_groupby(
+            self._codes)
+
+        # first (or last) location of each distinct row
+        order = np.arange(n)
+        if not take_last:
+            order = order[::-1]
+        kept = np.empty(len(uniques), dtype=np.int64)
+        kept[comp_ids[order]] = order
+
+        result = np.ones(n, dtype=bool)
+        result[kept] = False
+        return result
+
+    def isin(self, values):
+        """
+        Compute boolean array of whether each index value is found in the
+        passed set of values
+
+        Parameters
+        ----------
+        values : set or sequence of tuples
+
+        Returns
+        -------
+        is_contained : ndarray (boolean dtype)
+        """
+        values = list(values)
+        if len(values) == 0:
+            return np.zeros(len(self), dtype=bool)
+
+        if not isinstance(values[0], tuple):
+            return Index.isin(self, values)
+
+        other = MultiIndex.from_tuples(values)
+        if not isinstance(other, MultiIndex) or other.nlevels != self.nlevels:
+            return Index.isin(self, values)
+
+        self_keys, other_keys, missing = self._encode_other(other)
+        table = lib.Int64HashTable(len(other_keys))
+        table.map_locations(other_keys[-missing])
+        return table.lookup(self_keys) != -1
+
+    def _encode_other(self, other):
+        """
+        Encode the rows of self and other MultiIndex with comparable keys
+
+        Returns
+        -------
+        (self_keys, other_keys, missing) : missing marks the rows of other
+        with a value not found in the corresponding level of self
+        """
+        other_labels = []
+        missing = np.zeros(len(other), dtype=bool)
+        for lev, olev, olab in zip(self.levels, other.levels, other.labels):
+            lev_indexer = com._ensure_int64(lev.get_indexer(olev))
+            olab = com._ensure_platform_int(olab)
+            if len(lev_indexer) > 0:
+                labels = lev_indexer.take(olab)
+                labels[olab == -1] = -1
+            else:
+                labels = np.empty(len(olab), dtype=np.int64)
+                labels.fill(-1)
+            missing |= labels == -1
+            other_labels.append(labels)
+
+        if not self._codes_overflow:
+            other_keys = _encode_labels(other_labels, self.levshape)
+            return self._codes, other_keys, missing
+
+        # compressed keys are only comparable when encoded together
+        n = len(self)
+        joined = [np.concatenate((com._ensure_int64(lab), olab))
+                  for lab, olab in zip(self.labels, other_labels)]
+        keys = _encode_labels(joined, self.levshape)
+        return keys[:n], keys[n:], missing
+
+    def _get_code_loc(self, key):
+        """
+        Location of a full-depth tuple in a unique MultiIndex, found from the
+        level labels
+        """
+        hash(key)
+        if not isinstance(key, tuple) or len(key) != self.nlevels:
+            raise KeyError(key)
+
+        locs = []
+        for lev, k in zip(self.levels, key):
+            try:
+                loc = lev.get_loc(k)
+            except (TypeError, ValueError):
+                raise KeyError(key)
+            if not com.is_integer(loc):
+                raise KeyError(key)
+            locs.append(loc)
+
+        if self._codes_overflow:
+            mask = np.ones(len(self), dtype=bool)
+            for lab, loc in zip(self.labels, locs):
+                mask &= lab == loc
+            found = mask.nonzero()[0]
+            if len(found) == 0:
+                raise KeyError(key)
+            return found[0]
+
+        code = _encode_labels([np.array([loc]) for loc in locs],
+                              self.levshape)[0]
+        try:
+            return self._code_engine.get_loc(code)
+        except KeyError:
+            raise KeyError(key)
 
     def get_value(self, series, key):
         # somewhat broken encapsulation
@@ -1444,6 +2045,8 @@ class MultiIndex(Index):
 
         # Label-based
         try:
+            if self.is_unique:
+                return lib.get_value_at(series, self._get_code_loc(key))
             return self._engine.get_value(series, key)
         except KeyError, e1:
             try:
@@ -1926,6 +2529,18 @@ class MultiIndex(Index):
             raise Exception('Reindexing only valid with uniquely valued Index '
                             'objects')
 
+        if (method is None and isinstance(target, MultiIndex) and
+                target.nlevels == self.nlevels):
+            self_keys, target_keys, missing = self._encode_other(target)
+            if self._codes_overflow:
+                table = lib.Int64HashTable(len(self))
+                table.map_locations(self_keys)
+                indexer = table.lookup(target_keys)
+            else:
+                indexer = self._code_engine.get_indexer(target_keys)
+            indexer[missing] = -1
+            return com._ensure_platform_int(indexer)
+
         self_index = self._tuple_index
 
         if method == 'pad':
@@ -2071,7 +2686,7 @@ class MultiIndex(Index):
         if isinstance(key, tuple):
             if len(key) == self.nlevels:
                 if self.is_unique:
-                    return self._engine.get_loc(key)
+                    return self._get_code_loc(key)
                 else:
                     return slice(*self.slice_locs(key, key))
             else:
@@ -2137,7 +2752,7 @@ class MultiIndex(Index):
             if not any(isinstance(k, slice) for k in key):
                 if len(key) == self.nlevels:
                     if self.is_unique:
-                        return self._engine.get_loc(key), None
+                        return self._get_code_loc(key), None
                     else:
                         indexer = slice(*self.slice_locs(key, key))
                         return indexer, self[indexer]
@@ -2430,6 +3045,37 @@ class MultiIndex(Index):
 # For utility purposes
 
 
+def _encode_labels(label_list, shape):
+    """
+    Combine integer label arrays (-1 for NA) into one int64 key per row.
+    Whenever the cartesian product of the levels could overflow int64, the
+    keys built so far are compressed to the observed combinations, in
+    which case equal keys still mean equal rows but keys are no longer
+    ordered
+    """
+    from pandas.core.groupby import _int64_overflow_possible
+
+    keys = None
+    for labels, size in zip(label_list, shape):
+        # shift so that -1 labels get a key of their own
+        labels = com._ensure_int64(labels) + 1
+        size = size + 1
+        if keys is None:
+            keys, key_size = labels, size
+            continue
+
+        if _int64_overflow_possible([key_size, size]):
+            table = lib.Int64HashTable(len(keys))
+            keys, uniques = table.get_labels_groupby(keys)
+            keys = com._ensure_int64(keys)
+            key_size = len(uniques)
+
+        keys = keys * size + labels
+        key_size *= size
+
+    return keys
+
+
 def _sparsify(label_list, start=0):
     pivoted = zip(*label_list)
     k = len(label_list)
@@ -106,6 +106,9 @@ class _NDFrameIndexer(object):
                 raise ValueError('Setting mixed-type DataFrames with '
                                  'array/DataFrame pieces not yet supported')
 
+            # the values of categorical items are decoded copies
+            self._decategorize(item_labels[het_idx])
+
             try:
                 for item in item_labels[het_idx]:
                     data = self.obj[item]
@@ -128,11 +131,18 @@ class _NDFrameIndexer(object):
             if isinstance(value, DataFrame):
                 value = self._align_frame(indexer, value)
 
+            self._decategorize()
+
             # 2096
             values = self.obj.values
             if np.prod(values.shape):
                 values[indexer] = value
 
+    def _decategorize(self, items=None):
+        if self.obj._data.decategorize(items):
+            self.obj._clear_item_cache()
+            self.obj._consolidate_inplace()
+
     def _align_series(self, indexer, ser):
         # indexer to assign Series can be tuple or scalar
         if isinstance(indexer, tuple):
@@ -4,8 +4,10 @@ from datetime import datetime
 from numpy import nan
 import numpy as np
 
+from pandas.core.categorical import Categorical
 from pandas.core.index import Index, _ensure_index, _handle_legacy_indexes
 import pandas.core.common as com
+import pandas.core.nanops as nanops
 import pandas.lib as lib
 
 from pandas.util import py3compat
@@ -94,11 +96,19 @@ class Block(object):
     def dtype(self):
         return self.values.dtype
 
+    @property
+    def _consolidate_key(self):
+        # blocks sharing a key are merged by consolidation
+        return self.dtype.name
+
+    def make_block_same_class(self, values, items, ref_items):
+        return make_block(values, items, ref_items)
+
     def copy(self, deep=True):
         values = self.values
         if deep:
             values = values.copy()
-        return make_block(values, self.items, self.ref_items)
+        return self.make_block_same_class(values, self.items, self.ref_items)
 
     def merge(self, other):
         if not self.ref_items.equals(other.ref_items):
@@ -115,9 +125,13 @@ class Block(object):
         Reindex using pre-computed indexer information
         """
         if self.values.size > 0:
-            new_values = com.take_fast(self.values, indexer, mask,
-                                       needs_masking, axis=axis,
-                                       fill_value=fill_value)
+            if needs_masking and _maskable(self) and com.isnull(fill_value):
+                # keep the dtype, marking missing values in a mask
+                new_values = com.take_masked(self.values, indexer, axis=axis)
+            else:
+                new_values = com.take_fast(self.values, indexer, mask,
+                                           needs_masking, axis=axis,
+                                           fill_value=fill_value)
         else:
             shape = list(self.shape)
             shape[axis] = len(indexer)
@@ -151,7 +165,7 @@ class Block(object):
                 new_values = self.values.take(masked_idx, axis=0)
 
             new_items = self.items.take(masked_idx)
-        return make_block(new_values, new_items, new_ref_items)
+        return self.make_block_same_class(new_values, new_items, new_ref_items)
 
     def get(self, item):
         loc = self.items.get_loc(item)
@@ -177,7 +191,7 @@ class Block(object):
         loc = self.items.get_loc(item)
         new_items = self.items.delete(loc)
         new_values = np.delete(self.values, loc, 0)
-        return make_block(new_values, new_items, self.ref_items)
+        return self.make_block_same_class(new_values, new_items, self.ref_items)
 
     def split_block_at(self, item):
         """
@@ -197,20 +211,23 @@ class Block(object):
         if loc == 0:
             # at front
             left_block = None
-            right_block = make_block(self.values[1:], self.items[1:].copy(),
-                                      self.ref_items)
+            right_block = self.make_block_same_class(self.values[1:],
+                                                     self.items[1:].copy(),
+                                                     self.ref_items)
         elif loc == len(self.values) - 1:
             # at back
-            left_block = make_block(self.values[:-1], self.items[:-1].copy(),
-                                    self.ref_items)
+            left_block = self.make_block_same_class(self.values[:-1],
+                                                    self.items[:-1].copy(),
+                                                    self.ref_items)
             right_block = None
         else:
             # in the middle
-            left_block = make_block(self.values[:loc],
-                                    self.items[:loc].copy(), self.ref_items)
-            right_block = make_block(self.values[loc + 1:],
-                                     self.items[loc + 1:].copy(),
-                                     self.ref_items)
+            left_block = self.make_block_same_class(self.values[:loc],
+                                                    self.items[:loc].copy(),
+                                                    self.ref_items)
+            right_block = self.make_block_same_class(self.values[loc + 1:],
+                                                     self.items[loc + 1:].copy(),
+                                                     self.ref_items)
 
         return left_block, right_block
 
@@ -301,6 +318,21 @@ class Block(object):
     def get_values(self, dtype):
         return self.values
 
+    def notnull_counts(self):
+        """
+        Number of non-null values of each item of a 2-dimensional block
+        """
+        if not self._can_hold_na:
+            return np.repeat(self.values.shape[1], len(self.items))
+        return com.notnull(self.values).sum(1)
+
+    def reduce(self, name):
+        """
+        sum, mean, min or max of each item of a 2-dimensional block,
+        skipping missing values
+        """
+        return getattr(nanops, 'nan' + name)(self.values, axis=1)
+
     def diff(self, n):
         new_values = com.diff(self.values, n, axis=1)
         return make_block(new_values, self.items, self.ref_items)
@@ -338,8 +370,9 @@ class FloatBlock(Block):
 
     def should_store(self, value):
         # when inserting a column should not coerce integers to floats
-        # unnecessarily
-        return issubclass(value.dtype.type, np.floating)
+        # unnecessarily, nor change the width of the block dtype
+        return (issubclass(value.dtype.type, np.floating) and
+                value.dtype == self.dtype)
 
 
 class ComplexBlock(Block):
@@ -355,7 +388,8 @@ class ComplexBlock(Block):
             return element
 
     def should_store(self, value):
-        return issubclass(value.dtype.type, np.complexfloating)
+        return (issubclass(value.dtype.type, np.complexfloating) and
+                value.dtype == self.dtype)
 
 
 class IntBlock(Block):
@@ -371,7 +405,7 @@ class IntBlock(Block):
             return element
 
     def should_store(self, value):
-        return com.is_integer_dtype(value)
+        return com.is_integer_dtype(value) and value.dtype == self.dtype
 
 
 class BoolBlock(Block):
@@ -453,7 +487,308 @@ class DatetimeBlock(Block):
         return self.values
 
 
-def make_block(values, items, ref_items):
+class CategoricalBlock(Block):
+    """
+    Integer codes into levels shared by all the items of the block. The values
+    are materialized as an object array when a column is retrieved; a code of
+    -1 denotes a missing value
+    """
+    __slots__ = ['levels']
+    _can_hold_na = True
+
+    def __init__(self, values, items, ref_items, ndim=2, levels=None):
+        if levels is None:
+            raise AssertionError('CategoricalBlock requires levels')
+        Block.__init__(self, values, items, ref_items, ndim=ndim)
+        self.levels = _ensure_index(levels)
+
+    def __getstate__(self):
+        return (self.items, self.ref_items, self.values, self.levels)
+
+    def __setstate__(self, state):
+        items, ref_items, values, levels = state
+        Block.__setstate__(self, (items, ref_items, values))
+        self.levels = levels
+
+    @property
+    def dtype(self):
+        return np.dtype(object)
+
+    @property
+    def _consolidate_key(self):
+        # never merged with blocks having other levels
+        return ('category',) + tuple(self.items)
+
+    def make_block_same_class(self, values, items, ref_items):
+        return make_block(values, items, ref_items, levels=self.levels)
+
+    def get_categorical(self, item):
+        loc = self.items.get_loc(item)
+        return Categorical(self.values[loc], self.levels, name=item)
+
+    def _decode(self, codes):
+        result = com.take_1d(self.levels.values, codes.ravel())
+        return result.reshape(codes.shape)
+
+    def _gi(self, arg):
+        code = self.values[arg]
+        if isinstance(code, np.ndarray):
+            return self._decode(code)
+        return np.nan if code == -1 else self.levels[code]
+
+    def get(self, item):
+        loc = self.items.get_loc(item)
+        return self._decode(self.values[loc])
+
+    def get_values(self, dtype):
+        return self._decode(self.values)
+
+    def should_store(self, value):
+        return False
+
+    def _can_hold_element(self, element):
+        return True
+
+    def _try_cast(self, element):
+        return element
+
+    def reindex_axis(self, indexer, mask, needs_masking, axis=0,
+                     fill_value=np.nan):
+        # missing values get code -1 whatever the fill_value, so the codes
+        # are never upcast
+        indexer = com._ensure_platform_int(indexer)
+        new_values = com.ndtake(self.values, indexer, axis=axis)
+        mask = indexer == -1
+        if mask.any():
+            com.mask_out_axis(new_values, mask, axis, -1)
+        return self.make_block_same_class(new_values, self.items,
+                                          self.ref_items)
+
+    def take(self, indexer, axis=1, fill_value=np.nan):
+        if axis < 1:
+            raise AssertionError('axis must be at least 1, got %d' % axis)
+        return self.reindex_axis(indexer, None, False, axis=axis)
+
+    def fillna(self, value, inplace=False):
+        levels = self.levels
+        if value not in levels:
+            levels = levels.insert(len(levels), value)
+        code = levels.get_loc(value)
+
+        values = self.values
+        if values.dtype != _codes_dtype(len(levels)):
+            values = values.astype(_codes_dtype(len(levels)))
+        elif not inplace:
+            values = values.copy()
+        values[values == -1] = code
+
+        if inplace and values is self.values:
+            self.levels = levels
+            return self
+        return make_block(values, self.items, self.ref_items, levels=levels)
+
+    def _as_object_block(self):
+        return make_block(self.get_values(object), self.items, self.ref_items)
+
+    def replace(self, to_replace, value, inplace=False):
+        return self._as_object_block().replace(to_replace, value,
+                                               inplace=True)
+
+    def putmask(self, mask, new, inplace=False):
+        return self._as_object_block().putmask(mask, new, inplace=True)
+
+    def interpolate(self, method='pad', axis=0, inplace=False,
+                    limit=None, missing=None):
+        return self._as_object_block().interpolate(method, axis=axis,
+                                                   inplace=True, limit=limit,
+                                                   missing=missing)
+
+    def notnull_counts(self):
+        return (self.values != -1).sum(1)
+
+    def diff(self, n):
+        return self._as_object_block().diff(n)
+
+
+def _codes_dtype(nlevels):
+    """
+    Smallest signed integer dtype holding codes for nlevels levels and -1
+    """
+    for dtype in [np.int8, np.int16, np.int32]:
+        if nlevels < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _categorical_block(cat, items, ref_items):
+    codes = np.asarray(cat.labels).astype(_codes_dtype(len(cat.levels)))
+    return CategoricalBlock(codes.reshape((1, len(codes))), items, ref_items,
+                            levels=cat.levels)
+
+
+class MaskedBlock(object):
+    """
+    Mixin for integer and boolean blocks whose values are a
+    numpy.ma.MaskedArray with missing values masked out. These are produced
+    instead of upcasting to float64 / object when the NA storage policy is
+    'mask' (see set_na_storage). Retrieved items with missing values are
+    materialized in the upcast dtype with NaN for missing values, the others
+    in the dtype of the data
+    """
+    _can_hold_na = True
+
+    @property
+    def dtype(self):
+        return self._na_dtype
+
+    @property
+    def _consolidate_key(self):
+        # kept apart from unmasked blocks, whose items are not upcast
+        return ('masked', self.values.dtype.name)
+
+    def _upcast_dtype(self, values):
+        return self._na_dtype
+
+    def _materialize(self, values, dtype=None):
+        mask = np.ma.getmaskarray(values)
+        data = np.ma.getdata(values)
+        if dtype is None:
+            if not mask.any():
+                return data
+            dtype = self._upcast_dtype(values)
+
+        result = data.astype(dtype)
+        np.putmask(result, mask, np.nan)
+        return result
+
+    def _gi(self, arg):
+        value = self.values[arg]
+        if value is np.ma.masked:
+            return np.nan
+        elif isinstance(value, np.ndarray):
+            return self._materialize(value)
+        return value
+
+    def get(self, item):
+        loc = self.items.get_loc(item)
+        return self._materialize(self.values[loc])
+
+    def get_values(self, dtype):
+        if dtype == self.dtype:
+            return self._materialize(self.values)
+        return self._materialize(self.values, dtype)
+
+    def get_mask(self, item):
+        """
+        Boolean array, True where the item's values are missing
+        """
+        loc = self.items.get_loc(item)
+        return np.ma.getmaskarray(self.values)[loc]
+
+    def should_store(self, value):
+        return False
+
+    def notnull_counts(self):
+        return (~np.ma.getmaskarray(self.values)).sum(1)
+
+    def reduce(self, name):
+        # on the masked data, so integer sums, minima and maxima stay exact
+        result = getattr(np.ma, name)(self.values, axis=1)
+        return self._materialize(np.ma.asarray(result))
+
+    def delete(self, item):
+        loc = self.items.get_loc(item)
+        keep = np.arange(len(self.items)) != loc
+        return make_block(self.values[keep], self.items.delete(loc),
+                          self.ref_items)
+
+    def fillna(self, value, inplace=False):
+        if self._can_hold_element(value):
+            # filling every missing value leaves an unmasked block
+            new_values = self.values.filled(self._try_cast(value))
+            return make_block(new_values, self.items, self.ref_items)
+        return self._as_na_block().fillna(value, inplace=True)
+
+    def _as_na_block(self):
+        values = self._materialize(self.values,
+                                   self._upcast_dtype(self.values))
+        return make_block(values, self.items, self.ref_items)
+
+    def replace(self, to_replace, value, inplace=False):
+        return self._as_na_block().replace(to_replace, value, inplace=True)
+
+    def putmask(self, mask, new, inplace=False):
+        return self._as_na_block().putmask(mask, new, inplace=True)
+
+    def interpolate(self, method='pad', axis=0, inplace=False,
+                    limit=None, missing=None):
+        return self._as_na_block().interpolate(method, axis=axis,
+                                               inplace=True, limit=limit,
+                                               missing=missing)
+
+    def diff(self, n):
+        return self._as_na_block().diff(n)
+
+
+class MaskedIntBlock(MaskedBlock, IntBlock):
+    _na_dtype = np.dtype(np.float64)
+
+    def _upcast_dtype(self, values):
+        # integers beyond 2**53 are not all exact as float64
+        if values.size == 0 or not com.is_integer_dtype(values):
+            return self._na_dtype
+
+        low, high = values.min(), values.max()
+        if low is np.ma.masked or (-_max_exact_int <= low and
+                                   high <= _max_exact_int):
+            return self._na_dtype
+        return np.dtype(object)
+
+
+class MaskedBoolBlock(MaskedBlock, BoolBlock):
+    _na_dtype = np.dtype(object)
+
+    def _can_hold_element(self, element):
+        # filling with 0 / 1 should not give booleans
+        return isinstance(element, (bool, np.bool_))
+
+
+# largest integer up to which all integers are exact as float64
+_max_exact_int = 2 ** 53
+
+
+def _masked_block(values, items, ref_items, keep_mask=False):
+    """
+    Block for a MaskedArray; an integer or boolean block with nothing masked
+    is unmasked unless keep_mask=True
+    """
+    data = np.ma.getdata(values)
+    mask = np.ma.getmaskarray(values)
+
+    if not keep_mask and not mask.any():
+        return make_block(data, items, ref_items)
+
+    values = np.ma.masked_array(data, mask=mask)
+    if com.is_integer_dtype(data):
+        klass = MaskedIntBlock
+    elif data.dtype == np.bool_:
+        klass = MaskedBoolBlock
+    else:
+        return make_block(com._maybe_upcast(values).filled(np.nan), items,
+                          ref_items)
+
+    return klass(values, items, ref_items, ndim=values.ndim)
+
+
+def make_block(values, items, ref_items, levels=None):
+    if isinstance(values, Categorical):
+        return _categorical_block(values, items, ref_items)
+    elif levels is not None:
+        return CategoricalBlock(values, items, ref_items, ndim=values.ndim,
+                                levels=levels)
+    elif isinstance(values, np.ma.MaskedArray):
+        return _masked_block(values, items, ref_items)
+
     dtype = values.dtype
     vtype = dtype.type
 
@@ -464,8 +799,6 @@ def make_block(values, items, ref_items):
     elif issubclass(vtype, np.datetime64):
         klass = DatetimeBlock
     elif issubclass(vtype, np.integer):
-        if vtype != np.int64:
-            values = values.astype('i8')
         klass = IntBlock
     elif dtype == np.bool_:
         klass = BoolBlock
@@ -551,19 +884,29 @@ class BlockManager(object):
         block_values = [b.values for b in self.blocks]
         block_items = [b.items for b in self.blocks]
         axes_array = [ax for ax in self.axes]
-        return axes_array, block_values, block_items
+
+        extra_state = {}
+        block_levels = [getattr(b, 'levels', None) for b in self.blocks]
+        if any(levels is not None for levels in block_levels):
+            extra_state['block_levels'] = block_levels
+
+        return axes_array, block_values, block_items, extra_state
 
     def __setstate__(self, state):
         # discard anything after 3rd, support beta pickling format for a little
         # while longer
         ax_arrays, bvalues, bitems = state[:3]
 
+        block_levels = [None] * len(bvalues)
+        if len(state) > 3 and isinstance(state[3], dict):
+            block_levels = state[3].get('block_levels', block_levels)
+
         self.axes = [_ensure_index(ax) for ax in ax_arrays]
         self.axes = _handle_legacy_indexes(self.axes)
 
         blocks = []
-        for values, items in zip(bvalues, bitems):
-            blk = make_block(values, items, self.axes[0])
+        for values, items, levels in zip(bvalues, bitems, block_levels):
+            blk = make_block(values, items, self.axes[0], levels=levels)
             blocks.append(blk)
         self.blocks = blocks
 
@@ -602,7 +945,8 @@ class BlockManager(object):
     def astype(self, dtype):
         new_blocks = []
         for block in self.blocks:
-            newb = make_block(com._astype_nansafe(block.values, dtype),
+            values = block.get_values(block.dtype)
+            newb = make_block(com._astype_nansafe(values, dtype),
                               block.items, block.ref_items)
             new_blocks.append(newb)
 
@@ -613,8 +957,42 @@ class BlockManager(object):
         """
         Return True if more than one block with the same dtype
         """
-        dtypes = [blk.dtype.type for blk in self.blocks]
-        return len(dtypes) == len(set(dtypes))
+        keys = [blk._consolidate_key for blk in self.blocks]
+        return len(keys) == len(set(keys))
+
+    def memory_usage(self, deep=False, axes=True):
+        """
+        Bytes held by the blocks, and the axes if axes=True. Data shared
+        between blocks or axes is counted once
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return self._memory_usage(deep=deep, axes=axes, seen={})
+
+    def _memory_usage(self, deep=False, axes=True, seen=None):
+        if seen is None:
+            seen = {}
+
+        total = 0
+        if axes:
+            for ax in self.axes:
+                total += ax._memory_usage(deep=deep, seen=seen)
+        for block in self.blocks:
+            total += com._array_memory_usage(block.values, deep=deep,
+                                             seen=seen)
+            if isinstance(block, CategoricalBlock):
+                total += block.levels._memory_usage(deep=deep, seen=seen)
+        return total
+
+    @property
+    def is_mixed_type(self):
+        """
+        Return True if the blocks have more than one dtype, whether or not
+        they are consolidated
+        """
+        return len(set(blk.dtype.type for blk in self.blocks)) > 1
 
     def get_numeric_data(self, copy=False, type_list=None):
         """
@@ -679,8 +1057,8 @@ class BlockManager(object):
             new_items = new_axes[0]
             if len(self.blocks) == 1:
                 blk = self.blocks[0]
-                newb = make_block(blk.values[slobj], new_items,
-                                  new_items)
+                newb = blk.make_block_same_class(blk.values[slobj],
+                                                 new_items, new_items)
                 new_blocks = [newb]
             else:
                 return self.reindex_items(new_items)
@@ -697,11 +1075,93 @@ class BlockManager(object):
         slicer = tuple(slicer)
 
         for block in self.blocks:
-            newb = make_block(block.values[slicer], block.items,
-                              block.ref_items)
+            newb = block.make_block_same_class(block.values[slicer],
+                                               block.items, block.ref_items)
             new_blocks.append(newb)
         return new_blocks
 
+    def is_categorical(self, item):
+        """
+        Return True if item is stored as codes into levels
+        """
+        _, block = self._find_block(item)
+        return isinstance(block, CategoricalBlock)
+
+    def get_categorical(self, item):
+        """
+        Return Categorical sharing the codes of a categorical item
+        """
+        _, block = self._find_block(item)
+        if not isinstance(block, CategoricalBlock):
+            raise TypeError('%s is not categorical' % com.pprint_thing(item))
+        return block.get_categorical(item)
+
+    def decategorize(self, items=None):
+        """
+        Store the categorical blocks holding any of items (all of them by
+        default) as object blocks, so that writes through the values of
+        their items persist. Returns True if a block was converted
+        """
+        converted = False
+        new_blocks = []
+        for block in self.blocks:
+            if isinstance(block, CategoricalBlock) and (
+                    items is None or
+                    any(item in block.items for item in items)):
+                block = block._as_object_block()
+                converted = True
+            new_blocks.append(block)
+
+        if converted:
+            self.blocks = new_blocks
+        return converted
+
+    def is_masked(self, item):
+        """
+        Return True if item is stored with a mask of missing values
+        """
+        _, block = self._find_block(item)
+        return isinstance(block, MaskedBlock)
+
+    def notnull_counts(self):
+        """
+        Number of non-null values of each item, for 2-dimensional data with
+        unique items
+        """
+        result = np.empty(len(self.items), dtype=np.int64)
+        for blk in self.blocks:
+            result[blk.ref_locs] = blk.notnull_counts()
+        return result
+
+    def is_masked_numeric(self):
+        """
+        Return True if the data is held in integer and float blocks only,
+        some of them masked
+        """
+        return (all(isinstance(blk, (IntBlock, FloatBlock))
+                    for blk in self.blocks) and
+                any(isinstance(blk, MaskedBlock) for blk in self.blocks))
+
+    def reduce_blocks(self, name):
+        """
+        sum, mean, min or max of each item skipping missing values, computed
+        block by block so that integer items are not upcast, for
+        2-dimensional data with unique items
+        """
+        results = [blk.reduce(name) for blk in self.blocks]
+        dtype = np.find_common_type([res.dtype for res in results], [])
+        if issubclass(dtype.type, np.floating):
+            # integer results are not rounded to float64
+            for res in results:
+                if not com.is_integer_dtype(res):
+                    continue
+                if ((res > _max_exact_int) | (res < -_max_exact_int)).any():
+                    dtype = np.dtype(object)
+        result = np.empty(len(self.items), dtype=dtype)
+        for blk, res in zip(self.blocks, results):
+            result[blk.ref_locs] = res
+        return result
+
     def get_series_dict(self):
         # For DataFrame
         return _blocks_to_series_dict(self.blocks, self.axes[1])
@@ -738,7 +1198,7 @@ class BlockManager(object):
             blk = self.blocks[0]
             if items is None or blk.items.equals(items):
                 # if not, then just call interleave per below
-                mat = blk.values
+                mat = blk.get_values(blk.dtype)
             else:
                 mat = self.reindex_items(items).as_matrix()
         else:
@@ -807,13 +1267,16 @@ class BlockManager(object):
                 raise Exception('cannot get view of mixed-type or '
                                 'non-consolidated DataFrame')
             for blk in self.blocks:
-                newb = make_block(blk.values[slicer], blk.items, blk.ref_items)
+                newb = blk.make_block_same_class(blk.values[slicer],
+                                                 blk.items, blk.ref_items)
                 new_blocks.append(newb)
         elif len(self.blocks) == 1:
-            vals = self.blocks[0].values[slicer]
+            blk = self.blocks[0]
+            vals = blk.values[slicer]
             if copy:
                 vals = vals.copy()
-            new_blocks = [make_block(vals, self.items, self.items)]
+            new_blocks = [blk.make_block_same_class(vals, self.items,
+                                                    self.items)]
 
         return BlockManager(new_blocks, new_axes)
 
@@ -822,7 +1285,10 @@ class BlockManager(object):
 
         """
         if len(self.blocks) == 1:
-            result = self.blocks[0].values[:, loc]
+            blk = self.blocks[0]
+            if isinstance(blk, (CategoricalBlock, MaskedBlock)):
+                return blk._gi((slice(None), loc))
+            result = blk.values[:, loc]
             if copy:
                 result = result.copy()
             return result
@@ -857,6 +1323,20 @@ class BlockManager(object):
         new_blocks = _consolidate(self.blocks, self.items)
         return BlockManager(new_blocks, self.axes)
 
+    def _maybe_consolidate(self):
+        """
+        Consolidate if the consolidation policy asks for implicit
+        consolidations, otherwise return self
+        """
+        if self.is_consolidated():
+            return self
+
+        if not _want_consolidation(len(self.blocks)):
+            _consolidation_stats['deferred'] += 1
+            return self
+
+        return self.consolidate()
+
     def _consolidate_inplace(self):
         self.blocks = _consolidate(self.blocks, self.items)
 
@@ -916,15 +1396,21 @@ class BlockManager(object):
         Set new item in-place. Does not consolidate. Adds new Block if not
         contained in the current set of items
         """
-        if value.ndim == self.ndim - 1:
-            value = value.reshape((1,) + value.shape)
-        if value.shape[1:] != self.shape[1:]:
-            raise AssertionError('Shape of new values must be compatible '
-                                 'with manager shape')
+        is_categorical = isinstance(value, Categorical)
+        if is_categorical:
+            if (len(value),) != self.shape[1:]:
+                raise AssertionError('Length of Categorical must match '
+                                     'manager shape')
+        else:
+            if value.ndim == self.ndim - 1:
+                value = value.reshape((1,) + value.shape)
+            if value.shape[1:] != self.shape[1:]:
+                raise AssertionError('Shape of new values must be compatible '
+                                     'with manager shape')
 
         def _set_item(item, arr):
             i, block = self._find_block(item)
-            if not block.should_store(value):
+            if is_categorical or not block.should_store(value):
                 # delete from block, create and append new block
                 self._delete_from_block(i, item)
                 self._add_new_block(item, arr, loc=None)
@@ -955,7 +1441,7 @@ class BlockManager(object):
         # new block
         self._add_new_block(item, value, loc=loc)
 
-        if len(self.blocks) > 100:
+        if _want_consolidation(len(self.blocks), on_insert=True):
             self._consolidate_inplace()
 
     def set_items_norename(self, value):
@@ -1068,8 +1554,9 @@ class BlockManager(object):
             new_block_items = new_items.take(selector.nonzero()[0])
             new_values = com.take_fast(blk.values, blk_indexer[selector],
                                        None, False, axis=0)
-            new_blocks.append(make_block(new_values, new_block_items,
-                                         new_items))
+            new_blocks.append(blk.make_block_same_class(new_values,
+                                                        new_block_items,
+                                                        new_items))
 
         if not mask.all():
             na_items = new_items[-mask]
@@ -1147,7 +1634,8 @@ class BlockManager(object):
         for blk in self.blocks:
             new_values = com.take_fast(blk.values, indexer,
                                        None, False, axis=axis)
-            newb = make_block(new_values, blk.items, self.items)
+            newb = blk.make_block_same_class(new_values, blk.items,
+                                             self.items)
             new_blocks.append(newb)
 
         return BlockManager(new_blocks, new_axes)
@@ -1284,7 +1772,7 @@ class BlockManager(object):
         mask = np.zeros(len(self.items), dtype=bool)
         for i, blk in enumerate(self.blocks):
             indexer = self.items.get_indexer(blk.items)
-            result.put(indexer, blk.values.dtype.name)
+            result.put(indexer, blk.dtype.name)
             mask.put(indexer, 1)
         if not (mask.all()):
             raise AssertionError('Some items were not in any block')
@@ -1307,8 +1795,11 @@ def form_blocks(arrays, names, axes):
     bool_items = []
     object_items = []
     datetime_items = []
+    categorical_items = []
     for k, v in zip(names, arrays):
-        if issubclass(v.dtype.type, np.floating):
+        if isinstance(v, Categorical):
+            categorical_items.append((k, v))
+        elif issubclass(v.dtype.type, np.floating):
             float_items.append((k, v))
         elif issubclass(v.dtype.type, np.complexfloating):
             complex_items.append((k, v))
@@ -1329,16 +1820,16 @@ def form_blocks(arrays, names, axes):
 
     blocks = []
     if len(float_items):
-        float_block = _simple_blockify(float_items, items, np.float64)
-        blocks.append(float_block)
+        float_blocks = _multi_blockify(float_items, items)
+        blocks.extend(float_blocks)
 
     if len(complex_items):
-        complex_block = _simple_blockify(complex_items, items, np.complex128)
-        blocks.append(complex_block)
+        complex_blocks = _multi_blockify(complex_items, items)
+        blocks.extend(complex_blocks)
 
     if len(int_items):
-        int_block = _simple_blockify(int_items, items, np.int64)
-        blocks.append(int_block)
+        int_blocks = _multi_blockify(int_items, items)
+        blocks.extend(int_blocks)
 
     if len(datetime_items):
         datetime_block = _simple_blockify(datetime_items, items, _NS_DTYPE)
@@ -1352,6 +1843,9 @@ def form_blocks(arrays, names, axes):
         object_block = _simple_blockify(object_items, items, np.object_)
         blocks.append(object_block)
 
+    for k, v in categorical_items:
+        blocks.append(_categorical_block(v, [k], items))
+
     if len(extra_items):
         shape = (len(extra_items),) + tuple(len(x) for x in axes[1:])
 
@@ -1374,6 +1868,21 @@ def _simple_blockify(tuples, ref_items, dtype):
 
     return make_block(values, block_items, ref_items)
 
+def _multi_blockify(tuples, ref_items):
+    """
+    One block per distinct dtype, so that e.g. float32 and int16 data is not
+    upcast to float64 / int64
+    """
+    get_dtype = lambda x: x[1].dtype.name
+    grouper = itertools.groupby(sorted(tuples, key=get_dtype), get_dtype)
+
+    new_blocks = []
+    for dtype, tup_block in grouper:
+        block = _simple_blockify(list(tup_block), ref_items, np.dtype(dtype))
+        new_blocks.append(block)
+
+    return new_blocks
+
 def _stack_arrays(tuples, ref_items, dtype):
     from pandas.core.series import Series
 
@@ -1412,7 +1921,7 @@ def _blocks_to_series_dict(blocks, index=None):
     series_dict = {}
 
     for block in blocks:
-        for item, vec in zip(block.items, block.values):
+        for item, vec in zip(block.items, block.get_values(block.dtype)):
             series_dict[item] = Series(vec, index=index, name=item)
     return series_dict
 
@@ -1424,8 +1933,12 @@ def _interleaved_dtype(blocks):
 
     have_int = counts[IntBlock] > 0
     have_bool = counts[BoolBlock] > 0
-    have_object = counts[ObjectBlock] > 0
-    have_float = counts[FloatBlock] > 0
+    have_object = (counts[ObjectBlock] > 0 or counts[CategoricalBlock] > 0 or
+                   counts[MaskedBoolBlock] > 0 or
+                   any(isinstance(x, MaskedIntBlock) and
+                       x._upcast_dtype(x.values) == np.object_
+                       for x in blocks))
+    have_float = counts[FloatBlock] > 0 or counts[MaskedIntBlock] > 0
     have_complex = counts[ComplexBlock] > 0
     have_dt64 = counts[DatetimeBlock] > 0
     have_numeric = have_float or have_complex or have_int
@@ -1436,30 +1949,173 @@ def _interleaved_dtype(blocks):
         return np.dtype(object)
     elif have_bool:
         return np.dtype(bool)
-    elif have_int and not have_float and not have_complex:
-        return np.dtype('i8')
     elif have_dt64 and not have_float and not have_complex:
         return np.dtype('M8[ns]')
-    elif have_complex:
-        return np.dtype('c16')
+    elif have_numeric:
+        # smallest dtype holding all the blocks, e.g. float32 and int16 data
+        # interleave to float32 rather than float64
+        return np.find_common_type([x.dtype for x in blocks], [])
     else:
         return np.dtype('f8')
 
+#----------------------------------------------------------------------
+# Consolidation policy
+
+_consolidation_modes = ('eager', 'lazy', 'threshold')
+
+_consolidation_policy = {
+    'mode': 'eager',
+    'max_blocks': 100
+}
+
+_consolidation_stats = {
+    'consolidations': 0,
+    'blocks_merged': 0,
+    'bytes_copied': 0,
+    'deferred': 0
+}
+
+
+def set_consolidation_policy(mode=None, max_blocks=None):
+    """
+    Control when pandas objects implicitly merge blocks of the same dtype
+    ("consolidate") before operating on them. Consolidation copies all the
+    data of the merged blocks, so in latency-sensitive code it can be useful
+    to defer it and call consolidate() at a convenient time instead.
+
+    Parameters
+    ----------
+    mode : {'eager', 'lazy', 'threshold'}, default None
+        eager : consolidate whenever an operation prefers consolidated data
+            (the default). Adding columns one at a time consolidates once
+            there are more than max_blocks blocks
+        lazy : only consolidate on explicit calls to consolidate() and when an
+            operation cannot be done otherwise
+        threshold : consolidate implicitly only when there are more than
+            max_blocks blocks
+    max_blocks : int, default None
+        Block count above which the eager and threshold modes consolidate
+    """
+    if mode is not None:
+        if mode not in _consolidation_modes:
+            raise ValueError('mode must be one of %s, got %s'
+                             % (str(_consolidation_modes), mode))
+        _consolidation_policy['mode'] = mode
+    if max_blocks is not None:
+        _consolidation_policy['max_blocks'] = int(max_blocks)
+
+
+def get_consolidation_policy():
+    """
+    Returns
+    -------
+    policy : dict
+        Current consolidation mode and max_blocks
+    """
+    return dict(_consolidation_policy)
+
+
+def reset_consolidation_policy():
+    set_consolidation_policy(mode='eager', max_blocks=100)
+
+
+def get_consolidation_stats():
+    """
+    Counters for consolidations since the last reset
+
+    Returns
+    -------
+    stats : dict
+        consolidations : number of consolidations which merged blocks
+        blocks_merged : number of blocks merged into others
+        bytes_copied : number of bytes of data copied while merging
+        deferred : number of implicit consolidations skipped by the policy
+    """
+    return dict(_consolidation_stats)
+
+
+def reset_consolidation_stats():
+    for key in _consolidation_stats:
+        _consolidation_stats[key] = 0
+
+
+def _want_consolidation(nblocks, on_insert=False):
+    """
+    Whether an implicit consolidation of a manager with nblocks blocks should
+    happen under the current policy. on_insert is for the check made after
+    adding a new block
+    """
+    mode = _consolidation_policy['mode']
+    if mode == 'lazy':
+        return False
+    elif mode == 'eager' and not on_insert:
+        return True
+    return nblocks > _consolidation_policy['max_blocks']
+
+#----------------------------------------------------------------------
+# Storage of missing values in integer and boolean data
+
+_na_storage_modes = ('upcast', 'mask')
+
+_na_storage_policy = {
+    'mode': 'upcast'
+}
+
+
+def set_na_storage(mode):
+    """
+    Choose how integer and boolean data is stored when reindexing, aligning,
+    shifting, joining or concatenating DataFrames introduces missing values.
+
+    Parameters
+    ----------
+    mode : {'upcast', 'mask'}
+        upcast : convert to float64 (integer) or object (boolean) holding NaN
+            (the default)
+        mask : keep the data in its dtype with a separate boolean mask of
+            missing values (MaskedIntBlock / MaskedBoolBlock). Columns with
+            missing values are still retrieved as float64 / object Series
+            with NaN, as object if integers would not be exact as float64
+    """
+    if mode not in _na_storage_modes:
+        raise ValueError('mode must be one of %s, got %s'
+                         % (str(_na_storage_modes), mode))
+    _na_storage_policy['mode'] = mode
+
+
+def get_na_storage():
+    return _na_storage_policy['mode']
+
+
+def _maskable(block):
+    """
+    Whether missing values introduced into block should be masked rather
+    than upcast
+    """
+    return (_na_storage_policy['mode'] == 'mask' and
+            isinstance(block, (IntBlock, BoolBlock)))
+
+
 def _consolidate(blocks, items):
     """
     Merge blocks having same dtype
     """
-    get_dtype = lambda x: x.dtype.name
+    get_key = lambda x: x._consolidate_key
 
     # sort by dtype
-    grouper = itertools.groupby(sorted(blocks, key=get_dtype),
-                                lambda x: x.dtype)
+    grouper = itertools.groupby(sorted(blocks, key=get_key), get_key)
 
     new_blocks = []
+    merged = False
     for dtype, group_blocks in grouper:
-        new_block = _merge_blocks(list(group_blocks), items)
+        group_blocks = list(group_blocks)
+        merged = merged or len(group_blocks) > 1
+        new_block = _merge_blocks(group_blocks, items)
         new_blocks.append(new_block)
 
+    if merged:
+        _consolidation_stats['consolidations'] += 1
+
     return new_blocks
 
 
@@ -1468,13 +2124,18 @@ def _consolidate(blocks, items):
 def _merge_blocks(blocks, items):
     if len(blocks) == 1:
         return blocks[0]
+    _consolidation_stats['blocks_merged'] += len(blocks) - 1
+    _consolidation_stats['bytes_copied'] += sum(b.values.nbytes
+                                                for b in blocks)
     new_values = _vstack([b.values for b in blocks])
     new_items = blocks[0].items.append([b.items for b in blocks[1:]])
-    new_block = make_block(new_values, new_items, items)
+    new_block = blocks[0].make_block_same_class(new_values, new_items, items)
     return new_block.reindex_items_from(items)
 
 def _vstack(to_stack):
-    if all(x.dtype == _NS_DTYPE for x in to_stack):
+    if any(isinstance(x, np.ma.MaskedArray) for x in to_stack):
+        return np.ma.vstack(to_stack)
+    elif all(x.dtype == _NS_DTYPE for x in to_stack):
         # work around NumPy 1.6 bug
         new_values = np.vstack([x.view('i8') for x in to_stack])
         return new_values.view(_NS_DTYPE)
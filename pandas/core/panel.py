@@ -15,7 +15,7 @@ from pandas.core.index import (Index, MultiIndex, _ensure_index,
 from pandas.core.indexing import _NDFrameIndexer, _maybe_droplevels
 from pandas.core.internals import BlockManager, make_block, form_blocks
 from pandas.core.frame import DataFrame
-from pandas.core.generic import NDFrame
+from pandas.core.generic import NDFrame, _ItemCache
 from pandas.util import py3compat
 from pandas.util.decorators import deprecate, Appender, Substitution
 import pandas.core.common as com
@@ -508,7 +508,7 @@ class Panel(NDFrame):
         return list(self.items)
 
     def _get_values(self):
-        self._consolidate_inplace()
+        self._consolidate_for_values()
         return self._data.as_matrix()
 
     values = property(fget=_get_values)
@@ -631,7 +631,7 @@ class Panel(NDFrame):
             self._unpickle_panel_compat(state)
         else:  # pragma: no cover
             raise ValueError('unrecognized pickle')
-        self._item_cache = {}
+        self._item_cache = _ItemCache()
 
     def _unpickle_panel_compat(self, state):  # pragma: no cover
         "Unpickle the panel"
@@ -372,7 +372,8 @@ def _unstack_frame(obj, level):
         new_blocks = []
         mask_blocks = []
         for blk in obj._data.blocks:
-            bunstacker = _Unstacker(blk.values.T, obj.index, level=level,
+            values = blk.get_values(blk.dtype)
+            bunstacker = _Unstacker(values.T, obj.index, level=level,
                                     value_columns=blk.items)
             new_items = bunstacker.get_new_columns()
             new_values, mask = bunstacker.get_new_values()
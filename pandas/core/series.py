@@ -1076,6 +1076,28 @@ copy : boolean, default False
         """
         return self.view(ndarray)
 
+    def memory_usage(self, deep=False, index=True):
+        """
+        Bytes held by the Series values and, if index=True, the index.
+        Memory shared between the values and the index is counted once
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Include the size of the Python objects in object dtype data
+        index : boolean, default True
+            Include the index
+
+        Returns
+        -------
+        nbytes : int
+        """
+        seen = {}
+        total = com._array_memory_usage(self.values, deep=deep, seen=seen)
+        if index:
+            total += self.index._memory_usage(deep=deep, seen=seen)
+        return total
+
     def copy(self, order='C'):
         """
         Return new Series with copy of underlying values
@@ -2454,8 +2476,8 @@ copy : boolean, default False
         -------
         isin : Series (boolean dtype)
         """
-        value_set = set(values)
-        result = lib.ismember(self.values, value_set)
+        from pandas.core.algorithms import isin
+        result = isin(self.values, values)
         return Series(result, self.index, name=self.name)
 
     def between(self, left, right, inclusive=True):
@@ -6,19 +6,22 @@ Module contains tools for collecting data from various remote sources
 
 import numpy as np
 import datetime as dt
+import os
 import urllib
 import urllib2
+import threading
 import time
 
 from zipfile import ZipFile
 from pandas.util.py3compat import StringIO, BytesIO, bytes_to_str
 
-from pandas import DataFrame, read_csv, concat
+from pandas import DataFrame, Panel, read_csv, concat
 from pandas.io.parsers import TextParser
+import pandas.core.common as com
 
 
 def DataReader(name, data_source=None, start=None, end=None,
-        retry_count=3, pause=0):
+        retry_count=3, pause=0, cache=None, max_workers=4):
     """
     Imports data from a number of online sources.
 
@@ -27,14 +30,19 @@ def DataReader(name, data_source=None, start=None, end=None,
 
     Parameters
     ----------
-    name : str
-        the name of the dataset
+    name : str or list of strs
+        the name of the dataset. A list of Yahoo! symbols or FRED series is
+        fetched concurrently
     data_source: str
         the data source ("yahoo", "fred", or "ff")
     start : {datetime, None}
         left boundary for range (defaults to 1/1/2010)
     end : {datetime, None}
         right boundary for range (defaults to today)
+    cache : DataCache or object with get/set methods, default None
+        Local store of previous responses, consulted before downloading
+    max_workers : int, default 4
+        Number of threads used to fetch a list of names
 
     Examples
     ----------
@@ -42,6 +50,10 @@ def DataReader(name, data_source=None, start=None, end=None,
     # Data from Yahoo!
     gs = DataReader("GS", "yahoo")
 
+    # Several symbols from Yahoo!, fetched in parallel and cached on disk
+    cache = DataCache('~/.pandas_data')
+    panel = DataReader(["GS", "MS"], "yahoo", cache=cache)
+
     # Data from FRED
     vix = DataReader("VIXCLS", "fred")
 
@@ -55,9 +67,11 @@ def DataReader(name, data_source=None, start=None, end=None,
 
     if(data_source == "yahoo"):
         return get_data_yahoo(name=name, start=start, end=end,
-                   retry_count=retry_count, pause=pause)
+                   retry_count=retry_count, pause=pause, cache=cache,
+                   max_workers=max_workers)
     elif(data_source == "fred"):
-        return get_data_fred(name=name, start=start, end=end)
+        return get_data_fred(name=name, start=start, end=end, cache=cache,
+                             max_workers=max_workers)
     elif(data_source == "famafrench"):
         return get_data_famafrench(name=name)
 
@@ -116,12 +130,129 @@ def get_quote_yahoo(symbols):
     return DataFrame(data, index=idx)
 
 
-def get_data_yahoo(name=None, start=None, end=None, retry_count=3, pause=0):
+_yahoo_URL = 'http://ichart.yahoo.com/table.csv?'
+_fred_URL = "http://research.stlouisfed.org/fred2/series/"
+
+
+class DataCache(object):
+    """
+    Directory of previously downloaded data sets, keyed by data source, name
+    and date range. Entries older than expire_after are downloaded again.
+
+    Any object providing get(key) and set(key, data) can be used in its
+    place, key being a (source, name, start, end) tuple.
+
+    Parameters
+    ----------
+    path : string
+        Directory to store the data in, created if it does not exist
+    expire_after : int or timedelta, default None
+        Age (in seconds if an int) after which an entry is stale. None
+        means entries never expire
+    compression : {None, 'gzip', 'bz2', 'xz'}, default None
+        Compression used for the stored files, see pandas.core.common.save
+    """
+    def __init__(self, path, expire_after=None, compression=None):
+        if isinstance(expire_after, dt.timedelta):
+            expire_after = (expire_after.days * 86400 +
+                            expire_after.seconds +
+                            expire_after.microseconds / 1e6)
+
+        self.path = os.path.expanduser(path)
+        self.expire_after = expire_after
+        self.compression = compression
+
+    def __repr__(self):
+        return 'DataCache(%r)' % self.path
+
+    def _get_path(self, key):
+        source, name, start, end = key
+        # strftime does not support years before 1900 on Python 2
+        fname = '%s_%04d%02d%02d_%04d%02d%02d.pickle' % (
+            urllib.quote(str(name), safe=''),
+            start.year, start.month, start.day,
+            end.year, end.month, end.day)
+        return os.path.join(self.path, source, fname)
+
+    def get(self, key):
+        """
+        Return the stored data for key, or None if there is no entry or it
+        has expired
+        """
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return None
+
+        if self.expire_after is not None:
+            age = time.time() - os.path.getmtime(path)
+            if age > self.expire_after:
+                return None
+
+        return com.load(path)
+
+    def set(self, key, data):
+        path = self._get_path(key)
+        dirname = os.path.dirname(path)
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        # write to a temporary file first so concurrent readers never see a
+        # partially written entry
+        tmp_path = '%s.%d.tmp' % (path, threading.current_thread().ident)
+        com.save(data, tmp_path, compression=self.compression)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp_path, path)
+
+    def clear(self):
+        """
+        Remove all stored entries
+        """
+        import shutil
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+
+
+def _cached_get(source, fetcher, name, start, end, cache):
+    if cache is None:
+        return fetcher(name, start, end)
+
+    key = (source, name, start, end)
+    data = cache.get(key)
+    if data is None:
+        data = fetcher(name, start, end)
+        cache.set(key, data)
+    return data
+
+
+def _fetch_many(fetcher, names, max_workers):
+    """
+    Call fetcher for each name using a pool of max_workers threads,
+    returning the results in the order of names
+    """
+    names = list(names)
+    if max_workers is None or max_workers <= 1 or len(names) <= 1:
+        return [fetcher(name) for name in names]
+
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(min(max_workers, len(names)))
+    try:
+        return pool.map(fetcher, names)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def get_data_yahoo(name=None, start=None, end=None, retry_count=3, pause=0,
+                   cache=None, max_workers=4):
     """
     Get historical data for the given name from yahoo.
     Date format is datetime
 
-    Returns a DataFrame.
+    Returns a DataFrame, or a Panel with one item per symbol if a list of
+    names is passed. Multiple symbols are fetched concurrently using
+    max_workers threads, and responses are looked up in / stored to cache if
+    one is given (see DataCache).
     """
     start, end = _sanitize_dates(start, end)
 
@@ -129,9 +260,21 @@ def get_data_yahoo(name=None, start=None, end=None, retry_count=3, pause=0):
         print "Need to provide a name"
         return None
 
-    yahoo_URL = 'http://ichart.yahoo.com/table.csv?'
+    def _get_hist_yahoo(name, start, end):
+        return _fetch_yahoo(name, start, end, retry_count, pause)
+
+    def fetcher(name):
+        return _cached_get('yahoo', _get_hist_yahoo, name, start, end, cache)
+
+    if isinstance(name, (list, tuple)):
+        frames = _fetch_many(fetcher, name, max_workers)
+        return Panel(dict(zip(name, frames)))
+
+    return fetcher(name)
 
-    url = yahoo_URL + 's=%s' % name + \
+
+def _fetch_yahoo(name, start, end, retry_count, pause):
+    url = _yahoo_URL + 's=%s' % name + \
       '&a=%s' % (start.month - 1) + \
       '&b=%s' % start.day + \
       '&c=%s' % start.year + \
@@ -162,12 +305,15 @@ def get_data_yahoo(name=None, start=None, end=None, retry_count=3, pause=0):
 
 
 def get_data_fred(name=None, start=dt.datetime(2010, 1, 1),
-                  end=dt.datetime.today()):
+                  end=dt.datetime.today(), cache=None, max_workers=4):
     """
     Get data for the given name from the St. Louis FED (FRED).
     Date format is datetime
 
-    Returns a DataFrame.
+    Returns a DataFrame, with one column per series if a list of names is
+    passed. Multiple series are fetched concurrently using max_workers
+    threads, and responses are looked up in / stored to cache if one is
+    given (see DataCache).
     """
     start, end = _sanitize_dates(start, end)
 
@@ -175,13 +321,33 @@ def get_data_fred(name=None, start=dt.datetime(2010, 1, 1),
         print "Need to provide a name"
         return None
 
-    fred_URL = "http://research.stlouisfed.org/fred2/series/"
+    def fetcher(name):
+        # the full history is downloaded regardless of the date range, so
+        # cache it once per day and truncate afterwards
+        data = _cached_get('fred', _get_hist_fred, name, _FRED_START,
+                           _today(), cache)
+        return data.truncate(start, end)
+
+    if isinstance(name, (list, tuple)):
+        frames = _fetch_many(fetcher, name, max_workers)
+        return concat(frames, axis=1)
+
+    return fetcher(name)
+
+
+_FRED_START = dt.datetime(1776, 7, 4)
+
+
+def _today():
+    today = dt.date.today()
+    return dt.datetime(today.year, today.month, today.day)
+
 
-    url = fred_URL + '%s' % name + \
+def _get_hist_fred(name, start, end):
+    url = _fred_URL + '%s' % name + \
       '/downloaddata/%s' % name + '.csv'
-    data = read_csv(urllib.urlopen(url), index_col=0, parse_dates=True,
+    return read_csv(urllib.urlopen(url), index_col=0, parse_dates=True,
                     header=None, skiprows=1, names=["DATE", name])
-    return data.truncate(start, end)
 
 
 def get_data_famafrench(name, start=None, end=None):
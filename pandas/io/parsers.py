@@ -1701,7 +1701,7 @@ class ExcelFile(object):
     def parse(self, sheetname, header=0, skiprows=None, skip_footer=0,
               index_col=None, parse_cols=None, parse_dates=False,
               date_parser=None, na_values=None, thousands=None, chunksize=None,
-              **kwds):
+              iterator=False, **kwds):
         """
         Read Excel table into DataFrame
 
@@ -1726,26 +1726,46 @@ class ExcelFile(object):
                 column ranges (e.g. "A:E" or "A,C,E:F")
         na_values : list-like, default None
             List of additional strings to recognize as NA/NaN
+        chunksize : int, default None
+            Return TextParser object for iterating over the sheet in
+            DataFrame chunks of this many rows. Rows are pulled from the
+            workbook lazily, so only one chunk is held in memory at a time
+        iterator : boolean, default False
+            Return TextParser object for lazily reading the sheet with
+            get_chunk
 
         Returns
         -------
-        parsed : DataFrame
+        parsed : DataFrame or TextParser
         """
         skipfooter = kwds.pop('skipfooter', None)
         if skipfooter is not None:
             skip_footer = skipfooter
 
-        choose = {True: self._parse_xlsx,
-                  False: self._parse_xls}
-        return choose[self.use_xlsx](sheetname, header=header,
-                                     skiprows=skiprows, index_col=index_col,
-                                     parse_cols=parse_cols,
-                                     parse_dates=parse_dates,
-                                     date_parser=date_parser,
-                                     na_values=na_values,
-                                     thousands=thousands,
-                                     chunksize=chunksize,
-                                     skip_footer=skip_footer)
+        if self.use_xlsx:
+            rows = self._iter_xlsx_rows(sheetname, parse_cols)
+        else:
+            rows = self._iter_xls_rows(sheetname, parse_cols)
+
+        if header is not None:
+            rows = _trim_excel_header_iter(rows, header)
+
+        if not (chunksize or iterator):
+            rows = list(rows)
+
+        parser = TextParser(rows, header=header, index_col=index_col,
+                            na_values=na_values,
+                            thousands=thousands,
+                            parse_dates=parse_dates,
+                            date_parser=date_parser,
+                            skiprows=skiprows,
+                            skip_footer=skip_footer,
+                            chunksize=chunksize)
+
+        if chunksize or iterator:
+            return parser
+
+        return parser.read()
 
     def _should_parse(self, i, parse_cols):
 
@@ -1779,85 +1799,60 @@ class ExcelFile(object):
         else:
             return i in parse_cols
 
-    def _parse_xlsx(self, sheetname, header=0, skiprows=None,
-                    skip_footer=0, index_col=None,
-                    parse_cols=None, parse_dates=False, date_parser=None,
-                    na_values=None, thousands=None, chunksize=None):
-        sheet = self.book.get_sheet_by_name(name=sheetname)
-        data = []
+    def _get_col_selector(self, parse_cols):
+        """
+        Return a function mapping a raw row to the cells selected by
+        parse_cols. Which columns to keep is decided once per column rather
+        than once per cell
+        """
+        if parse_cols is None:
+            return list
 
-        # it brings a new method: iter_rows()
         should_parse = {}
+        selected = []
 
-        for row in sheet.iter_rows():
-            row_data = []
-            for j, cell in enumerate(row):
-
-                if parse_cols is not None and j not in should_parse:
+        def _select(row):
+            ncols = len(row)
+            if ncols > len(should_parse):
+                for j in range(len(should_parse), ncols):
                     should_parse[j] = self._should_parse(j, parse_cols)
+                    if should_parse[j]:
+                        selected.append(j)
+            return [row[j] for j in selected if j < ncols]
 
-                if parse_cols is None or should_parse[j]:
-                    row_data.append(cell.internal_value)
-            data.append(row_data)
+        return _select
 
-        if header is not None:
-            data[header] = _trim_excel_header(data[header])
-
-        parser = TextParser(data, header=header, index_col=index_col,
-                            na_values=na_values,
-                            thousands=thousands,
-                            parse_dates=parse_dates,
-                            date_parser=date_parser,
-                            skiprows=skiprows,
-                            skip_footer=skip_footer,
-                            chunksize=chunksize)
+    def _iter_xlsx_rows(self, sheetname, parse_cols):
+        # the workbook is opened with the optimized (iterator) reader so cells
+        # are read from the sheet xml as the rows are consumed
+        sheet = self.book.get_sheet_by_name(name=sheetname)
+        select = self._get_col_selector(parse_cols)
 
-        return parser.read()
+        for row in sheet.iter_rows():
+            yield [cell.internal_value for cell in select(row)]
 
-    def _parse_xls(self, sheetname, header=0, skiprows=None,
-                   skip_footer=0, index_col=None,
-                   parse_cols=None, parse_dates=False, date_parser=None,
-                   na_values=None, thousands=None, chunksize=None):
+    def _iter_xls_rows(self, sheetname, parse_cols):
         from xlrd import xldate_as_tuple, XL_CELL_DATE, XL_CELL_ERROR
 
         datemode = self.book.datemode
         sheet = self.book.sheet_by_name(sheetname)
+        select = self._get_col_selector(parse_cols)
 
-        data = []
-        should_parse = {}
-        for i in range(sheet.nrows):
+        for i in xrange(sheet.nrows):
             row = []
-            for j, (value, typ) in enumerate(izip(sheet.row_values(i),
-                                                  sheet.row_types(i))):
-                if parse_cols is not None and j not in should_parse:
-                    should_parse[j] = self._should_parse(j, parse_cols)
-
-                if parse_cols is None or should_parse[j]:
-                    if typ == XL_CELL_DATE:
-                        dt = xldate_as_tuple(value, datemode)
-                        # how to produce this first case?
-                        if dt[0] < datetime.MINYEAR: # pragma: no cover
-                            value = datetime.time(*dt[3:])
-                        else:
-                            value = datetime.datetime(*dt)
-                    if typ == XL_CELL_ERROR:
-                        value = np.nan
-                    row.append(value)
-            data.append(row)
-
-        if header is not None:
-            data[header] = _trim_excel_header(data[header])
-
-        parser = TextParser(data, header=header, index_col=index_col,
-                            na_values=na_values,
-                            thousands=thousands,
-                            parse_dates=parse_dates,
-                            date_parser=date_parser,
-                            skiprows=skiprows,
-                            skip_footer=skip_footer,
-                            chunksize=chunksize)
-
-        return parser.read()
+            for value, typ in select(zip(sheet.row_values(i),
+                                         sheet.row_types(i))):
+                if typ == XL_CELL_DATE:
+                    dt = xldate_as_tuple(value, datemode)
+                    # how to produce this first case?
+                    if dt[0] < datetime.MINYEAR: # pragma: no cover
+                        value = datetime.time(*dt[3:])
+                    else:
+                        value = datetime.datetime(*dt)
+                if typ == XL_CELL_ERROR:
+                    value = np.nan
+                row.append(value)
+            yield row
 
     @property
     def sheet_names(self):
@@ -1874,6 +1869,13 @@ def _trim_excel_header(row):
     return row
 
 
+def _trim_excel_header_iter(rows, header):
+    for i, row in enumerate(rows):
+        if i == header:
+            row = _trim_excel_header(row)
+        yield row
+
+
 class ExcelWriter(object):
     """
     Class for writing DataFrame objects into excel sheets, uses xlwt for xls,
@@ -1926,12 +1928,70 @@ class ExcelWriter(object):
         else:
             self._writerow_xls(row, sheet_name)
 
-    def _writerow_xls(self, row, sheet_name):
+    def writerows(self, rows, sheet_name=None):
+        """
+        Write several rows of native Python values (numbers, bools,
+        datetimes, strings, None for a blank cell) into an excel sheet in one
+        go, without the per-cell numpy type conversion done by writerow
+
+        Parameters
+        ----------
+        rows : iterable of sequences
+            Rows of data to save to Excel sheet
+        sheet_name : string, default None
+            Name of Excel sheet, if None, then use self.cur_sheet
+        """
+        if sheet_name is None:
+            sheet_name = self.cur_sheet
+        if sheet_name is None:  # pragma: no cover
+            raise Exception('Must pass explicit sheet_name or set '
+                            'cur_sheet property')
+        if self.use_xlsx:
+            self._writerows_xlsx(rows, sheet_name)
+        else:
+            self._writerows_xls(rows, sheet_name)
+
+    def _get_sheet(self, sheet_name):
         if sheet_name in self.sheets:
-            sheet, row_idx = self.sheets[sheet_name]
+            return self.sheets[sheet_name]
+
+        if self.use_xlsx:
+            sheet = self.book.create_sheet()
+            sheet.title = sheet_name
         else:
             sheet = self.book.add_sheet(sheet_name)
-            row_idx = 0
+        return sheet, 0
+
+    def _writerows_xls(self, rows, sheet_name):
+        sheet, row_idx = self._get_sheet(sheet_name)
+        fm_datetime = self.fm_datetime
+        fm_date = self.fm_date
+        for row in rows:
+            sheetrow = sheet.row(row_idx)
+            for i, val in enumerate(row):
+                if val is None:
+                    continue
+                elif isinstance(val, datetime.datetime):
+                    sheetrow.write(i, val, fm_datetime)
+                elif isinstance(val, datetime.date):
+                    sheetrow.write(i, val, fm_date)
+                else:
+                    sheetrow.write(i, val)
+            row_idx += 1
+            if row_idx % 1000 == 0:
+                sheet.flush_row_data()
+        self.sheets[sheet_name] = (sheet, row_idx)
+
+    def _writerows_xlsx(self, rows, sheet_name):
+        sheet, row_idx = self._get_sheet(sheet_name)
+        append = sheet.append
+        for row in rows:
+            append(row)
+            row_idx += 1
+        self.sheets[sheet_name] = (sheet, row_idx)
+
+    def _writerow_xls(self, row, sheet_name):
+        sheet, row_idx = self._get_sheet(sheet_name)
         sheetrow = sheet.row(row_idx)
         for i, val in enumerate(row):
             if isinstance(val, (datetime.datetime, datetime.date)):
@@ -1951,12 +2011,7 @@ class ExcelWriter(object):
         self.sheets[sheet_name] = (sheet, row_idx)
 
     def _writerow_xlsx(self, row, sheet_name):
-        if sheet_name in self.sheets:
-            sheet, row_idx = self.sheets[sheet_name]
-        else:
-            sheet = self.book.create_sheet()
-            sheet.title = sheet_name
-            row_idx = 0
+        sheet, row_idx = self._get_sheet(sheet_name)
 
         conv_row = []
         for val in row:
@@ -510,7 +510,19 @@ class HDFStore(object):
         for i in range(nblocks):
             blk = data.blocks[i]
             self._write_index(group, 'block%d_items' % i, blk.items)
-            self._write_array(group, 'block%d_values' % i, blk.values)
+            if isinstance(blk.values, np.ma.MaskedArray):
+                # masked integer / boolean blocks
+                self._write_array(group, 'block%d_values' % i,
+                                  np.ma.getdata(blk.values))
+                self._write_array(group, 'block%d_mask' % i,
+                                  np.ma.getmaskarray(blk.values))
+            else:
+                self._write_array(group, 'block%d_values' % i, blk.values)
+
+            # categorical blocks store codes into levels
+            levels = getattr(blk, 'levels', None)
+            if levels is not None:
+                self._write_index(group, 'block%d_levels' % i, levels)
 
     def _read_block_manager(self, group):
         ndim = group._v_attrs.ndim
@@ -525,7 +537,16 @@ class HDFStore(object):
         for i in range(group._v_attrs.nblocks):
             blk_items = self._read_index(group, 'block%d_items' % i)
             values = _read_array(group, 'block%d_values' % i)
-            blk = make_block(values, blk_items, items)
+
+            if hasattr(group, 'block%d_mask' % i):
+                mask = _read_array(group, 'block%d_mask' % i)
+                values = np.ma.masked_array(values, mask=mask)
+
+            levels = None
+            if hasattr(group, 'block%d_levels' % i):
+                levels = self._read_index(group, 'block%d_levels' % i)
+
+            blk = make_block(values, blk_items, items, levels=levels)
             blocks.append(blk)
 
         return BlockManager(blocks, axes)
@@ -0,0 +1,162 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+import BaseHTTPServer
+import SocketServer
+
+import numpy as np
+
+from pandas import DataFrame, Panel
+import pandas.io.data as web
+import pandas.util.testing as tm
+
+
+_yahoo_csv = """Date,Open,High,Low,Close,Volume,Adj Close
+2012-01-04,%(price)s,2.0,0.5,1.5,100,1.5
+2012-01-03,%(price)s,2.0,0.5,1.5,200,1.5
+"""
+
+_fred_csv = """DATE,VALUE
+2011-12-30,1.0
+2012-01-03,2.0
+2012-01-04,3.0
+"""
+
+
+class _StandInHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Serves canned Yahoo! / FRED responses, counting the requests made
+    """
+    requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        self.lock.acquire()
+        try:
+            self.requests.append(self.path)
+        finally:
+            self.lock.release()
+
+        if self.path.startswith('/yahoo'):
+            symbol = self.path.split('s=')[1].split('&')[0]
+            body = _yahoo_csv % {'price': len(symbol)}
+        else:
+            body = _fred_csv
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ThreadedServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class TestDataReader(unittest.TestCase):
+
+    def setUp(self):
+        _StandInHandler.requests = []
+        self.server = _ThreadedServer(('127.0.0.1', 0), _StandInHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        base = 'http://127.0.0.1:%d' % self.server.server_address[1]
+        self._yahoo_URL = web._yahoo_URL
+        self._fred_URL = web._fred_URL
+        web._yahoo_URL = base + '/yahoo/table.csv?'
+        web._fred_URL = base + '/fred/'
+
+        self.dirpath = tempfile.mkdtemp()
+        self.start = datetime(2012, 1, 1)
+        self.end = datetime(2012, 1, 31)
+
+    def tearDown(self):
+        web._yahoo_URL = self._yahoo_URL
+        web._fred_URL = self._fred_URL
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.dirpath)
+
+    def test_yahoo(self):
+        df = web.DataReader('F', 'yahoo', self.start, self.end)
+        self.assertEqual(len(df), 2)
+        self.assert_(df.index.is_monotonic)
+        self.assertEqual(df['Open'][0], 1)
+
+    def test_yahoo_multiple(self):
+        names = ['F', 'GS', 'AAPL', 'MSFT']
+        result = web.DataReader(names, 'yahoo', self.start, self.end,
+                                max_workers=3)
+        self.assert_(isinstance(result, Panel))
+        self.assertEqual(list(result.items), sorted(names))
+        for name in names:
+            self.assert_((result[name]['Open'] == len(name)).all())
+        self.assertEqual(len(_StandInHandler.requests), 4)
+
+    def test_yahoo_cache(self):
+        cache = web.DataCache(self.dirpath)
+
+        df = web.DataReader('F', 'yahoo', self.start, self.end, cache=cache)
+        self.assertEqual(len(_StandInHandler.requests), 1)
+
+        df2 = web.DataReader('F', 'yahoo', self.start, self.end, cache=cache)
+        self.assertEqual(len(_StandInHandler.requests), 1)
+        tm.assert_frame_equal(df, df2)
+
+        # different date range is a different entry
+        web.DataReader('F', 'yahoo', self.start, datetime(2012, 2, 1),
+                       cache=cache)
+        self.assertEqual(len(_StandInHandler.requests), 2)
+
+        cache.clear()
+        web.DataReader('F', 'yahoo', self.start, self.end, cache=cache)
+        self.assertEqual(len(_StandInHandler.requests), 3)
+
+    def test_cache_expiry(self):
+        cache = web.DataCache(self.dirpath, expire_after=timedelta(hours=1),
+                              compression='gzip')
+        key = ('yahoo', 'F', self.start, self.end)
+        self.assert_(cache.get(key) is None)
+
+        df = DataFrame(np.random.randn(5, 2))
+        cache.set(key, df)
+        tm.assert_frame_equal(cache.get(key), df)
+
+        # age the entry
+        path = cache._get_path(key)
+        stamp = os.path.getmtime(path) - 7200
+        os.utime(path, (stamp, stamp))
+        self.assert_(cache.get(key) is None)
+
+    def test_fred(self):
+        cache = web.DataCache(self.dirpath)
+
+        df = web.DataReader('GDP', 'fred', self.start, self.end, cache=cache)
+        self.assertEqual(list(df.columns), ['GDP'])
+        self.assertEqual(len(df), 2)
+
+        # the full history is cached, so other date ranges are served locally
+        df = web.DataReader('GDP', 'fred', datetime(2011, 1, 1), self.end,
+                            cache=cache)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(len(_StandInHandler.requests), 1)
+
+        result = web.DataReader(['GDP', 'CPI', 'UNRATE'], 'fred',
+                                self.start, self.end, cache=cache)
+        self.assertEqual(list(result.columns), ['GDP', 'CPI', 'UNRATE'])
+        self.assertEqual(len(_StandInHandler.requests), 3)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
+                   exit=False)
@@ -1661,6 +1661,50 @@ eight,1,2,3"""
         tm.assert_frame_equal(df4, df.ix[:-1])
         tm.assert_frame_equal(df4, df5)
 
+    def test_excel_chunksize(self):
+        _skip_if_no_xlrd()
+        _skip_if_no_openpyxl()
+
+        for ext in ['xls', 'xlsx']:
+            pth = os.path.join(self.dirpath, 'test.%s' % ext)
+            xl = ExcelFile(pth)
+            df = xl.parse('Sheet1', index_col=0, parse_dates=True)
+
+            reader = xl.parse('Sheet1', index_col=0, parse_dates=True,
+                              chunksize=2)
+            chunks = list(reader)
+            self.assertEqual(len(chunks), 4)
+            tm.assert_frame_equal(chunks[0], df[:2])
+            tm.assert_frame_equal(chunks[1], df[2:4])
+            tm.assert_frame_equal(chunks[3], df[6:])
+
+            reader = xl.parse('Sheet1', index_col=0, parse_dates=True,
+                              iterator=True)
+            tm.assert_frame_equal(reader.get_chunk(3), df[:3])
+            tm.assert_frame_equal(reader.get_chunk(), df[3:])
+
+    def test_excel_parse_cols(self):
+        _skip_if_no_xlrd()
+        _skip_if_no_openpyxl()
+
+        for ext in ['xls', 'xlsx']:
+            pth = os.path.join(self.dirpath, 'test.%s' % ext)
+            xl = ExcelFile(pth)
+            df = xl.parse('Sheet1', index_col=0, parse_dates=True)
+
+            result = xl.parse('Sheet1', index_col=0, parse_dates=True,
+                              parse_cols=2)
+            tm.assert_frame_equal(result, df.ix[:, :2])
+
+            result = xl.parse('Sheet1', index_col=0, parse_dates=True,
+                              parse_cols='A,C:D')
+            tm.assert_frame_equal(result, df.ix[:, 1:3])
+
+            reader = xl.parse('Sheet1', index_col=0, parse_dates=True,
+                              parse_cols=[0, 2, 3], chunksize=4)
+            result = pd.concat(list(reader))
+            tm.assert_frame_equal(result, df.ix[:, 1:3])
+
     def test_unicode_encoding(self):
         pth = psplit(psplit(curpath())[0])[0]
         pth = os.path.join(pth, 'tests/data/unicode_series.csv')
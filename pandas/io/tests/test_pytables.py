@@ -439,6 +439,31 @@ class TestHDFStore(unittest.TestCase):
             store.close()
             os.remove(self.scratchpath)
 
+    def test_store_categorical(self):
+        from pandas.core.categorical import Categorical
+
+        df = tm.makeDataFrame()
+        df['cat'] = Categorical.from_array(['a', 'b'] * (len(df) // 2))
+
+        self.store['cat'] = df
+        result = self.store['cat']
+        self.assert_(result._data.is_categorical('cat'))
+        tm.assert_frame_equal(result, df)
+
+    def test_store_masked(self):
+        from pandas.core.internals import set_na_storage
+
+        df = DataFrame({'a': np.arange(5), 'b': np.arange(5) > 2})
+        set_na_storage('mask')
+        try:
+            df = df.reindex([0, 2, 7])
+            self.store['masked'] = df
+            result = self.store['masked']
+            self.assert_(result._data.is_masked('a'))
+            tm.assert_frame_equal(result, df)
+        finally:
+            set_na_storage('upcast')
+
     def test_store_mixed(self):
         def _make_one():
             df = tm.makeDataFrame()
@@ -106,7 +106,7 @@ class SparseDataFrame(DataFrame):
     def _data(self):
         return _SparseMockBlockManager(self)
 
-    def _consolidate_inplace(self):
+    def _consolidate_inplace(self, force=False):
         # do nothing when DataFrame calls this method
         pass
 
@@ -98,7 +98,7 @@ class SparsePanel(Panel):
         self.major_axis = major_axis
         self.minor_axis = minor_axis
 
-    def _consolidate_inplace(self):  # pragma: no cover
+    def _consolidate_inplace(self, force=False):  # pragma: no cover
         # do nothing when DataFrame calls this method
         pass
 
@@ -12,6 +12,11 @@ cimport util
 
 import numpy as np
 
+from functools import partial
+from itertools import count
+import threading
+import weakref
+
 import _algos
 
 # include "hashtable.pyx"
@@ -50,6 +55,70 @@ def set_value_at(ndarray arr, object loc, object val):
 # Don't populate hash tables in monotonic indexes larger than this
 _SIZE_CUTOFF = 1000000
 
+# Memory budget for the hash tables of populated engines. When they take
+# more than max_bytes, the oldest populated tables are cleared, to be
+# rebuilt by the next lookup that needs them
+_engine_policy = {'max_bytes': None}
+
+# populated / bytes: engines holding a hash table and the memory of those
+# tables; evictions: tables cleared to honour max_bytes; shared: engines
+# reused by an index viewing the same labels (counted by pandas.core.index)
+_engine_stats = {'populated': 0, 'bytes': 0, 'evictions': 0, 'shared': 0}
+
+# id(engine) -> (population serial, weakref to engine, table bytes)
+_populated_engines = {}
+_engine_serial = count()
+
+# Held while publishing or clearing a hash table and updating the
+# bookkeeping above; tables are built under the lock of their own engine
+_engine_lock = threading.RLock()
+
+
+def _forget_engine(key, ref=None):
+    with _engine_lock:
+        entry = _populated_engines.get(key)
+        if entry is None or (ref is not None and entry[1] is not ref):
+            return
+
+        del _populated_engines[key]
+        _engine_stats['populated'] -= 1
+        _engine_stats['bytes'] -= entry[2]
+
+
+cdef _register_engine(object engine):
+    cdef Py_ssize_t nbytes = engine.mapping.memory_usage()
+
+    key = id(engine)
+    ref = weakref.ref(engine, partial(_forget_engine, key))
+    _populated_engines[key] = (_engine_serial.next(), ref, nbytes)
+    _engine_stats['populated'] += 1
+    _engine_stats['bytes'] += nbytes
+
+    max_bytes = _engine_policy['max_bytes']
+    if max_bytes is not None and _engine_stats['bytes'] > max_bytes:
+        _evict_engines(key, max_bytes)
+
+
+def _evict_engines(keep, max_bytes):
+    """
+    Clear the oldest populated hash tables, other than that of the engine
+    with id keep, until the tables fit in max_bytes
+    """
+    with _engine_lock:
+        entries = sorted(_populated_engines.items(), key=lambda x: x[1][0])
+        for key, (serial, ref, nbytes) in entries:
+            if _engine_stats['bytes'] <= max_bytes:
+                break
+            if key == keep:
+                continue
+
+            engine = ref()
+            if engine is None:
+                _forget_engine(key)
+            else:
+                engine.clear_mapping()
+                _engine_stats['evictions'] += 1
+
 
 cdef class IndexEngine:
 
@@ -60,23 +129,29 @@ cdef class IndexEngine:
 
     cdef:
         bint unique, monotonic
-        bint initialized, monotonic_check, unique_check
+        bint monotonic_check, unique_check
+
+    cdef object __weakref__
+
+    # held while building the hash table, so that threads sharing an index
+    # build it only once
+    cdef object _lock
 
     def __init__(self, vgetter, n):
         self.vgetter = vgetter
+        self._lock = threading.Lock()
 
         self.over_size_threshold = n >= _SIZE_CUTOFF
 
-        self.initialized = 0
         self.monotonic_check = 0
 
         self.unique = 0
         self.monotonic = 0
 
     def __contains__(self, object val):
-        self._ensure_mapping_populated()
+        mapping = self._ensure_mapping_populated()
         hash(val)
-        return val in self.mapping
+        return val in mapping
 
     cpdef get_value(self, ndarray arr, object key):
         '''
@@ -123,14 +198,14 @@ cdef class IndexEngine:
                 raise KeyError(val)
             return loc
 
-        self._ensure_mapping_populated()
+        mapping = self._ensure_mapping_populated()
         if not self.unique:
             return self._get_loc_duplicates(val)
 
         self._check_type(val)
 
         try:
-            return self.mapping.get_item(val)
+            return mapping.get_item(val)
         except TypeError:
             raise KeyError(val)
 
@@ -226,29 +301,51 @@ cdef class IndexEngine:
     cdef _check_type(self, object val):
         hash(val)
 
-    cdef inline _ensure_mapping_populated(self):
-        if not self.initialized:
-            self.initialize()
+    cdef inline HashTable _ensure_mapping_populated(self):
+        # Callers look up in the returned table rather than self.mapping,
+        # which another thread may clear to stay within the memory budget
+        cdef HashTable mapping = self.mapping
+
+        if mapping is None:
+            with self._lock:
+                # populated by another thread while we waited
+                mapping = self.mapping
+                if mapping is None:
+                    mapping = self.initialize()
+
+        return mapping
+
+    cdef HashTable initialize(self):
+        # called with self._lock held; the table is built without the global
+        # lock so that unrelated indexes build theirs concurrently
+        cdef HashTable mapping
 
-    cdef initialize(self):
         values = self._get_index_values()
 
-        self.mapping = self._make_hash_table(len(values))
-        self.mapping.map_locations(values)
+        mapping = self._make_hash_table(len(values))
+        mapping.map_locations(values)
 
-        if len(self.mapping) == len(values):
-            self.unique = 1
-            self.unique_check = 1
+        # set the flags before publishing the table, readers that find the
+        # table do not take the lock
+        self.unique = len(mapping) == len(values)
+        self.unique_check = 1
 
-        self.initialized = 1
+        with _engine_lock:
+            self.mapping = mapping
+            _register_engine(self)
+
+        # the table may already be evicted, the caller still gets to use it
+        return mapping
 
     def clear_mapping(self):
-        self.mapping = None
-        self.initialized = 0
+        with _engine_lock:
+            if self.mapping is not None:
+                _forget_engine(id(self))
+            self.mapping = None
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
-        return self.mapping.lookup(values)
+        mapping = self._ensure_mapping_populated()
+        return mapping.lookup(values)
 
 
 
@@ -407,8 +504,8 @@ cdef class DatetimeEngine(Int64Engine):
             loc = values.searchsorted(conv, side='left')
             return util.get_value_at(values, loc) == conv
 
-        self._ensure_mapping_populated()
-        return _to_i8(val) in self.mapping
+        mapping = self._ensure_mapping_populated()
+        return _to_i8(val) in mapping
 
     cdef _get_index_values(self):
         return self.vgetter().view('i8')
@@ -433,13 +530,13 @@ cdef class DatetimeEngine(Int64Engine):
                 raise KeyError(val)
             return loc
 
-        self._ensure_mapping_populated()
+        mapping = self._ensure_mapping_populated()
         if not self.unique:
             val = _to_i8(val)
             return self._get_loc_duplicates(val)
 
         try:
-            return self.mapping.get_item(val.value)
+            return mapping.get_item(val.value)
         except KeyError:
             raise KeyError(val)
         except AttributeError:
@@ -447,7 +544,7 @@ cdef class DatetimeEngine(Int64Engine):
 
         try:
             val = _to_i8(val)
-            return self.mapping.get_item(val)
+            return mapping.get_item(val)
         except TypeError:
             self._date_check_type(val)
             raise KeyError(val)
@@ -458,11 +555,11 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val)
 
     def get_indexer(self, values):
-        self._ensure_mapping_populated()
+        mapping = self._ensure_mapping_populated()
         if values.dtype != 'M8[ns]':
             return np.repeat(-1, len(values)).astype('i4')
         values = np.asarray(values).view('i8')
-        return self.mapping.lookup(values)
+        return mapping.lookup(values)
 
     def get_pad_indexer(self, other, limit=None):
         if other.dtype != 'M8[ns]':
@@ -44,6 +44,8 @@ import_ufunc()
 
 cdef int PLATFORM_INT = (<ndarray> np.arange(0, dtype=np.int_)).descr.type_num
 
+cdef int64_t iNaT = util.get_nat()
+
 cpdef ensure_platform_int(object arr):
     if util.is_array(arr):
         if (<ndarray> arr).descr.type_num == PLATFORM_INT:
@@ -57,36 +59,56 @@ cpdef ensure_platform_int(object arr):
 
 
 take_1d_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
 def take_1d_%(name)s(ndarray[%(c_type)s] values,
                      ndarray[int64_t] indexer,
                      out=None, fill_value=np.nan):
     cdef:
-        Py_ssize_t i, n, idx
+        Py_ssize_t i, n, idx, nvalues
         ndarray[%(c_type)s] outbuf
         %(c_type)s fv
+        bint na_found = 0, out_of_bounds = 0
 
     n = len(indexer)
+    nvalues = len(values)
 
     if out is None:
         outbuf = np.empty(n, dtype=values.dtype)
     else:
         outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
 
+    # the loops stop at the first index outside [-1, len(values))
     if %(raise_on_na)s and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
 
 """
 
@@ -99,6 +121,7 @@ def take_2d_axis0_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[%(c_type)s, ndim=2] outbuf
         %(c_type)s fv
+        bint na_found = 0
 
     n = len(indexer)
     k = values.shape[1]
@@ -109,24 +132,29 @@ def take_2d_axis0_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         outbuf = out
 
     if %(raise_on_na)s and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
-            else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 """
 
@@ -139,6 +167,7 @@ def take_2d_axis1_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[%(c_type)s, ndim=2] outbuf
         %(c_type)s fv
+        bint na_found = 0
 
     n = len(values)
     k = len(indexer)
@@ -149,26 +178,31 @@ def take_2d_axis1_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         outbuf = out
 
     if %(raise_on_na)s and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        %(nogil)s
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        %(nogil)s
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 """
 
@@ -182,6 +216,7 @@ def take_2d_multi_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[%(c_type)s, ndim=2] outbuf
         %(c_type)s fv
+        bint na_found = 0
 
     n = len(idx0)
     k = len(idx1)
@@ -193,30 +228,38 @@ def take_2d_multi_%(name)s(ndarray[%(c_type)s, ndim=2] values,
 
 
     if %(raise_on_na)s and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        %(nogil)s
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        %(nogil)s
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 """
 
@@ -278,41 +321,42 @@ def backfill_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    %(nogil)s
+        i = nleft - 1
+        j = nright - 1
 
-    cur = old[nleft - 1]
+        cur = old[nleft - 1]
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    while True:
-        if j < 0:
-            break
+        while True:
+            if j < 0:
+                break
 
-        if i == 0:
-            while j >= 0:
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
+
+            prev = old[i - 1]
+
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -343,40 +387,41 @@ def pad_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    %(nogil)s
+        i = j = 0
 
-    cur = old[0]
+        cur = old[0]
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    while True:
-        if j == nright:
-            break
+        while True:
+            if j == nright:
+                break
+
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
+
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -400,16 +445,17 @@ def pad_inplace_%(name)s(ndarray[%(c_type)s] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    %(nogil)s
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 """
 
@@ -431,18 +477,19 @@ def pad_2d_inplace_%(name)s(ndarray[%(c_type)s, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    %(nogil)s
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 """
 
 backfill_2d_template = """@cython.boundscheck(False)
@@ -463,18 +510,19 @@ def backfill_2d_inplace_%(name)s(ndarray[%(c_type)s, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    %(nogil)s
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 """
 
 backfill_1d_template = """@cython.boundscheck(False)
@@ -495,16 +543,17 @@ def backfill_inplace_%(name)s(ndarray[%(c_type)s] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    %(nogil)s
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 """
 
 is_monotonic_template = """@cython.boundscheck(False)
@@ -518,21 +567,26 @@ def is_monotonic_%(name)s(ndarray[%(c_type)s] arr):
     cdef:
         Py_ssize_t i, n
         %(c_type)s prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
     if n < 2:
         return True, True
 
-    prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    %(nogil)s
+        prev = arr[0]
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 """
 
@@ -624,42 +678,42 @@ def left_join_indexer_unique_%(name)s(ndarray[%(c_type)s] left,
     nright = len(right)
 
     indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
 
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    %(nogil)s
+        while True:
+            if i == nleft:
+                break
 
-        rval = right[j]
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            rval = right[j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
             while i < nleft - 1 and left[i] == rval:
                 indexer[i] = j
                 i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
     return indexer
 
 """
 
-# @cython.wraparound(False)
-# @cython.boundscheck(False)
-
-left_join_template = """
+left_join_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
 def left_join_indexer_%(name)s(ndarray[%(c_type)s] left,
                               ndarray[%(c_type)s] right):
     '''
@@ -677,36 +731,37 @@ def left_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     i = 0
     j = 0
     count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                count += nleft - i
-                break
+    %(nogil)s
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    count += nleft - i
+                    break
 
-            lval = left[i]
-            rval = right[j]
+                lval = left[i]
+                rval = right[j]
 
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
                         j += 1
+                        if lval != right[j]:
+                            i += 1
                     else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                j += 1
+                    j += 1
 
     # do it again now that result size is known
 
@@ -717,47 +772,48 @@ def left_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     i = 0
     j = 0
     count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    i += 1
-                    count += 1
-                break
+    %(nogil)s
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        i += 1
+                        count += 1
+                    break
 
-            lval = left[i]
-            rval = right[j]
+                lval = left[i]
+                rval = right[j]
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
                         j += 1
+                        if lval != right[j]:
+                            i += 1
                     else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    count += 1
+                    i += 1
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                count += 1
-                i += 1
-            else:
-                j += 1
+                    j += 1
 
     return result, lindexer, rindexer
 
@@ -783,35 +839,36 @@ def inner_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     i = 0
     j = 0
     count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    %(nogil)s
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
                         j += 1
+                        if lval != right[j]:
+                            i += 1
                     else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
-            else:
-                j += 1
+                    j += 1
 
     # do it again now that result size is known
 
@@ -822,97 +879,139 @@ def inner_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     i = 0
     j = 0
     count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    %(nogil)s
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
                         j += 1
+                        if lval != right[j]:
+                            i += 1
                     else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
-            else:
-                j += 1
+                    j += 1
 
     return result, lindexer, rindexer
 
 """
 
 
-outer_join_template2 = """@cython.wraparound(False)
+setdiff_indexer_template = """@cython.wraparound(False)
 @cython.boundscheck(False)
-def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
-                                ndarray[%(c_type)s] right):
+def setdiff_indexer_%(name)s(ndarray[%(c_type)s] left,
+                            ndarray[%(c_type)s] right):
+    '''
+    Locations of the first occurrence of each value of left not found in
+    right, both monotonic
+    '''
     cdef:
-        Py_ssize_t i, j, nright, nleft, count
-        %(c_type)s lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[%(c_type)s] result
+        Py_ssize_t i, j, nleft, nright, count
+        %(c_type)s lval
+        ndarray[int64_t] indexer
 
     nleft = len(left)
     nright = len(right)
 
+    indexer = np.empty(nleft, dtype=np.int64)
+
     i = 0
     j = 0
     count = 0
-    if nleft == 0:
-        count = nright
-    elif nright == 0:
-        count = nleft
-    else:
-        while True:
-            if i == nleft:
-                count += nright - j
-                break
-            if j == nright:
-                count += nleft - i
-                break
-
+    %(nogil)s
+        while i < nleft:
             lval = left[i]
-            rval = right[j]
-            if lval == rval:
+            if i > 0 and lval == left[i - 1]:
+                i += 1
+                continue
+
+            while j < nright and right[j] < lval:
+                j += 1
+
+            if j == nright or right[j] != lval:
+                indexer[count] = i
                 count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
+            i += 1
+
+    return indexer[:count]
+
+"""
+
+outer_join_template2 = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
+                                ndarray[%(c_type)s] right):
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        %(c_type)s lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[%(c_type)s] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    %(nogil)s
+        if nleft == 0:
+            count = nright
+        elif nright == 0:
+            count = nleft
+        else:
+            while True:
+                if i == nleft:
+                    count += nright - j
+                    break
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
                         j += 1
+                        if lval != right[j]:
+                            i += 1
                     else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                count += 1
-                j += 1
+                    count += 1
+                    j += 1
 
     lindexer = np.empty(count, dtype=np.int64)
     rindexer = np.empty(count, dtype=np.int64)
@@ -923,69 +1022,70 @@ def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
     i = 0
     j = 0
     count = 0
-    if nleft == 0:
-        for j in range(nright):
-            lindexer[j] = -1
-            rindexer[j] = j
-            result[j] = right[j]
-    elif nright == 0:
-        for i in range(nright):
-            lindexer[i] = i
-            rindexer[i] = -1
-            result[i] = left[i]
-    else:
-        while True:
-            if i == nleft:
-                while j < nright:
-                    lindexer[count] = -1
+    %(nogil)s
+        if nleft == 0:
+            for j in range(nright):
+                lindexer[j] = -1
+                rindexer[j] = j
+                result[j] = right[j]
+        elif nright == 0:
+            for i in range(nright):
+                lindexer[i] = i
+                rindexer[i] = -1
+                result[i] = left[i]
+        else:
+            while True:
+                if i == nleft:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        count += 1
+                        j += 1
+                    break
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        count += 1
+                        i += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
                     rindexer[count] = j
-                    result[count] = right[j]
+                    result[count] = lval
                     count += 1
-                    j += 1
-                break
-            if j == nright:
-                while i < nleft:
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
                     lindexer[count] = i
                     rindexer[count] = -1
-                    result[count] = left[i]
+                    result[count] = lval
                     count += 1
                     i += 1
-                break
-
-            lval = left[i]
-            rval = right[j]
-
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                count += 1
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                j += 1
+                    lindexer[count] = -1
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    j += 1
 
     return result, lindexer, rindexer
 
@@ -1089,6 +1189,653 @@ def outer_join_indexer_%(name)s(ndarray[%(c_type)s] left,
 
 """
 
+#----------------------------------------------------------------------
+# Groupby kernels which keep the dtype of the values; float64 data goes
+# through the hand-written kernels in groupby.pyx
+
+group_add_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = sumx[i, j]
+
+"""
+
+group_add_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = sumx[i, j]
+
+"""
+
+group_min_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(%(max_value)s)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = minx[i, j]
+
+"""
+
+group_min_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(%(max_value)s)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = minx[i, j]
+
+"""
+
+group_max_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(%(min_value)s)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = maxx[i, j]
+
+"""
+
+group_max_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(%(min_value)s)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = maxx[i, j]
+
+"""
+
+group_nth_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_nth_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_last_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_last_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = %(na_value)s
+                else:
+                    out[i, j] = resx[i, j]
+
+"""
+
+group_count_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_%(name)s(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[%(c_type)s, ndim=2] values,
+                         ndarray[int64_t] labels):
+    '''
+    Number of values in each group which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+
+    out[:] = 0
+
+    N, K = (<object> values).shape
+
+    %(nogil)s
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    out[lab, j] += 1
+
+"""
+
+group_count_bin_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_%(name)s(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[%(c_type)s, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(c_type)s val
+
+    out[:] = 0
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    %(nogil)s
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if %(notna)s:
+                    out[b, j] += 1
+
+"""
+
+# name, c_type, test for a value that is not NA, value for groups without
+# one (int results of empty groups are upcast by the caller), and the
+# smallest / largest values of the type
+groupby_function_list = [
+    ('float64', 'float64_t', 'val == val', 'NaN', '-np.inf', 'np.inf'),
+    ('float32', 'float32_t', 'val == val', 'NaN', '-np.inf', 'np.inf'),
+    ('int32', 'int32_t', 'True', '0',
+     'np.iinfo(np.int32).min', 'np.iinfo(np.int32).max'),
+    ('int64', 'int64_t', 'True', '0',
+     'np.iinfo(np.int64).min', 'np.iinfo(np.int64).max'),
+    ('datetime64', 'int64_t', 'val != iNaT', 'iNaT',
+     'np.iinfo(np.int64).min', 'np.iinfo(np.int64).max'),
+    ('object', 'object', 'not _checknull(val)', 'NaN', None, None),
+]
+
+# int32 sums are computed in int64, and datetimes cannot be summed
+groupby_templates = [
+    (group_add_template, ['float32', 'int64']),
+    (group_add_bin_template, ['float32', 'int64']),
+    (group_min_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_min_bin_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_max_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_max_bin_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_nth_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_nth_bin_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_last_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_last_bin_template, ['float32', 'int32', 'int64', 'datetime64']),
+    (group_count_template, ['float64', 'float32', 'int32', 'int64',
+                            'datetime64', 'object']),
+    (group_count_bin_template, ['float64', 'float32', 'int32', 'int64',
+                                'datetime64', 'object']),
+]
+
+def generate_groupby_template(template, names):
+    output = StringIO()
+    for (name, c_type, notna, na_value,
+         min_value, max_value) in groupby_function_list:
+        if name not in names:
+            continue
+
+        func = template % {'name': name, 'c_type': c_type,
+                           'notna': notna, 'na_value': na_value,
+                           'min_value': min_value, 'max_value': max_value,
+                           'nogil': ('if True:' if c_type == 'object'
+                                     else 'with nogil:')}
+        output.write(func)
+    return output.getvalue()
+
+group_cum_template = """@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_%(op)s_%(name)s(ndarray[%(c_type)s] out,
+                          ndarray[%(c_type)s] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
+    '''
+    Running %(op)s of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
+    '''
+    cdef:
+        Py_ssize_t i, N, lab
+        %(c_type)s val
+        ndarray[%(c_type)s] accum
+
+    accum = np.empty(ngroups, dtype=np.%(name)s)
+    accum.fill(%(start)s)
+
+    N = len(values)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = %(na_value)s
+                continue
+
+            val = values[i]
+            if %(notna)s:
+                %(update)s
+                out[i] = accum[lab]
+            else:
+                out[i] = %(na_value)s
+
+"""
+
+# running statistic, starting value of the accumulator and its update
+groupby_cum_functions = [
+    ('cumsum', '0', 'accum[lab] += val'),
+    ('cumprod', '1', 'accum[lab] *= val'),
+    ('cummin', '%(max_value)s', 'if val < accum[lab]: accum[lab] = val'),
+    ('cummax', '%(min_value)s', 'if val > accum[lab]: accum[lab] = val'),
+]
+
+def generate_cum_template(op, start, update, names=('float64', 'int64')):
+    output = StringIO()
+    for (name, c_type, notna, na_value,
+         min_value, max_value) in groupby_function_list:
+        if name not in names:
+            continue
+
+        params = {'op': op, 'name': name, 'c_type': c_type, 'notna': notna,
+                  'na_value': na_value, 'update': update,
+                  'min_value': min_value, 'max_value': max_value}
+        params['start'] = start % params
+        output.write(group_cum_template % params)
+    return output.getvalue()
+
 # ensure_dtype functions
 
 ensure_dtype_template = """
@@ -1171,15 +1918,28 @@ function_list = [
     ('bool', 'uint8_t', 'np.bool', False)
 ]
 
-def generate_from_template(template, ndim=1, exclude=None):
+# narrower dtypes which are stored natively in blocks; only the take and
+# fill kernels are generated for these
+small_function_list = [
+    ('float32', 'float32_t', 'np.float32', True),
+    ('int8', 'int8_t', 'np.int8', False),
+    ('int16', 'int16_t', 'np.int16', False)
+]
+
+def generate_from_template(template, ndim=1, exclude=None,
+                           functions=function_list):
     output = StringIO()
-    for name, c_type, dtype, can_hold_na in function_list:
+    for name, c_type, dtype, can_hold_na in functions:
         if exclude is not None and name in exclude:
             continue
 
+        # the numeric kernels release the GIL around their loops; object
+        # arrays need it, so they get a plain block in its place
         func = template % {'name': name, 'c_type': c_type,
                            'dtype': dtype,
-                           'raise_on_na': 'False' if can_hold_na else 'True'}
+                           'raise_on_na': 'False' if can_hold_na else 'True',
+                           'nogil': ('if True:' if c_type == 'object'
+                                     else 'with nogil:')}
         output.write(func)
     return output.getvalue()
 
@@ -1198,12 +1958,19 @@ templates_1d = [map_indices_template,
 nobool_1d_templates = [left_join_unique_template,
                        left_join_template,
                        outer_join_template2,
-                       inner_join_template]
+                       inner_join_template,
+                       setdiff_indexer_template]
 
 templates_2d = [take_2d_axis0_template,
                 take_2d_axis1_template,
                 take_2d_multi_template]
 
+small_templates_1d = [pad_1d_template,
+                      backfill_1d_template,
+                      pad_2d_template,
+                      backfill_2d_template,
+                      take_1d_template]
+
 def generate_take_cython_file(path='generated.pyx'):
     with open(path, 'w') as f:
         print >> f, header
@@ -1216,6 +1983,14 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in templates_2d:
             print >> f, generate_from_template(template, ndim=2)
 
+        for template in small_templates_1d:
+            print >> f, generate_from_template(template,
+                                               functions=small_function_list)
+
+        for template in templates_2d:
+            print >> f, generate_from_template(template, ndim=2,
+                                               functions=small_function_list)
+
         # for template in templates_1d_datetime:
         #     print >> f, generate_from_template_datetime(template)
 
@@ -1225,5 +2000,11 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in nobool_1d_templates:
             print >> f, generate_from_template(template, exclude=['bool'])
 
+        for template, names in groupby_templates:
+            print >> f, generate_groupby_template(template, names)
+
+        for op, start, update in groupby_cum_functions:
+            print >> f, generate_cum_template(op, start, update)
+
 if __name__ == '__main__':
     generate_take_cython_file()
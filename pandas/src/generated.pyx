@@ -41,6 +41,8 @@ import_ufunc()
 
 cdef int PLATFORM_INT = (<ndarray> np.arange(0, dtype=np.int_)).descr.type_num
 
+cdef int64_t iNaT = util.get_nat()
+
 cpdef ensure_platform_int(object arr):
     if util.is_array(arr):
         if (<ndarray> arr).descr.type_num == PLATFORM_INT:
@@ -227,40 +229,41 @@ def pad_float64(ndarray[float64_t] old, ndarray[float64_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
+
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    cur = old[0]
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -288,40 +291,41 @@ def pad_object(ndarray[object] old, ndarray[object] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    if True:
+        i = j = 0
 
-    cur = old[0]
+        cur = old[0]
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
+
+        while True:
+            if j == nright:
+                break
+
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -349,40 +353,41 @@ def pad_int32(ndarray[int32_t] old, ndarray[int32_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
 
-    cur = old[0]
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
+
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
 
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
-
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -410,40 +415,41 @@ def pad_int64(ndarray[int64_t] old, ndarray[int64_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
+
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    cur = old[0]
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
 
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
-
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -471,40 +477,41 @@ def pad_bool(ndarray[uint8_t] old, ndarray[uint8_t] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    with nogil:
+        i = j = 0
+
+        cur = old[0]
+
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    cur = old[0]
+        while True:
+            if j == nright:
+                break
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-    while True:
-        if j == nright:
-            break
+            next = old[i + 1]
 
-        if i == nleft - 1:
-            while j < nright:
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
-
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
 
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -533,41 +540,42 @@ def backfill_float64(ndarray[float64_t] old, ndarray[float64_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
 
-    cur = old[nleft - 1]
+        cur = old[nleft - 1]
+
+        while j >= 0 and new[j] > cur:
+            j -= 1
+
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -595,41 +603,42 @@ def backfill_object(ndarray[object] old, ndarray[object] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    if True:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
 
-    cur = old[nleft - 1]
+        while j >= 0 and new[j] > cur:
+            j -= 1
+
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -657,41 +666,42 @@ def backfill_int32(ndarray[int32_t] old, ndarray[int32_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
+
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    cur = old[nleft - 1]
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
 
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
-
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -719,41 +729,42 @@ def backfill_int64(ndarray[int64_t] old, ndarray[int64_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
+
+        cur = old[nleft - 1]
+
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    cur = old[nleft - 1]
+        while True:
+            if j < 0:
+                break
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-    while True:
-        if j < 0:
-            break
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
 
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
-
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -781,41 +792,42 @@ def backfill_bool(ndarray[uint8_t] old, ndarray[uint8_t] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    with nogil:
+        i = nleft - 1
+        j = nright - 1
 
-    cur = old[nleft - 1]
+        cur = old[nleft - 1]
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+        while j >= 0 and new[j] > cur:
+            j -= 1
+
+        while True:
+            if j < 0:
+                break
 
-    while True:
-        if j < 0:
-            break
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
+
+            prev = old[i - 1]
 
-        if i == 0:
-            while j >= 0:
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
-
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
 
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -838,16 +850,17 @@ def pad_inplace_float64(ndarray[float64_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -867,16 +880,17 @@ def pad_inplace_object(ndarray[object] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    if True:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -896,16 +910,17 @@ def pad_inplace_int32(ndarray[int32_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -925,16 +940,17 @@ def pad_inplace_int64(ndarray[int64_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -954,16 +970,17 @@ def pad_inplace_bool(ndarray[uint8_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 
 @cython.boundscheck(False)
@@ -984,16 +1001,17 @@ def backfill_inplace_float64(ndarray[float64_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_object(ndarray[object] values,
@@ -1012,16 +1030,17 @@ def backfill_inplace_object(ndarray[object] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    if True:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_int32(ndarray[int32_t] values,
@@ -1040,16 +1059,17 @@ def backfill_inplace_int32(ndarray[int32_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_int64(ndarray[int64_t] values,
@@ -1068,16 +1088,17 @@ def backfill_inplace_int64(ndarray[int64_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_inplace_bool(ndarray[uint8_t] values,
@@ -1096,16 +1117,17 @@ def backfill_inplace_bool(ndarray[uint8_t] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1125,18 +1147,19 @@ def pad_2d_inplace_float64(ndarray[float64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_object(ndarray[object, ndim=2] values,
@@ -1155,18 +1178,19 @@ def pad_2d_inplace_object(ndarray[object, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    if True:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
@@ -1185,19 +1209,20 @@ def pad_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
-@cython.boundscheck(False)
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+@cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
                             ndarray[uint8_t, ndim=2] mask,
@@ -1215,18 +1240,19 @@ def pad_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pad_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
@@ -1245,18 +1271,19 @@ def pad_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1276,18 +1303,19 @@ def backfill_2d_inplace_float64(ndarray[float64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_object(ndarray[object, ndim=2] values,
@@ -1306,18 +1334,19 @@ def backfill_2d_inplace_object(ndarray[object, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    if True:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
@@ -1336,18 +1365,19 @@ def backfill_2d_inplace_int32(ndarray[int32_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
@@ -1366,18 +1396,19 @@ def backfill_2d_inplace_int64(ndarray[int64_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def backfill_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
@@ -1396,178 +1427,279 @@ def backfill_2d_inplace_bool(ndarray[uint8_t, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 
 @cython.wraparound(False)
+@cython.boundscheck(False)
 def take_1d_float64(ndarray[float64_t] values,
                      ndarray[int64_t] indexer,
                      out=None, fill_value=np.nan):
     cdef:
-        Py_ssize_t i, n, idx
+        Py_ssize_t i, n, idx, nvalues
         ndarray[float64_t] outbuf
         float64_t fv
+        bint na_found = 0, out_of_bounds = 0
 
     n = len(indexer)
+    nvalues = len(values)
 
     if out is None:
         outbuf = np.empty(n, dtype=values.dtype)
     else:
         outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
 
+    # the loops stop at the first index outside [-1, len(values))
     if False and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
 
 @cython.wraparound(False)
+@cython.boundscheck(False)
 def take_1d_object(ndarray[object] values,
                      ndarray[int64_t] indexer,
                      out=None, fill_value=np.nan):
     cdef:
-        Py_ssize_t i, n, idx
+        Py_ssize_t i, n, idx, nvalues
         ndarray[object] outbuf
         object fv
+        bint na_found = 0, out_of_bounds = 0
 
     n = len(indexer)
+    nvalues = len(values)
 
     if out is None:
         outbuf = np.empty(n, dtype=values.dtype)
     else:
         outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
 
+    # the loops stop at the first index outside [-1, len(values))
     if False and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        if True:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        if True:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
 
 @cython.wraparound(False)
+@cython.boundscheck(False)
 def take_1d_int32(ndarray[int32_t] values,
                      ndarray[int64_t] indexer,
                      out=None, fill_value=np.nan):
     cdef:
-        Py_ssize_t i, n, idx
+        Py_ssize_t i, n, idx, nvalues
         ndarray[int32_t] outbuf
         int32_t fv
+        bint na_found = 0, out_of_bounds = 0
 
     n = len(indexer)
+    nvalues = len(values)
 
     if out is None:
         outbuf = np.empty(n, dtype=values.dtype)
     else:
         outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
 
+    # the loops stop at the first index outside [-1, len(values))
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
 
 @cython.wraparound(False)
+@cython.boundscheck(False)
 def take_1d_int64(ndarray[int64_t] values,
                      ndarray[int64_t] indexer,
                      out=None, fill_value=np.nan):
     cdef:
-        Py_ssize_t i, n, idx
+        Py_ssize_t i, n, idx, nvalues
         ndarray[int64_t] outbuf
         int64_t fv
+        bint na_found = 0, out_of_bounds = 0
 
     n = len(indexer)
+    nvalues = len(values)
 
     if out is None:
         outbuf = np.empty(n, dtype=values.dtype)
     else:
         outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
 
+    # the loops stop at the first index outside [-1, len(values))
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
 
 @cython.wraparound(False)
+@cython.boundscheck(False)
 def take_1d_bool(ndarray[uint8_t] values,
                      ndarray[int64_t] indexer,
                      out=None, fill_value=np.nan):
     cdef:
-        Py_ssize_t i, n, idx
+        Py_ssize_t i, n, idx, nvalues
         ndarray[uint8_t] outbuf
         uint8_t fv
+        bint na_found = 0, out_of_bounds = 0
 
     n = len(indexer)
+    nvalues = len(values)
 
     if out is None:
         outbuf = np.empty(n, dtype=values.dtype)
     else:
         outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
 
+    # the loops stop at the first index outside [-1, len(values))
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
 
 
 @cython.boundscheck(False)
@@ -1581,21 +1713,26 @@ def is_monotonic_float64(ndarray[float64_t] arr):
     cdef:
         Py_ssize_t i, n
         float64_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
     if n < 2:
         return True, True
 
-    prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        prev = arr[0]
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1608,21 +1745,26 @@ def is_monotonic_object(ndarray[object] arr):
     cdef:
         Py_ssize_t i, n
         object prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
     if n < 2:
         return True, True
 
-    prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    if True:
+        prev = arr[0]
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1635,21 +1777,26 @@ def is_monotonic_int32(ndarray[int32_t] arr):
     cdef:
         Py_ssize_t i, n
         int32_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
     if n < 2:
         return True, True
 
-    prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        prev = arr[0]
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1662,21 +1809,26 @@ def is_monotonic_int64(ndarray[int64_t] arr):
     cdef:
         Py_ssize_t i, n
         int64_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
     if n < 2:
         return True, True
 
-    prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        prev = arr[0]
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1689,21 +1841,26 @@ def is_monotonic_bool(ndarray[uint8_t] arr):
     cdef:
         Py_ssize_t i, n
         uint8_t prev, cur
-        bint is_unique = 1
+        bint is_monotonic = 1, is_unique = 1
 
     n = len(arr)
 
     if n < 2:
         return True, True
 
-    prev = arr[0]
-    for i in range(1, n):
-        cur = arr[i]
-        if cur < prev:
-            return False, None
-        elif cur == prev:
-            is_unique = 0
-        prev = cur
+    with nogil:
+        prev = arr[0]
+        for i in range(1, n):
+            cur = arr[i]
+            if cur < prev:
+                is_monotonic = 0
+                break
+            elif cur == prev:
+                is_unique = 0
+            prev = cur
+
+    if not is_monotonic:
+        return False, None
     return True, is_unique
 
 @cython.wraparound(False)
@@ -1917,6 +2074,7 @@ def take_2d_axis0_float64(ndarray[float64_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[float64_t, ndim=2] outbuf
         float64_t fv
+        bint na_found = 0
 
     n = len(indexer)
     k = values.shape[1]
@@ -1927,24 +2085,29 @@ def take_2d_axis0_float64(ndarray[float64_t, ndim=2] values,
         outbuf = out
 
     if False and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
-            else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1955,6 +2118,7 @@ def take_2d_axis0_object(ndarray[object, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[object, ndim=2] outbuf
         object fv
+        bint na_found = 0
 
     n = len(indexer)
     k = values.shape[1]
@@ -1965,24 +2129,29 @@ def take_2d_axis0_object(ndarray[object, ndim=2] values,
         outbuf = out
 
     if False and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
-            else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+        if True:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        if True:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -1993,6 +2162,7 @@ def take_2d_axis0_int32(ndarray[int32_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[int32_t, ndim=2] outbuf
         int32_t fv
+        bint na_found = 0
 
     n = len(indexer)
     k = values.shape[1]
@@ -2003,24 +2173,29 @@ def take_2d_axis0_int32(ndarray[int32_t, ndim=2] values,
         outbuf = out
 
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
-            else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2031,6 +2206,7 @@ def take_2d_axis0_int64(ndarray[int64_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[int64_t, ndim=2] outbuf
         int64_t fv
+        bint na_found = 0
 
     n = len(indexer)
     k = values.shape[1]
@@ -2041,24 +2217,29 @@ def take_2d_axis0_int64(ndarray[int64_t, ndim=2] values,
         outbuf = out
 
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
-            else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2069,6 +2250,7 @@ def take_2d_axis0_bool(ndarray[uint8_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[uint8_t, ndim=2] outbuf
         uint8_t fv
+        bint na_found = 0
 
     n = len(indexer)
     k = values.shape[1]
@@ -2079,24 +2261,29 @@ def take_2d_axis0_bool(ndarray[uint8_t, ndim=2] values,
         outbuf = out
 
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
-            else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
 
 
 @cython.wraparound(False)
@@ -2108,6 +2295,7 @@ def take_2d_axis1_float64(ndarray[float64_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[float64_t, ndim=2] outbuf
         float64_t fv
+        bint na_found = 0
 
     n = len(values)
     k = len(indexer)
@@ -2118,26 +2306,31 @@ def take_2d_axis1_float64(ndarray[float64_t, ndim=2] values,
         outbuf = out
 
     if False and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2148,6 +2341,7 @@ def take_2d_axis1_object(ndarray[object, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[object, ndim=2] outbuf
         object fv
+        bint na_found = 0
 
     n = len(values)
     k = len(indexer)
@@ -2158,26 +2352,31 @@ def take_2d_axis1_object(ndarray[object, ndim=2] values,
         outbuf = out
 
     if False and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        if True:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        if True:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2188,6 +2387,7 @@ def take_2d_axis1_int32(ndarray[int32_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[int32_t, ndim=2] outbuf
         int32_t fv
+        bint na_found = 0
 
     n = len(values)
     k = len(indexer)
@@ -2198,26 +2398,31 @@ def take_2d_axis1_int32(ndarray[int32_t, ndim=2] values,
         outbuf = out
 
     if True and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2228,6 +2433,7 @@ def take_2d_axis1_int64(ndarray[int64_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[int64_t, ndim=2] outbuf
         int64_t fv
+        bint na_found = 0
 
     n = len(values)
     k = len(indexer)
@@ -2238,26 +2444,31 @@ def take_2d_axis1_int64(ndarray[int64_t, ndim=2] values,
         outbuf = out
 
     if True and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2268,6 +2479,7 @@ def take_2d_axis1_bool(ndarray[uint8_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[uint8_t, ndim=2] outbuf
         uint8_t fv
+        bint na_found = 0
 
     n = len(values)
     k = len(indexer)
@@ -2278,26 +2490,31 @@ def take_2d_axis1_bool(ndarray[uint8_t, ndim=2] values,
         outbuf = out
 
     if True and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 
 @cython.wraparound(False)
@@ -2310,6 +2527,7 @@ def take_2d_multi_float64(ndarray[float64_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[float64_t, ndim=2] outbuf
         float64_t fv
+        bint na_found = 0
 
     n = len(idx0)
     k = len(idx1)
@@ -2321,30 +2539,38 @@ def take_2d_multi_float64(ndarray[float64_t, ndim=2] values,
 
 
     if False and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2356,6 +2582,7 @@ def take_2d_multi_object(ndarray[object, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[object, ndim=2] outbuf
         object fv
+        bint na_found = 0
 
     n = len(idx0)
     k = len(idx1)
@@ -2367,30 +2594,38 @@ def take_2d_multi_object(ndarray[object, ndim=2] values,
 
 
     if False and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        if True:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        if True:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2402,6 +2637,7 @@ def take_2d_multi_int32(ndarray[int32_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[int32_t, ndim=2] outbuf
         int32_t fv
+        bint na_found = 0
 
     n = len(idx0)
     k = len(idx1)
@@ -2413,30 +2649,38 @@ def take_2d_multi_int32(ndarray[int32_t, ndim=2] values,
 
 
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2448,6 +2692,7 @@ def take_2d_multi_int64(ndarray[int64_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[int64_t, ndim=2] outbuf
         int64_t fv
+        bint na_found = 0
 
     n = len(idx0)
     k = len(idx1)
@@ -2459,30 +2704,38 @@ def take_2d_multi_int64(ndarray[int64_t, ndim=2] values,
 
 
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -2494,6 +2747,7 @@ def take_2d_multi_bool(ndarray[uint8_t, ndim=2] values,
         Py_ssize_t i, j, k, n, idx
         ndarray[uint8_t, ndim=2] outbuf
         uint8_t fv
+        bint na_found = 0
 
     n = len(idx0)
     k = len(idx1)
@@ -2505,1509 +2759,4962 @@ def take_2d_multi_bool(ndarray[uint8_t, ndim=2] values,
 
 
     if True and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def left_join_indexer_unique_float64(ndarray[float64_t] left,
-                                      ndarray[float64_t] right):
-    cdef:
-        Py_ssize_t i, j, nleft, nright
-        ndarray[int64_t] indexer
-        float64_t lval, rval
+@cython.wraparound(False)
+def pad_inplace_float32(ndarray[float32_t] values,
+                         ndarray[uint8_t, cast=True] mask,
+                         limit=None):
+    cdef Py_ssize_t i, N
+    cdef float32_t val
+    cdef int lim, fill_count = 0
 
-    i = 0
-    j = 0
-    nleft = len(left)
-    nright = len(right)
+    N = len(values)
 
-    indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
 
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
-        rval = right[j]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_inplace_int8(ndarray[int8_t] values,
+                         ndarray[uint8_t, cast=True] mask,
+                         limit=None):
+    cdef Py_ssize_t i, N
+    cdef int8_t val
+    cdef int lim, fill_count = 0
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+    N = len(values)
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
-            while i < nleft - 1 and left[i] == rval:
-                indexer[i] = j
-                i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
-    return indexer
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_inplace_int16(ndarray[int16_t] values,
+                         ndarray[uint8_t, cast=True] mask,
+                         limit=None):
+    cdef Py_ssize_t i, N
+    cdef int16_t val
+    cdef int lim, fill_count = 0
+
+    N = len(values)
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_inplace_float32(ndarray[float32_t] values,
+                              ndarray[uint8_t, cast=True] mask,
+                              limit=None):
+    cdef Py_ssize_t i, N
+    cdef float32_t val
+    cdef int lim, fill_count = 0
+
+    N = len(values)
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_inplace_int8(ndarray[int8_t] values,
+                              ndarray[uint8_t, cast=True] mask,
+                              limit=None):
+    cdef Py_ssize_t i, N
+    cdef int8_t val
+    cdef int lim, fill_count = 0
+
+    N = len(values)
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_inplace_int16(ndarray[int16_t] values,
+                              ndarray[uint8_t, cast=True] mask,
+                              limit=None):
+    cdef Py_ssize_t i, N
+    cdef int16_t val
+    cdef int lim, fill_count = 0
+
+    N = len(values)
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_2d_inplace_float32(ndarray[float32_t, ndim=2] values,
+                            ndarray[uint8_t, ndim=2] mask,
+                            limit=None):
+    cdef Py_ssize_t i, j, N, K
+    cdef float32_t val
+    cdef int lim, fill_count = 0
+
+    K, N = (<object> values).shape
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_2d_inplace_int8(ndarray[int8_t, ndim=2] values,
+                            ndarray[uint8_t, ndim=2] mask,
+                            limit=None):
+    cdef Py_ssize_t i, j, N, K
+    cdef int8_t val
+    cdef int lim, fill_count = 0
+
+    K, N = (<object> values).shape
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pad_2d_inplace_int16(ndarray[int16_t, ndim=2] values,
+                            ndarray[uint8_t, ndim=2] mask,
+                            limit=None):
+    cdef Py_ssize_t i, j, N, K
+    cdef int16_t val
+    cdef int lim, fill_count = 0
+
+    K, N = (<object> values).shape
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_2d_inplace_float32(ndarray[float32_t, ndim=2] values,
+                                 ndarray[uint8_t, ndim=2] mask,
+                                 limit=None):
+    cdef Py_ssize_t i, j, N, K
+    cdef float32_t val
+    cdef int lim, fill_count = 0
+
+    K, N = (<object> values).shape
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_2d_inplace_int8(ndarray[int8_t, ndim=2] values,
+                                 ndarray[uint8_t, ndim=2] mask,
+                                 limit=None):
+    cdef Py_ssize_t i, j, N, K
+    cdef int8_t val
+    cdef int lim, fill_count = 0
+
+    K, N = (<object> values).shape
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def backfill_2d_inplace_int16(ndarray[int16_t, ndim=2] values,
+                                 ndarray[uint8_t, ndim=2] mask,
+                                 limit=None):
+    cdef Py_ssize_t i, j, N, K
+    cdef int16_t val
+    cdef int lim, fill_count = 0
+
+    K, N = (<object> values).shape
+
+    if limit is None:
+        lim = N
+    else:
+        if limit < 0:
+            raise ValueError('Limit must be non-negative')
+        lim = limit
+
+    with nogil:
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_1d_float32(ndarray[float32_t] values,
+                     ndarray[int64_t] indexer,
+                     out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, n, idx, nvalues
+        ndarray[float32_t] outbuf
+        float32_t fv
+        bint na_found = 0, out_of_bounds = 0
+
+    n = len(indexer)
+    nvalues = len(values)
+
+    if out is None:
+        outbuf = np.empty(n, dtype=values.dtype)
+    else:
+        outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
+
+    # the loops stop at the first index outside [-1, len(values))
+    if False and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_1d_int8(ndarray[int8_t] values,
+                     ndarray[int64_t] indexer,
+                     out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, n, idx, nvalues
+        ndarray[int8_t] outbuf
+        int8_t fv
+        bint na_found = 0, out_of_bounds = 0
+
+    n = len(indexer)
+    nvalues = len(values)
+
+    if out is None:
+        outbuf = np.empty(n, dtype=values.dtype)
+    else:
+        outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
+
+    # the loops stop at the first index outside [-1, len(values))
+    if True and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_1d_int16(ndarray[int16_t] values,
+                     ndarray[int64_t] indexer,
+                     out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, n, idx, nvalues
+        ndarray[int16_t] outbuf
+        int16_t fv
+        bint na_found = 0, out_of_bounds = 0
+
+    n = len(indexer)
+    nvalues = len(values)
+
+    if out is None:
+        outbuf = np.empty(n, dtype=values.dtype)
+    else:
+        outbuf = out
+        if len(outbuf) < n:
+            raise ValueError('out is too short for the indexer')
+
+    # the loops stop at the first index outside [-1, len(values))
+    if True and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    na_found = 1
+                    break
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                elif idx < -1 or idx >= nvalues:
+                    out_of_bounds = 1
+                    break
+                else:
+                    outbuf[i] = values[idx]
+
+    if out_of_bounds:
+        raise IndexError('index out of bounds')
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis0_float32(ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] indexer,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[float32_t, ndim=2] outbuf
+        float32_t fv
+        bint na_found = 0
+
+    n = len(indexer)
+    k = values.shape[1]
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+    if False and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis0_int8(ndarray[int8_t, ndim=2] values,
+                           ndarray[int64_t] indexer,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int8_t, ndim=2] outbuf
+        int8_t fv
+        bint na_found = 0
+
+    n = len(indexer)
+    k = values.shape[1]
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+    if True and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis0_int16(ndarray[int16_t, ndim=2] values,
+                           ndarray[int64_t] indexer,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int16_t, ndim=2] outbuf
+        int16_t fv
+        bint na_found = 0
+
+    n = len(indexer)
+    k = values.shape[1]
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+    if True and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis1_float32(ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] indexer,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[float32_t, ndim=2] outbuf
+        float32_t fv
+        bint na_found = 0
+
+    n = len(values)
+    k = len(indexer)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+    if False and _checknan(fill_value):
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis1_int8(ndarray[int8_t, ndim=2] values,
+                           ndarray[int64_t] indexer,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int8_t, ndim=2] outbuf
+        int8_t fv
+        bint na_found = 0
+
+    n = len(values)
+    k = len(indexer)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+    if True and _checknan(fill_value):
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis1_int16(ndarray[int16_t, ndim=2] values,
+                           ndarray[int64_t] indexer,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int16_t, ndim=2] outbuf
+        int16_t fv
+        bint na_found = 0
+
+    n = len(values)
+    k = len(indexer)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+    if True and _checknan(fill_value):
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    if n > 0:
+                        na_found = 1
+                        break
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_multi_float32(ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] idx0,
+                           ndarray[int64_t] idx1,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[float32_t, ndim=2] outbuf
+        float32_t fv
+        bint na_found = 0
+
+    n = len(idx0)
+    k = len(idx1)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+
+    if False and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_multi_int8(ndarray[int8_t, ndim=2] values,
+                           ndarray[int64_t] idx0,
+                           ndarray[int64_t] idx1,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int8_t, ndim=2] outbuf
+        int8_t fv
+        bint na_found = 0
+
+    n = len(idx0)
+    k = len(idx1)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+
+    if True and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_multi_int16(ndarray[int16_t, ndim=2] values,
+                           ndarray[int64_t] idx0,
+                           ndarray[int64_t] idx1,
+                           out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[int16_t, ndim=2] outbuf
+        int16_t fv
+        bint na_found = 0
+
+    n = len(idx0)
+    k = len(idx1)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=values.dtype)
+    else:
+        outbuf = out
+
+
+    if True and _checknan(fill_value):
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    if k > 0:
+                        na_found = 1
+                        break
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            na_found = 1
+                            break
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+                    if na_found:
+                        break
+        if na_found:
+            raise ValueError('No NA values allowed')
+    else:
+        fv = fill_value
+        with nogil:
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_unique_float64(ndarray[float64_t] left,
+                                      ndarray[float64_t] right):
+    cdef:
+        Py_ssize_t i, j, nleft, nright
+        ndarray[int64_t] indexer
+        float64_t lval, rval
+
+    i = 0
+    j = 0
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    with nogil:
+        while True:
+            if i == nleft:
+                break
+
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
+
+            rval = right[j]
+
+            while i < nleft - 1 and left[i] == rval:
+                indexer[i] = j
+                i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_unique_object(ndarray[object] left,
+                                      ndarray[object] right):
+    cdef:
+        Py_ssize_t i, j, nleft, nright
+        ndarray[int64_t] indexer
+        object lval, rval
+
+    i = 0
+    j = 0
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    if True:
+        while True:
+            if i == nleft:
+                break
+
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
+
+            rval = right[j]
+
+            while i < nleft - 1 and left[i] == rval:
+                indexer[i] = j
+                i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_unique_int32(ndarray[int32_t] left,
+                                      ndarray[int32_t] right):
+    cdef:
+        Py_ssize_t i, j, nleft, nright
+        ndarray[int64_t] indexer
+        int32_t lval, rval
+
+    i = 0
+    j = 0
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    with nogil:
+        while True:
+            if i == nleft:
+                break
+
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
+
+            rval = right[j]
+
+            while i < nleft - 1 and left[i] == rval:
+                indexer[i] = j
+                i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_unique_int64(ndarray[int64_t] left,
+                                      ndarray[int64_t] right):
+    cdef:
+        Py_ssize_t i, j, nleft, nright
+        ndarray[int64_t] indexer
+        int64_t lval, rval
+
+    i = 0
+    j = 0
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    with nogil:
+        while True:
+            if i == nleft:
+                break
+
+            if j == nright:
+                indexer[i] = -1
+                i += 1
+                continue
+
+            rval = right[j]
+
+            while i < nleft - 1 and left[i] == rval:
+                indexer[i] = j
+                i += 1
+
+            if left[i] == right[j]:
+                indexer[i] = j
+                i += 1
+                while i < nleft - 1 and left[i] == rval:
+                    indexer[i] = j
+                    i += 1
+                j += 1
+            elif left[i] > rval:
+                indexer[i] = -1
+                j += 1
+            else:
+                indexer[i] = -1
+                i += 1
+    return indexer
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_float64(ndarray[float64_t] left,
+                              ndarray[float64_t] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        float64_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[float64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.float64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        i += 1
+                        count += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_object(ndarray[object] left,
+                              ndarray[object] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        object lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[object] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=object)
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        i += 1
+                        count += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_int32(ndarray[int32_t] left,
+                              ndarray[int32_t] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        int32_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[int32_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int32)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        i += 1
+                        count += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_int64(ndarray[int64_t] left,
+                              ndarray[int64_t] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        int64_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[int64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0:
+            while i < nleft:
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        i += 1
+                        count += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = left[i]
+                    count += 1
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_float64(ndarray[float64_t] left,
+                                ndarray[float64_t] right):
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        float64_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[float64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft == 0:
+            count = nright
+        elif nright == 0:
+            count = nleft
+        else:
+            while True:
+                if i == nleft:
+                    count += nright - j
+                    break
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    count += 1
+                    j += 1
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.float64)
+
+    # do it again, but populate the indexers / result
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft == 0:
+            for j in range(nright):
+                lindexer[j] = -1
+                rindexer[j] = j
+                result[j] = right[j]
+        elif nright == 0:
+            for i in range(nright):
+                lindexer[i] = i
+                rindexer[i] = -1
+                result[i] = left[i]
+        else:
+            while True:
+                if i == nleft:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        count += 1
+                        j += 1
+                    break
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        count += 1
+                        i += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    count += 1
+                    i += 1
+                else:
+                    lindexer[count] = -1
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_object(ndarray[object] left,
+                                ndarray[object] right):
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        object lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[object] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        if nleft == 0:
+            count = nright
+        elif nright == 0:
+            count = nleft
+        else:
+            while True:
+                if i == nleft:
+                    count += nright - j
+                    break
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    count += 1
+                    j += 1
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=object)
+
+    # do it again, but populate the indexers / result
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        if nleft == 0:
+            for j in range(nright):
+                lindexer[j] = -1
+                rindexer[j] = j
+                result[j] = right[j]
+        elif nright == 0:
+            for i in range(nright):
+                lindexer[i] = i
+                rindexer[i] = -1
+                result[i] = left[i]
+        else:
+            while True:
+                if i == nleft:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        count += 1
+                        j += 1
+                    break
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        count += 1
+                        i += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    count += 1
+                    i += 1
+                else:
+                    lindexer[count] = -1
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_int32(ndarray[int32_t] left,
+                                ndarray[int32_t] right):
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int32_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[int32_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft == 0:
+            count = nright
+        elif nright == 0:
+            count = nleft
+        else:
+            while True:
+                if i == nleft:
+                    count += nright - j
+                    break
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    count += 1
+                    j += 1
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int32)
+
+    # do it again, but populate the indexers / result
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft == 0:
+            for j in range(nright):
+                lindexer[j] = -1
+                rindexer[j] = j
+                result[j] = right[j]
+        elif nright == 0:
+            for i in range(nright):
+                lindexer[i] = i
+                rindexer[i] = -1
+                result[i] = left[i]
+        else:
+            while True:
+                if i == nleft:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        count += 1
+                        j += 1
+                    break
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        count += 1
+                        i += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    count += 1
+                    i += 1
+                else:
+                    lindexer[count] = -1
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_int64(ndarray[int64_t] left,
+                                ndarray[int64_t] right):
+    cdef:
+        Py_ssize_t i, j, nright, nleft, count
+        int64_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[int64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft == 0:
+            count = nright
+        elif nright == 0:
+            count = nleft
+        else:
+            while True:
+                if i == nleft:
+                    count += nright - j
+                    break
+                if j == nright:
+                    count += nleft - i
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    count += 1
+                    i += 1
+                else:
+                    count += 1
+                    j += 1
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int64)
+
+    # do it again, but populate the indexers / result
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft == 0:
+            for j in range(nright):
+                lindexer[j] = -1
+                rindexer[j] = j
+                result[j] = right[j]
+        elif nright == 0:
+            for i in range(nright):
+                lindexer[i] = i
+                rindexer[i] = -1
+                result[i] = left[i]
+        else:
+            while True:
+                if i == nleft:
+                    while j < nright:
+                        lindexer[count] = -1
+                        rindexer[count] = j
+                        result[count] = right[j]
+                        count += 1
+                        j += 1
+                    break
+                if j == nright:
+                    while i < nleft:
+                        lindexer[count] = i
+                        rindexer[count] = -1
+                        result[count] = left[i]
+                        count += 1
+                        i += 1
+                    break
+
+                lval = left[i]
+                rval = right[j]
+
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = lval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    lindexer[count] = i
+                    rindexer[count] = -1
+                    result[count] = lval
+                    count += 1
+                    i += 1
+                else:
+                    lindexer[count] = -1
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    j += 1
+
+    return result, lindexer, rindexer
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def inner_join_indexer_float64(ndarray[float64_t] left,
+                              ndarray[float64_t] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        float64_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[float64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.float64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def inner_join_indexer_object(ndarray[object] left,
+                              ndarray[object] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        object lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[object] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=object)
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def inner_join_indexer_int32(ndarray[int32_t] left,
+                              ndarray[int32_t] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        int32_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[int32_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int32)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def inner_join_indexer_int64(ndarray[int64_t] left,
+                              ndarray[int64_t] right):
+    '''
+    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    '''
+    cdef:
+        Py_ssize_t i, j, k, nright, nleft, count
+        int64_t lval, rval
+        ndarray[int64_t] lindexer, rindexer
+        ndarray[int64_t] result
+
+    nleft = len(left)
+    nright = len(right)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    # do it again now that result size is known
+
+    lindexer = np.empty(count, dtype=np.int64)
+    rindexer = np.empty(count, dtype=np.int64)
+    result = np.empty(count, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        if nleft > 0 and nright > 0:
+            while True:
+                if i == nleft:
+                    break
+                if j == nright:
+                    break
+
+                lval = left[i]
+                rval = right[j]
+                if lval == rval:
+                    lindexer[count] = i
+                    rindexer[count] = j
+                    result[count] = rval
+                    count += 1
+                    if i < nleft - 1:
+                        if j < nright - 1 and right[j + 1] == rval:
+                            j += 1
+                        else:
+                            i += 1
+                            if left[i] != rval:
+                                j += 1
+                    elif j < nright - 1:
+                        j += 1
+                        if lval != right[j]:
+                            i += 1
+                    else:
+                        # end of the road
+                        break
+                elif lval < rval:
+                    i += 1
+                else:
+                    j += 1
+
+    return result, lindexer, rindexer
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def setdiff_indexer_float64(ndarray[float64_t] left,
+                            ndarray[float64_t] right):
+    '''
+    Locations of the first occurrence of each value of left not found in
+    right, both monotonic
+    '''
+    cdef:
+        Py_ssize_t i, j, nleft, nright, count
+        float64_t lval
+        ndarray[int64_t] indexer
+
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        while i < nleft:
+            lval = left[i]
+            if i > 0 and lval == left[i - 1]:
+                i += 1
+                continue
+
+            while j < nright and right[j] < lval:
+                j += 1
+
+            if j == nright or right[j] != lval:
+                indexer[count] = i
+                count += 1
+            i += 1
+
+    return indexer[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def setdiff_indexer_object(ndarray[object] left,
+                            ndarray[object] right):
+    '''
+    Locations of the first occurrence of each value of left not found in
+    right, both monotonic
+    '''
+    cdef:
+        Py_ssize_t i, j, nleft, nright, count
+        object lval
+        ndarray[int64_t] indexer
+
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    if True:
+        while i < nleft:
+            lval = left[i]
+            if i > 0 and lval == left[i - 1]:
+                i += 1
+                continue
+
+            while j < nright and right[j] < lval:
+                j += 1
+
+            if j == nright or right[j] != lval:
+                indexer[count] = i
+                count += 1
+            i += 1
+
+    return indexer[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def setdiff_indexer_int32(ndarray[int32_t] left,
+                            ndarray[int32_t] right):
+    '''
+    Locations of the first occurrence of each value of left not found in
+    right, both monotonic
+    '''
+    cdef:
+        Py_ssize_t i, j, nleft, nright, count
+        int32_t lval
+        ndarray[int64_t] indexer
+
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        while i < nleft:
+            lval = left[i]
+            if i > 0 and lval == left[i - 1]:
+                i += 1
+                continue
+
+            while j < nright and right[j] < lval:
+                j += 1
+
+            if j == nright or right[j] != lval:
+                indexer[count] = i
+                count += 1
+            i += 1
+
+    return indexer[:count]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def setdiff_indexer_int64(ndarray[int64_t] left,
+                            ndarray[int64_t] right):
+    '''
+    Locations of the first occurrence of each value of left not found in
+    right, both monotonic
+    '''
+    cdef:
+        Py_ssize_t i, j, nleft, nright, count
+        int64_t lval
+        ndarray[int64_t] indexer
+
+    nleft = len(left)
+    nright = len(right)
+
+    indexer = np.empty(nleft, dtype=np.int64)
+
+    i = 0
+    j = 0
+    count = 0
+    with nogil:
+        while i < nleft:
+            lval = left[i]
+            if i > 0 and lval == left[i - 1]:
+                i += 1
+                continue
+
+            while j < nright and right[j] < lval:
+                j += 1
+
+            if j == nright or right[j] != lval:
+                indexer[count] = i
+                count += 1
+            i += 1
+
+    return indexer[:count]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = sumx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    sumx[lab, j] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = sumx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = sumx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] sumx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    sumx = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    sumx[b, j] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = sumx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_int32(ndarray[int32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int32).max)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_datetime64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    if val < minx[lab, j]:
+                        minx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = minx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_int32(ndarray[int32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int32).max)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = minx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = minx[i, j]
 
+@cython.boundscheck(False)
 @cython.wraparound(False)
+def group_min_bin_datetime64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] minx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    minx = np.empty_like(out)
+    minx.fill(np.iinfo(np.int64).max)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    if val < minx[b, j]:
+                        minx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = minx[i, j]
+
+
 @cython.boundscheck(False)
-def left_join_indexer_unique_object(ndarray[object] left,
-                                      ndarray[object] right):
+@cython.wraparound(False)
+def group_max_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
     cdef:
-        Py_ssize_t i, j, nleft, nright
-        ndarray[int64_t] indexer
-        object lval, rval
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
 
-    i = 0
-    j = 0
-    nleft = len(left)
-    nright = len(right)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
 
-    indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
 
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    N, K = (<object> values).shape
+    ncounts = len(counts)
 
-        rval = right[j]
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_int32(ndarray[int32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int32_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(np.iinfo(np.int32).min)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(np.iinfo(np.int64).min)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_datetime64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(np.iinfo(np.int64).min)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    if val > maxx[lab, j]:
+                        maxx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = maxx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_int32(ndarray[int32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int32_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(np.iinfo(np.int32).min)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(np.iinfo(np.int64).min)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = maxx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_datetime64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] maxx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+
+    maxx = np.empty_like(out)
+    maxx.fill(np.iinfo(np.int64).min)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    if val > maxx[b, j]:
+                        maxx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = maxx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_int32(ndarray[int32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int32_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_int64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_datetime64(ndarray[int64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[int64_t, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_float32(ndarray[float32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[float32_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_int32(ndarray[int32_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int32_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_int64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_datetime64(ndarray[int64_t, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[int64_t, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] < rank:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
-            while i < nleft - 1 and left[i] == rval:
-                indexer[i] = j
-                i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
-    return indexer
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def left_join_indexer_unique_int32(ndarray[int32_t] left,
-                                      ndarray[int32_t] right):
+@cython.wraparound(False)
+def group_last_float32(ndarray[float32_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[float32_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
     cdef:
-        Py_ssize_t i, j, nleft, nright
-        ndarray[int64_t] indexer
-        int32_t lval, rval
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    i = 0
-    j = 0
-    nleft = len(left)
-    nright = len(right)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
+    N, K = (<object> values).shape
+    ncounts = len(counts)
 
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-        rval = right[j]
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+                if val == val:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
-            while i < nleft - 1 and left[i] == rval:
-                indexer[i] = j
-                i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
-    return indexer
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
+                else:
+                    out[i, j] = resx[i, j]
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def left_join_indexer_unique_int64(ndarray[int64_t] left,
-                                      ndarray[int64_t] right):
+@cython.wraparound(False)
+def group_last_int32(ndarray[int32_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[int32_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
     cdef:
-        Py_ssize_t i, j, nleft, nright
-        ndarray[int64_t] indexer
-        int64_t lval, rval
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    i = 0
-    j = 0
-    nleft = len(left)
-    nright = len(right)
-
-    indexer = np.empty(nleft, dtype=np.int64)
-    while True:
-        if i == nleft:
-            break
-
-        if j == nright:
-            indexer[i] = -1
-            i += 1
-            continue
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-        rval = right[j]
+    N, K = (<object> values).shape
+    ncounts = len(counts)
 
-        while i < nleft - 1 and left[i] == rval:
-            indexer[i] = j
-            i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-        if left[i] == right[j]:
-            indexer[i] = j
-            i += 1
-            while i < nleft - 1 and left[i] == rval:
-                indexer[i] = j
-                i += 1
-            j += 1
-        elif left[i] > rval:
-            indexer[i] = -1
-            j += 1
-        else:
-            indexer[i] = -1
-            i += 1
-    return indexer
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
+                if True:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
 
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = resx[i, j]
 
-def left_join_indexer_float64(ndarray[float64_t] left,
-                              ndarray[float64_t] right):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_int64(ndarray[int64_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[int64_t, ndim=2] values,
+                        ndarray[int64_t] labels):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        float64_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[float64_t] result
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    nleft = len(left)
-    nright = len(right)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                count += nleft - i
-                break
+    N, K = (<object> values).shape
+    ncounts = len(counts)
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                j += 1
+                    out[i, j] = resx[i, j]
 
-    # do it again now that result size is known
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_datetime64(ndarray[int64_t, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[int64_t, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.float64)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    i += 1
-                    count += 1
-                break
+    N, K = (<object> values).shape
+    ncounts = len(counts)
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                count += 1
-                i += 1
-            else:
-                j += 1
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    return result, lindexer, rindexer
+                if val != iNaT:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
 
 
-def left_join_indexer_object(ndarray[object] left,
-                              ndarray[object] right):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_float32(ndarray[float32_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[float32_t, ndim=2] values,
+                            ndarray[int64_t] bins):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        object lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[object] result
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    nleft = len(left)
-    nright = len(right)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                count += nleft - i
-                break
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val == val:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = NaN
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                j += 1
+                    out[i, j] = resx[i, j]
 
-    # do it again now that result size is known
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_int32(ndarray[int32_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[int32_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+        ndarray[int32_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=object)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    i += 1
-                    count += 1
-                break
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                count += 1
-                i += 1
-            else:
-                j += 1
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    return result, lindexer, rindexer
+                if True:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
 
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = resx[i, j]
 
-def left_join_indexer_int32(ndarray[int32_t] left,
-                              ndarray[int32_t] right):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_int64(ndarray[int64_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[int64_t, ndim=2] values,
+                            ndarray[int64_t] bins):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        int32_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[int32_t] result
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    nleft = len(left)
-    nright = len(right)
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                count += nleft - i
-                break
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = 0
                 else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                j += 1
+                    out[i, j] = resx[i, j]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_datetime64(ndarray[int64_t, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[int64_t, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+        ndarray[int64_t, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
 
-    # do it again now that result size is known
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int32)
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    i += 1
-                    count += 1
-                break
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            lval = left[i]
-            rval = right[j]
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                count += 1
-                i += 1
-            else:
-                j += 1
+                if val != iNaT:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
 
-    return result, lindexer, rindexer
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = iNaT
+                else:
+                    out[i, j] = resx[i, j]
 
 
-def left_join_indexer_int64(ndarray[int64_t] left,
-                              ndarray[int64_t] right):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_float64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[float64_t, ndim=2] values,
+                         ndarray[int64_t] labels):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Number of values in each group which are not NA, axis=0 only
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        int64_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[int64_t] result
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
 
-    nleft = len(left)
-    nright = len(right)
+    out[:] = 0
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                count += nleft - i
-                break
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                j += 1
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    # do it again now that result size is known
+                if val == val:
+                    out[lab, j] += 1
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int64)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_float32(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[float32_t, ndim=2] values,
+                         ndarray[int64_t] labels):
+    '''
+    Number of values in each group which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0:
-        while i < nleft:
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    i += 1
-                    count += 1
-                break
+    out[:] = 0
 
-            lval = left[i]
-            rval = right[j]
+    N, K = (<object> values).shape
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = left[i]
-                count += 1
-                i += 1
-            else:
-                j += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-    return result, lindexer, rindexer
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
+                if val == val:
+                    out[lab, j] += 1
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def outer_join_indexer_float64(ndarray[float64_t] left,
-                                ndarray[float64_t] right):
+@cython.wraparound(False)
+def group_count_int32(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[int32_t, ndim=2] values,
+                         ndarray[int64_t] labels):
+    '''
+    Number of values in each group which are not NA, axis=0 only
+    '''
     cdef:
-        Py_ssize_t i, j, nright, nleft, count
-        float64_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[float64_t] result
+        Py_ssize_t i, j, N, K, lab
+        int32_t val
 
-    nleft = len(left)
-    nright = len(right)
+    out[:] = 0
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        count = nright
-    elif nright == 0:
-        count = nleft
-    else:
-        while True:
-            if i == nleft:
-                count += nright - j
-                break
-            if j == nright:
-                count += nleft - i
-                break
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                count += 1
-                j += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.float64)
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    # do it again, but populate the indexers / result
+                if True:
+                    out[lab, j] += 1
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        for j in range(nright):
-            lindexer[j] = -1
-            rindexer[j] = j
-            result[j] = right[j]
-    elif nright == 0:
-        for i in range(nright):
-            lindexer[i] = i
-            rindexer[i] = -1
-            result[i] = left[i]
-    else:
-        while True:
-            if i == nleft:
-                while j < nright:
-                    lindexer[count] = -1
-                    rindexer[count] = j
-                    result[count] = right[j]
-                    count += 1
-                    j += 1
-                break
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    count += 1
-                    i += 1
-                break
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_int64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[int64_t, ndim=2] values,
+                         ndarray[int64_t] labels):
+    '''
+    Number of values in each group which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
 
-            lval = left[i]
-            rval = right[j]
+    out[:] = 0
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                count += 1
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                j += 1
+    N, K = (<object> values).shape
 
-    return result, lindexer, rindexer
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    out[lab, j] += 1
+
+@cython.boundscheck(False)
 @cython.wraparound(False)
+def group_count_datetime64(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[int64_t, ndim=2] values,
+                         ndarray[int64_t] labels):
+    '''
+    Number of values in each group which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+
+    out[:] = 0
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if val != iNaT:
+                    out[lab, j] += 1
+
 @cython.boundscheck(False)
-def outer_join_indexer_object(ndarray[object] left,
-                                ndarray[object] right):
+@cython.wraparound(False)
+def group_count_object(ndarray[int64_t, ndim=2] out,
+                         ndarray[int64_t] counts,
+                         ndarray[object, ndim=2] values,
+                         ndarray[int64_t] labels):
+    '''
+    Number of values in each group which are not NA, axis=0 only
+    '''
     cdef:
-        Py_ssize_t i, j, nright, nleft, count
-        object lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[object] result
+        Py_ssize_t i, j, N, K, lab
+        object val
 
-    nleft = len(left)
-    nright = len(right)
+    out[:] = 0
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        count = nright
-    elif nright == 0:
-        count = nleft
-    else:
-        while True:
-            if i == nleft:
-                count += nright - j
-                break
-            if j == nright:
-                count += nleft - i
-                break
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                count += 1
-                j += 1
+    if True:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=object)
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if not _checknull(val):
+                    out[lab, j] += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_float64(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[float64_t, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val
 
-    # do it again, but populate the indexers / result
+    out[:] = 0
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        for j in range(nright):
-            lindexer[j] = -1
-            rindexer[j] = j
-            result[j] = right[j]
-    elif nright == 0:
-        for i in range(nright):
-            lindexer[i] = i
-            rindexer[i] = -1
-            result[i] = left[i]
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
-        while True:
-            if i == nleft:
-                while j < nright:
-                    lindexer[count] = -1
-                    rindexer[count] = j
-                    result[count] = right[j]
-                    count += 1
-                    j += 1
-                break
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    count += 1
-                    i += 1
-                break
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                count += 1
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                j += 1
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    return result, lindexer, rindexer
+                if val == val:
+                    out[b, j] += 1
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def outer_join_indexer_int32(ndarray[int32_t] left,
-                                ndarray[int32_t] right):
+@cython.wraparound(False)
+def group_count_bin_float32(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[float32_t, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
     cdef:
-        Py_ssize_t i, j, nright, nleft, count
-        int32_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[int32_t] result
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
 
-    nleft = len(left)
-    nright = len(right)
+    out[:] = 0
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        count = nright
-    elif nright == 0:
-        count = nleft
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
-        while True:
-            if i == nleft:
-                count += nright - j
-                break
-            if j == nright:
-                count += nleft - i
-                break
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                count += 1
-                j += 1
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int32)
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    # do it again, but populate the indexers / result
+                if val == val:
+                    out[b, j] += 1
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        for j in range(nright):
-            lindexer[j] = -1
-            rindexer[j] = j
-            result[j] = right[j]
-    elif nright == 0:
-        for i in range(nright):
-            lindexer[i] = i
-            rindexer[i] = -1
-            result[i] = left[i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_int32(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[int32_t, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int32_t val
+
+    out[:] = 0
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
-        while True:
-            if i == nleft:
-                while j < nright:
-                    lindexer[count] = -1
-                    rindexer[count] = j
-                    result[count] = right[j]
-                    count += 1
-                    j += 1
-                break
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    count += 1
-                    i += 1
-                break
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                count += 1
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                j += 1
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    return result, lindexer, rindexer
+                if True:
+                    out[b, j] += 1
 
+@cython.boundscheck(False)
 @cython.wraparound(False)
+def group_count_bin_int64(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[int64_t, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
+
+    out[:] = 0
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                if True:
+                    out[b, j] += 1
+
 @cython.boundscheck(False)
-def outer_join_indexer_int64(ndarray[int64_t] left,
-                                ndarray[int64_t] right):
+@cython.wraparound(False)
+def group_count_bin_datetime64(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[int64_t, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
     cdef:
-        Py_ssize_t i, j, nright, nleft, count
-        int64_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[int64_t] result
+        Py_ssize_t i, j, N, K, ngroups, b
+        int64_t val
 
-    nleft = len(left)
-    nright = len(right)
+    out[:] = 0
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        count = nright
-    elif nright == 0:
-        count = nleft
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
-        while True:
-            if i == nleft:
-                count += nright - j
-                break
-            if j == nright:
-                count += nleft - i
-                break
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                count += 1
-                i += 1
-            else:
-                count += 1
-                j += 1
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int64)
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    # do it again, but populate the indexers / result
+                if val != iNaT:
+                    out[b, j] += 1
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft == 0:
-        for j in range(nright):
-            lindexer[j] = -1
-            rindexer[j] = j
-            result[j] = right[j]
-    elif nright == 0:
-        for i in range(nright):
-            lindexer[i] = i
-            rindexer[i] = -1
-            result[i] = left[i]
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_count_bin_object(ndarray[int64_t, ndim=2] out,
+                             ndarray[int64_t] counts,
+                             ndarray[object, ndim=2] values,
+                             ndarray[int64_t] bins):
+    '''
+    Number of values in each bin which are not NA, axis=0 only
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        object val
+
+    out[:] = 0
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
     else:
-        while True:
-            if i == nleft:
-                while j < nright:
-                    lindexer[count] = -1
-                    rindexer[count] = j
-                    result[count] = right[j]
-                    count += 1
-                    j += 1
-                break
-            if j == nright:
-                while i < nleft:
-                    lindexer[count] = i
-                    rindexer[count] = -1
-                    result[count] = left[i]
-                    count += 1
-                    i += 1
-                break
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
 
-            lval = left[i]
-            rval = right[j]
+    if True:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
 
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = lval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                lindexer[count] = i
-                rindexer[count] = -1
-                result[count] = lval
-                count += 1
-                i += 1
-            else:
-                lindexer[count] = -1
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                j += 1
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
 
-    return result, lindexer, rindexer
+                if not _checknull(val):
+                    out[b, j] += 1
 
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def inner_join_indexer_float64(ndarray[float64_t] left,
-                              ndarray[float64_t] right):
+@cython.wraparound(False)
+def group_cumsum_float64(ndarray[float64_t] out,
+                          ndarray[float64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Running cumsum of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        float64_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[float64_t] result
+        Py_ssize_t i, N, lab
+        float64_t val
+        ndarray[float64_t] accum
 
-    nleft = len(left)
-    nright = len(right)
+    accum = np.empty(ngroups, dtype=np.float64)
+    accum.fill(0)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = NaN
+                continue
+
+            val = values[i]
+            if val == val:
+                accum[lab] += val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = NaN
 
-    # do it again now that result size is known
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumsum_int64(ndarray[int64_t] out,
+                          ndarray[int64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
+    '''
+    Running cumsum of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
+    '''
+    cdef:
+        Py_ssize_t i, N, lab
+        int64_t val
+        ndarray[int64_t] accum
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.float64)
+    accum = np.empty(ngroups, dtype=np.int64)
+    accum.fill(0)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = 0
+                continue
+
+            val = values[i]
+            if True:
+                accum[lab] += val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = 0
 
-    return result, lindexer, rindexer
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def inner_join_indexer_object(ndarray[object] left,
-                              ndarray[object] right):
+@cython.wraparound(False)
+def group_cumprod_float64(ndarray[float64_t] out,
+                          ndarray[float64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Running cumprod of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        object lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[object] result
+        Py_ssize_t i, N, lab
+        float64_t val
+        ndarray[float64_t] accum
 
-    nleft = len(left)
-    nright = len(right)
+    accum = np.empty(ngroups, dtype=np.float64)
+    accum.fill(1)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = NaN
+                continue
+
+            val = values[i]
+            if val == val:
+                accum[lab] *= val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = NaN
 
-    # do it again now that result size is known
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cumprod_int64(ndarray[int64_t] out,
+                          ndarray[int64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
+    '''
+    Running cumprod of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
+    '''
+    cdef:
+        Py_ssize_t i, N, lab
+        int64_t val
+        ndarray[int64_t] accum
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=object)
+    accum = np.empty(ngroups, dtype=np.int64)
+    accum.fill(1)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = 0
+                continue
+
+            val = values[i]
+            if True:
+                accum[lab] *= val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = 0
 
-    return result, lindexer, rindexer
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def inner_join_indexer_int32(ndarray[int32_t] left,
-                              ndarray[int32_t] right):
+@cython.wraparound(False)
+def group_cummin_float64(ndarray[float64_t] out,
+                          ndarray[float64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Running cummin of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        int32_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[int32_t] result
+        Py_ssize_t i, N, lab
+        float64_t val
+        ndarray[float64_t] accum
 
-    nleft = len(left)
-    nright = len(right)
+    accum = np.empty(ngroups, dtype=np.float64)
+    accum.fill(np.inf)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = NaN
+                continue
+
+            val = values[i]
+            if val == val:
+                if val < accum[lab]: accum[lab] = val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = NaN
 
-    # do it again now that result size is known
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummin_int64(ndarray[int64_t] out,
+                          ndarray[int64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
+    '''
+    Running cummin of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
+    '''
+    cdef:
+        Py_ssize_t i, N, lab
+        int64_t val
+        ndarray[int64_t] accum
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int32)
+    accum = np.empty(ngroups, dtype=np.int64)
+    accum.fill(np.iinfo(np.int64).max)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = 0
+                continue
+
+            val = values[i]
+            if True:
+                if val < accum[lab]: accum[lab] = val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = 0
 
-    return result, lindexer, rindexer
 
-@cython.wraparound(False)
 @cython.boundscheck(False)
-def inner_join_indexer_int64(ndarray[int64_t] left,
-                              ndarray[int64_t] right):
+@cython.wraparound(False)
+def group_cummax_float64(ndarray[float64_t] out,
+                          ndarray[float64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
     '''
-    Two-pass algorithm for monotonic indexes. Handles many-to-one merges
+    Running cummax of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
     '''
     cdef:
-        Py_ssize_t i, j, k, nright, nleft, count
-        int64_t lval, rval
-        ndarray[int64_t] lindexer, rindexer
-        ndarray[int64_t] result
+        Py_ssize_t i, N, lab
+        float64_t val
+        ndarray[float64_t] accum
 
-    nleft = len(left)
-    nright = len(right)
+    accum = np.empty(ngroups, dtype=np.float64)
+    accum.fill(-np.inf)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = NaN
+                continue
+
+            val = values[i]
+            if val == val:
+                if val > accum[lab]: accum[lab] = val
+                out[i] = accum[lab]
             else:
-                j += 1
+                out[i] = NaN
 
-    # do it again now that result size is known
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_cummax_int64(ndarray[int64_t] out,
+                          ndarray[int64_t] values,
+                          ndarray[int64_t] labels,
+                          Py_ssize_t ngroups):
+    '''
+    Running cummax of the values of each group in the order they appear.
+    NA values, and values whose label is -1, are NA in out
+    '''
+    cdef:
+        Py_ssize_t i, N, lab
+        int64_t val
+        ndarray[int64_t] accum
 
-    lindexer = np.empty(count, dtype=np.int64)
-    rindexer = np.empty(count, dtype=np.int64)
-    result = np.empty(count, dtype=np.int64)
+    accum = np.empty(ngroups, dtype=np.int64)
+    accum.fill(np.iinfo(np.int64).min)
 
-    i = 0
-    j = 0
-    count = 0
-    if nleft > 0 and nright > 0:
-        while True:
-            if i == nleft:
-                break
-            if j == nright:
-                break
+    N = len(values)
 
-            lval = left[i]
-            rval = right[j]
-            if lval == rval:
-                lindexer[count] = i
-                rindexer[count] = j
-                result[count] = rval
-                count += 1
-                if i < nleft - 1:
-                    if j < nright - 1 and right[j + 1] == rval:
-                        j += 1
-                    else:
-                        i += 1
-                        if left[i] != rval:
-                            j += 1
-                elif j < nright - 1:
-                    j += 1
-                    if lval != right[j]:
-                        i += 1
-                else:
-                    # end of the road
-                    break
-            elif lval < rval:
-                i += 1
-            else:
-                j += 1
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                out[i] = 0
+                continue
 
-    return result, lindexer, rindexer
+            val = values[i]
+            if True:
+                if val > accum[lab]: accum[lab] = val
+                out[i] = accum[lab]
+            else:
+                out[i] = 0
 
 
@@ -41,7 +41,7 @@ cdef extern from "kvec.h":
 
     inline void kv_object_push(kv_object_t *v, PyObject* x)
     inline void kv_object_destroy(kv_object_t *v)
-    inline void kv_int64_push(kv_int64_t *v, int64_t x)
+    inline void kv_int64_push(kv_int64_t *v, int64_t x) nogil
 
 
 cdef class ObjectVector:
@@ -111,7 +111,7 @@ cdef class Int64Vector:
 
         return result
 
-    cdef inline append(self, int64_t x):
+    cdef inline void append(self, int64_t x) nogil:
         kv_int64_push(&self.vec, x)
 
     def __dealloc__(self):
@@ -123,6 +123,12 @@ cdef class HashTable:
     pass
 
 
+cdef inline Py_ssize_t _table_nbytes(khint_t n_buckets, size_t key_size):
+    # keys, size_t values and two flag bits per bucket
+    return (n_buckets * (key_size + sizeof(size_t)) +
+            ((n_buckets >> 4) + 1) * sizeof(uint32_t))
+
+
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
 
@@ -374,6 +380,12 @@ cdef class Int64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def memory_usage(self):
+        '''
+        Bytes allocated by the hash table
+        '''
+        return _table_nbytes(self.table.n_buckets, sizeof(int64_t))
+
     cdef inline bint has_key(self, int64_t val):
         cdef khiter_t k
         k = kh_get_int64(self.table, val)
@@ -406,6 +418,8 @@ cdef class Int64HashTable(HashTable):
         else:
             raise KeyError(key)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def map(self, ndarray[int64_t] keys, ndarray[int64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -413,11 +427,17 @@ cdef class Int64HashTable(HashTable):
             int64_t key
             khiter_t k
 
-        for i in range(n):
-            key = keys[i]
-            k = kh_put_int64(self.table, key, &ret)
-            self.table.vals[k] = <Py_ssize_t> values[i]
+        if len(keys) < n:
+            raise ValueError('keys are shorter than the values')
 
+        with nogil:
+            for i in range(n):
+                key = keys[i]
+                k = kh_put_int64(self.table, key, &ret)
+                self.table.vals[k] = <Py_ssize_t> values[i]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def map_locations(self, ndarray[int64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -425,11 +445,14 @@ cdef class Int64HashTable(HashTable):
             int64_t val
             khiter_t k
 
-        for i in range(n):
-            val = values[i]
-            k = kh_put_int64(self.table, val, &ret)
-            self.table.vals[k] = i
+        with nogil:
+            for i in range(n):
+                val = values[i]
+                k = kh_put_int64(self.table, val, &ret)
+                self.table.vals[k] = i
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def lookup(self, ndarray[int64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -438,16 +461,19 @@ cdef class Int64HashTable(HashTable):
             khiter_t k
             ndarray[int64_t] locs = np.empty(n, dtype=np.int64)
 
-        for i in range(n):
-            val = values[i]
-            k = kh_get_int64(self.table, val)
-            if k != self.table.n_buckets:
-                locs[i] = self.table.vals[k]
-            else:
-                locs[i] = -1
+        with nogil:
+            for i in range(n):
+                val = values[i]
+                k = kh_get_int64(self.table, val)
+                if k != self.table.n_buckets:
+                    locs[i] = self.table.vals[k]
+                else:
+                    locs[i] = -1
 
         return locs
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def lookup_i4(self, ndarray[int64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -456,13 +482,14 @@ cdef class Int64HashTable(HashTable):
             khiter_t k
             ndarray[int64_t] locs = np.empty(n, dtype=np.int64)
 
-        for i in range(n):
-            val = values[i]
-            k = kh_get_int64(self.table, val)
-            if k != self.table.n_buckets:
-                locs[i] = self.table.vals[k]
-            else:
-                locs[i] = -1
+        with nogil:
+            for i in range(n):
+                val = values[i]
+                k = kh_get_int64(self.table, val)
+                if k != self.table.n_buckets:
+                    locs[i] = self.table.vals[k]
+                else:
+                    locs[i] = -1
 
         return locs
 
@@ -473,10 +500,27 @@ cdef class Int64HashTable(HashTable):
 
     def get_labels(self, ndarray[int64_t] values, list uniques,
                    Py_ssize_t count_prior, Py_ssize_t na_sentinel):
+        labels, counts, found = self._get_labels(values, count_prior,
+                                                 na_sentinel)
+        uniques.extend(found.tolist())
+        return labels, counts
+
+    def get_labels_array(self, ndarray[int64_t] values,
+                         Py_ssize_t na_sentinel=-1):
+        '''
+        get_labels on an empty table, returning the uniques as an ndarray in
+        order of first appearance rather than appending them to a list
+        '''
+        return self._get_labels(values, 0, na_sentinel)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef tuple _get_labels(self, ndarray[int64_t] values,
+                           Py_ssize_t count_prior, Py_ssize_t na_sentinel):
         cdef:
             Py_ssize_t i, n = len(values)
             ndarray[int64_t] labels
-            ndarray[int64_t] counts
+            ndarray[int64_t] counts, found
             Py_ssize_t idx, count = count_prior
             int ret = 0
             int64_t val
@@ -484,24 +528,29 @@ cdef class Int64HashTable(HashTable):
 
         labels = np.empty(n, dtype=np.int64)
         counts = np.empty(count_prior + n, dtype=np.int64)
+        found = np.empty(n, dtype=np.int64)
+
+        with nogil:
+            for i in range(n):
+                val = values[i]
+                k = kh_get_int64(self.table, val)
+                if k != self.table.n_buckets:
+                    idx = self.table.vals[k]
+                    labels[i] = idx
+                    counts[idx] = counts[idx] + 1
+                else:
+                    k = kh_put_int64(self.table, val, &ret)
+                    self.table.vals[k] = count
+                    found[count - count_prior] = val
+                    labels[i] = count
+                    counts[count] = 1
+                    count += 1
 
-        for i in range(n):
-            val = values[i]
-            k = kh_get_int64(self.table, val)
-            if k != self.table.n_buckets:
-                idx = self.table.vals[k]
-                labels[i] = idx
-                counts[idx] = counts[idx] + 1
-            else:
-                k = kh_put_int64(self.table, val, &ret)
-                self.table.vals[k] = count
-                uniques.append(val)
-                labels[i] = count
-                counts[count] = 1
-                count += 1
-
-        return labels, counts[:count].copy()
+        return (labels, counts[:count].copy(),
+                found[:count - count_prior].copy())
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def get_labels_groupby(self, ndarray[int64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -514,29 +563,32 @@ cdef class Int64HashTable(HashTable):
 
         labels = np.empty(n, dtype=np.int64)
 
-        for i in range(n):
-            val = values[i]
-
-            # specific for groupby
-            if val < 0:
-                labels[i] = -1
-                continue
-
-            k = kh_get_int64(self.table, val)
-            if k != self.table.n_buckets:
-                idx = self.table.vals[k]
-                labels[i] = idx
-            else:
-                k = kh_put_int64(self.table, val, &ret)
-                self.table.vals[k] = count
-                uniques.append(val)
-                labels[i] = count
-                count += 1
+        with nogil:
+            for i in range(n):
+                val = values[i]
+
+                # specific for groupby
+                if val < 0:
+                    labels[i] = -1
+                    continue
+
+                k = kh_get_int64(self.table, val)
+                if k != self.table.n_buckets:
+                    idx = self.table.vals[k]
+                    labels[i] = idx
+                else:
+                    k = kh_put_int64(self.table, val, &ret)
+                    self.table.vals[k] = count
+                    uniques.append(val)
+                    labels[i] = count
+                    count += 1
 
         arr_uniques = uniques.to_array(xfer_data=True)
 
         return labels, arr_uniques
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def unique(self, ndarray[int64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -549,13 +601,14 @@ cdef class Int64HashTable(HashTable):
 
         # TODO: kvec
 
-        for i in range(n):
-            val = values[i]
-            k = kh_get_int64(self.table, val)
-            if k == self.table.n_buckets:
-                k = kh_put_int64(self.table, val, &ret)
-                uniques.append(val)
-                count += 1
+        with nogil:
+            for i in range(n):
+                val = values[i]
+                k = kh_get_int64(self.table, val)
+                if k == self.table.n_buckets:
+                    k = kh_put_int64(self.table, val, &ret)
+                    uniques.append(val)
+                    count += 1
 
         result = uniques.to_array(xfer_data=True)
 
@@ -611,6 +664,12 @@ cdef class Float64HashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def memory_usage(self):
+        '''
+        Bytes allocated by the hash table
+        '''
+        return _table_nbytes(self.table.n_buckets, sizeof(float64_t))
+
     def __dealloc__(self):
         kh_destroy_float64(self.table)
 
@@ -621,10 +680,28 @@ cdef class Float64HashTable(HashTable):
 
     cpdef get_labels(self, ndarray[float64_t] values, list uniques,
                      Py_ssize_t count_prior, int64_t na_sentinel):
+        labels, counts, found = self._get_labels(values, count_prior,
+                                                 na_sentinel)
+        uniques.extend(found.tolist())
+        return labels, counts
+
+    def get_labels_array(self, ndarray[float64_t] values,
+                         int64_t na_sentinel=-1):
+        '''
+        get_labels on an empty table, returning the uniques as an ndarray in
+        order of first appearance rather than appending them to a list
+        '''
+        return self._get_labels(values, 0, na_sentinel)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef tuple _get_labels(self, ndarray[float64_t] values,
+                           Py_ssize_t count_prior, int64_t na_sentinel):
         cdef:
             Py_ssize_t i, n = len(values)
             ndarray[int64_t] labels
             ndarray[int64_t] counts
+            ndarray[float64_t] found
             Py_ssize_t idx, count = count_prior
             int ret = 0
             float64_t val
@@ -632,39 +709,47 @@ cdef class Float64HashTable(HashTable):
 
         labels = np.empty(n, dtype=np.int64)
         counts = np.empty(count_prior + n, dtype=np.int64)
+        found = np.empty(n, dtype=np.float64)
 
-        for i in range(n):
-            val = values[i]
+        with nogil:
+            for i in range(n):
+                val = values[i]
 
-            if val != val:
-                labels[i] = na_sentinel
-                continue
+                if val != val:
+                    labels[i] = na_sentinel
+                    continue
 
-            k = kh_get_float64(self.table, val)
-            if k != self.table.n_buckets:
-                idx = self.table.vals[k]
-                labels[i] = idx
-                counts[idx] = counts[idx] + 1
-            else:
-                k = kh_put_float64(self.table, val, &ret)
-                self.table.vals[k] = count
-                uniques.append(val)
-                labels[i] = count
-                counts[count] = 1
-                count += 1
+                k = kh_get_float64(self.table, val)
+                if k != self.table.n_buckets:
+                    idx = self.table.vals[k]
+                    labels[i] = idx
+                    counts[idx] = counts[idx] + 1
+                else:
+                    k = kh_put_float64(self.table, val, &ret)
+                    self.table.vals[k] = count
+                    found[count - count_prior] = val
+                    labels[i] = count
+                    counts[count] = 1
+                    count += 1
 
-        return labels, counts[:count].copy()
+        return (labels, counts[:count].copy(),
+                found[:count - count_prior].copy())
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def map_locations(self, ndarray[float64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
             int ret = 0
             khiter_t k
 
-        for i in range(n):
-            k = kh_put_float64(self.table, values[i], &ret)
-            self.table.vals[k] = i
+        with nogil:
+            for i in range(n):
+                k = kh_put_float64(self.table, values[i], &ret)
+                self.table.vals[k] = i
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def lookup(self, ndarray[float64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -673,16 +758,19 @@ cdef class Float64HashTable(HashTable):
             khiter_t k
             ndarray[int64_t] locs = np.empty(n, dtype=np.int64)
 
-        for i in range(n):
-            val = values[i]
-            k = kh_get_float64(self.table, val)
-            if k != self.table.n_buckets:
-                locs[i] = self.table.vals[k]
-            else:
-                locs[i] = -1
+        with nogil:
+            for i in range(n):
+                val = values[i]
+                k = kh_get_float64(self.table, val)
+                if k != self.table.n_buckets:
+                    locs[i] = self.table.vals[k]
+                else:
+                    locs[i] = -1
 
         return locs
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
     def unique(self, ndarray[float64_t] values):
         cdef:
             Py_ssize_t i, n = len(values)
@@ -724,6 +812,12 @@ cdef class PyObjectHashTable(HashTable):
     def __len__(self):
         return self.table.size
 
+    def memory_usage(self):
+        '''
+        Bytes allocated by the hash table
+        '''
+        return _table_nbytes(self.table.n_buckets, sizeof(PyObject*))
+
     def __contains__(self, object key):
         cdef khiter_t k
         hash(key)
@@ -1,5 +1,7 @@
 import time
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def inner_join(ndarray[int64_t] left, ndarray[int64_t] right,
                Py_ssize_t max_groups):
     cdef:
@@ -14,12 +16,13 @@ def inner_join(ndarray[int64_t] left, ndarray[int64_t] right,
     right_sorter, right_count = groupsort_indexer(right, max_groups)
 
     # First pass, determine size of result set, do not use the NA group
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
 
-        if rc > 0 and lc > 0:
-            count += lc * rc
+            if rc > 0 and lc > 0:
+                count += lc * rc
 
     # group 0 is the NA group
     cdef:
@@ -33,23 +36,26 @@ def inner_join(ndarray[int64_t] left, ndarray[int64_t] right,
     left_indexer = np.empty(count, dtype=np.int64)
     right_indexer = np.empty(count, dtype=np.int64)
 
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
-
-        if rc > 0 and lc > 0:
-            for j in range(lc):
-                offset = position + j * rc
-                for k in range(rc):
-                    left_indexer[offset + k] = left_pos + j
-                    right_indexer[offset + k] = right_pos + k
-            position += lc * rc
-        left_pos += lc
-        right_pos += rc
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
+
+            if rc > 0 and lc > 0:
+                for j in range(lc):
+                    offset = position + j * rc
+                    for k in range(rc):
+                        left_indexer[offset + k] = left_pos + j
+                        right_indexer[offset + k] = right_pos + k
+                position += lc * rc
+            left_pos += lc
+            right_pos += rc
 
     return (_get_result_indexer(left_sorter, left_indexer),
             _get_result_indexer(right_sorter, right_indexer))
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def left_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
                     Py_ssize_t max_groups, sort=True):
     cdef:
@@ -65,11 +71,12 @@ def left_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     right_sorter, right_count = groupsort_indexer(right, max_groups)
 
     # First pass, determine size of result set, do not use the NA group
-    for i in range(1, max_groups + 1):
-        if right_count[i] > 0:
-            count += left_count[i] * right_count[i]
-        else:
-            count += left_count[i]
+    with nogil:
+        for i in range(1, max_groups + 1):
+            if right_count[i] > 0:
+                count += left_count[i] * right_count[i]
+            else:
+                count += left_count[i]
 
     # group 0 is the NA group
     cdef:
@@ -83,24 +90,25 @@ def left_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     left_indexer = np.empty(count, dtype=np.int64)
     right_indexer = np.empty(count, dtype=np.int64)
 
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
-
-        if rc == 0:
-            for j in range(lc):
-                left_indexer[position + j] = left_pos + j
-                right_indexer[position + j] = -1
-            position += lc
-        else:
-            for j in range(lc):
-                offset = position + j * rc
-                for k in range(rc):
-                    left_indexer[offset + k] = left_pos + j
-                    right_indexer[offset + k] = right_pos + k
-            position += lc * rc
-        left_pos += lc
-        right_pos += rc
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
+
+            if rc == 0:
+                for j in range(lc):
+                    left_indexer[position + j] = left_pos + j
+                    right_indexer[position + j] = -1
+                position += lc
+            else:
+                for j in range(lc):
+                    offset = position + j * rc
+                    for k in range(rc):
+                        left_indexer[offset + k] = left_pos + j
+                        right_indexer[offset + k] = right_pos + k
+                position += lc * rc
+            left_pos += lc
+            right_pos += rc
 
     left_indexer = _get_result_indexer(left_sorter, left_indexer)
     right_indexer = _get_result_indexer(right_sorter, right_indexer)
@@ -119,6 +127,8 @@ def left_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
 
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
                           Py_ssize_t max_groups):
     cdef:
@@ -133,14 +143,15 @@ def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     right_sorter, right_count = groupsort_indexer(right, max_groups)
 
     # First pass, determine size of result set, do not use the NA group
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
 
-        if rc > 0 and lc > 0:
-            count += lc * rc
-        else:
-            count += lc + rc
+            if rc > 0 and lc > 0:
+                count += lc * rc
+            else:
+                count += lc + rc
 
     # group 0 is the NA group
     cdef:
@@ -154,29 +165,30 @@ def full_outer_join(ndarray[int64_t] left, ndarray[int64_t] right,
     left_indexer = np.empty(count, dtype=np.int64)
     right_indexer = np.empty(count, dtype=np.int64)
 
-    for i in range(1, max_groups + 1):
-        lc = left_count[i]
-        rc = right_count[i]
-
-        if rc == 0:
-            for j in range(lc):
-                left_indexer[position + j] = left_pos + j
-                right_indexer[position + j] = -1
-            position += lc
-        elif lc == 0:
-            for j in range(rc):
-                left_indexer[position + j] = -1
-                right_indexer[position + j] = right_pos + j
-            position += rc
-        else:
-            for j in range(lc):
-                offset = position + j * rc
-                for k in range(rc):
-                    left_indexer[offset + k] = left_pos + j
-                    right_indexer[offset + k] = right_pos + k
-            position += lc * rc
-        left_pos += lc
-        right_pos += rc
+    with nogil:
+        for i in range(1, max_groups + 1):
+            lc = left_count[i]
+            rc = right_count[i]
+
+            if rc == 0:
+                for j in range(lc):
+                    left_indexer[position + j] = left_pos + j
+                    right_indexer[position + j] = -1
+                position += lc
+            elif lc == 0:
+                for j in range(rc):
+                    left_indexer[position + j] = -1
+                    right_indexer[position + j] = right_pos + j
+                position += rc
+            else:
+                for j in range(lc):
+                    offset = position + j * rc
+                    for k in range(rc):
+                        left_indexer[offset + k] = left_pos + j
+                        right_indexer[offset + k] = right_pos + k
+                position += lc * rc
+            left_pos += lc
+            right_pos += rc
 
     return (_get_result_indexer(left_sorter, left_indexer),
             _get_result_indexer(right_sorter, right_indexer))
@@ -198,6 +210,8 @@ def _get_result_indexer(sorter, indexer):
 
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def ffill_indexer(ndarray[int64_t] indexer):
     cdef:
         Py_ssize_t i, n = len(indexer)
@@ -207,17 +221,20 @@ def ffill_indexer(ndarray[int64_t] indexer):
     result = np.empty(n, dtype=np.int64)
     last_obs = -1
 
-    for i in range(n):
-        val = indexer[i]
-        if val == -1:
-            result[i] = last_obs
-        else:
-            result[i] = val
-            last_obs = val
+    with nogil:
+        for i in range(n):
+            val = indexer[i]
+            if val == -1:
+                result[i] = last_obs
+            else:
+                result[i] = val
+                last_obs = val
 
     return result
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 def ffill_by_group(ndarray[int64_t] indexer, ndarray[int64_t] group_ids,
                    int64_t max_group):
     cdef:
@@ -225,19 +242,26 @@ def ffill_by_group(ndarray[int64_t] indexer, ndarray[int64_t] group_ids,
         ndarray[int64_t] result, last_obs
         int64_t gid, val
 
+    if len(group_ids) < n:
+        raise ValueError('group_ids are shorter than the indexer')
+    if n > 0 and (group_ids[:n].min() < 0 or
+                  group_ids[:n].max() >= max_group):
+        raise ValueError('group_ids must be in [0, %d)' % max_group)
+
     result = np.empty(n, dtype=np.int64)
 
     last_obs = np.empty(max_group, dtype=np.int64)
     last_obs.fill(-1)
 
-    for i in range(n):
-        gid = group_ids[i]
-        val = indexer[i]
-        if val == -1:
-            result[i] = last_obs[gid]
-        else:
-            result[i] = val
-            last_obs[gid] = val
+    with nogil:
+        for i in range(n):
+            gid = group_ids[i]
+            val = indexer[i]
+            if val == -1:
+                result[i] = last_obs[gid]
+            else:
+                result[i] = val
+                last_obs[gid] = val
 
     return result
 
@@ -65,7 +65,8 @@ def kth_smallest(ndarray[double_t] a, Py_ssize_t k):
         if k < i: m = j
     return a[k]
 
-cdef inline kth_smallest_c(float64_t* a, Py_ssize_t k, Py_ssize_t n):
+cdef inline float64_t kth_smallest_c(float64_t* a, Py_ssize_t k,
+                                     Py_ssize_t n) nogil:
     cdef:
         Py_ssize_t i,j,l,m
         double_t x, t
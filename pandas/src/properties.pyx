@@ -1,5 +1,10 @@
 from cpython cimport PyDict_Contains, PyDict_GetItem, PyDict_GetItem
 
+import threading
+
+# guards creating the per-object cache of cache_readonly
+_cache_lock = threading.Lock()
+
 cdef class cache_readonly(object):
 
     cdef readonly:
@@ -17,7 +22,10 @@ cdef class cache_readonly(object):
 
         cache = getattr(obj, '_cache', None)
         if cache is None:
-            cache = obj._cache = {}
+            with _cache_lock:
+                cache = getattr(obj, '_cache', None)
+                if cache is None:
+                    cache = obj._cache = {}
 
         if PyDict_Contains(cache, self.name):
             # not necessary to Py_INCREF
@@ -25,8 +33,10 @@ cdef class cache_readonly(object):
             return val
         else:
             val = self.fget(obj)
-            PyDict_SetItem(cache, self.name, val)
-            return val
+            # not locked while computing, so that properties computed from
+            # one another cannot deadlock; if another thread got there first
+            # return its value, so that every caller sees the same one
+            return cache.setdefault(self.name, val)
 
 cdef class AxisProperty(object):
     cdef:
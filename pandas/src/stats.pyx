@@ -202,6 +202,63 @@ def rank_1d_int64(object in_arr, ties_method='average', ascending=True,
     return ranks
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def group_rank_float64(ndarray[float64_t] out,
+                       ndarray[float64_t] values,
+                       ndarray[int64_t] labels,
+                       ndarray[int64_t] order,
+                       ties_method='average'):
+    """
+    Rank of each value within its group. order must sort the values by
+    label and then value, stably, e.g. np.lexsort((values, labels)), so
+    that NaN values come last in their group; their rank, and the rank of
+    values whose label is -1, is NaN
+    """
+    cdef:
+        Py_ssize_t i, j, n, idx, lab, nxt, pos = 0, dups = 0
+        float64_t val, sum_ranks = 0
+        int tiebreak
+
+    tiebreak = tiebreakers[ties_method]
+    n = len(values)
+
+    with nogil:
+        for i in range(n):
+            idx = order[i]
+            lab = labels[idx]
+            val = values[idx]
+
+            if i == 0 or lab != labels[order[i - 1]]:
+                pos = dups = 0
+                sum_ranks = 0
+
+            if lab < 0 or val != val:
+                out[idx] = nan
+                continue
+
+            pos += 1
+            dups += 1
+            sum_ranks += pos
+
+            if i < n - 1:
+                nxt = order[i + 1]
+            if (i == n - 1 or labels[nxt] != lab or
+                values[nxt] != values[nxt] or
+                fabs(values[nxt] - val) > FP_ERR):
+                for j in range(i - dups + 1, i + 1):
+                    if tiebreak == TIEBREAK_AVERAGE:
+                        out[order[j]] = sum_ranks / dups
+                    elif tiebreak == TIEBREAK_MIN:
+                        out[order[j]] = pos - dups + 1
+                    elif tiebreak == TIEBREAK_MAX:
+                        out[order[j]] = pos
+                    else:
+                        out[order[j]] = pos - i + j
+                sum_ranks = dups = 0
+
+
 def rank_2d_float64(object in_arr, axis=0, ties_method='average',
                     ascending=True, na_option='keep'):
     """
@@ -59,8 +59,8 @@ cimport util
 from util cimport is_array, _checknull, _checknan
 
 cdef extern from "math.h":
-    double sqrt(double x)
-    double fabs(double)
+    double sqrt(double x) nogil
+    double fabs(double) nogil
 
 # import datetime C API
 PyDateTime_IMPORT
@@ -59,6 +59,79 @@ class TestUnique(unittest.TestCase):
 
         tm.assert_almost_equal(result, expected)
 
+
+class TestFactorize(unittest.TestCase):
+
+    def test_ints(self):
+        arr = np.array([5, 3, 5, 1, 3], dtype=np.int64)
+        labels, uniques, counts = algos.factorize(arr)
+        self.assert_(isinstance(uniques, np.ndarray))
+        self.assert_(np.array_equal(uniques, [5, 3, 1]))
+        self.assert_(np.array_equal(labels, [0, 1, 0, 2, 1]))
+        self.assert_(np.array_equal(counts, [2, 2, 1]))
+
+        labels, uniques, counts = algos.factorize(arr, sort=True)
+        self.assert_(np.array_equal(uniques, [1, 3, 5]))
+        self.assert_(np.array_equal(labels, [2, 1, 2, 0, 1]))
+
+    def test_floats_na(self):
+        arr = np.array([1.5, np.nan, 0.5, 1.5])
+        labels, uniques, counts = algos.factorize(arr)
+        self.assert_(np.array_equal(uniques, [1.5, 0.5]))
+        self.assert_(np.array_equal(labels, [0, -1, 1, 0]))
+
+    def test_datetime64(self):
+        arr = np.array([2, 1, 2], dtype=np.int64).view('M8[ns]')
+        labels, uniques, counts = algos.factorize(arr)
+        self.assert_(uniques.dtype == 'M8[ns]')
+        self.assert_(np.array_equal(uniques.view('i8'), [2, 1]))
+        self.assert_(np.array_equal(labels, [0, 1, 0]))
+
+
+class TestIsin(unittest.TestCase):
+
+    def test_ints(self):
+        arr = np.array([3, 1, 4, 1, 5, 9, 2, 6])
+        result = algos.isin(arr, [1, 9, 10])
+        expected = np.array([False, True, False, True, False, True,
+                             False, False])
+        self.assert_(np.array_equal(result, expected))
+
+        # float values are compared numerically
+        result = algos.isin(arr, [1.0, 2.5])
+        expected = arr == 1
+        self.assert_(np.array_equal(result, expected))
+
+    def test_floats(self):
+        arr = np.array([1.5, np.nan, 2.5, 3])
+        result = algos.isin(arr, [3, 2.5, np.nan])
+        expected = np.array([False, False, True, True])
+        self.assert_(np.array_equal(result, expected))
+
+    def test_objects(self):
+        arr = np.array(['a', 'b', 1, None], dtype=object)
+        result = algos.isin(arr, set(['b', 1]))
+        expected = np.array([False, True, True, False])
+        self.assert_(np.array_equal(result, expected))
+
+        # mixed values fall back to object comparisons
+        result = algos.isin(np.arange(4), [1, 'a', 3.0])
+        expected = np.array([False, True, False, True])
+        self.assert_(np.array_equal(result, expected))
+
+    def test_sorted(self):
+        arr = np.array([1, 2, 2, 2, 5, 7, 7, 10])
+        for values in [[2, 7], [0, 11], [10, 1], [2.0, np.nan]]:
+            result = algos.isin(arr, values, is_sorted=True)
+            expected = algos.isin(arr, values)
+            self.assert_(np.array_equal(result, expected))
+
+    def test_empty(self):
+        result = algos.isin(np.array([1, 2]), [])
+        self.assert_(result.dtype == np.bool_)
+        self.assert_(not result.any())
+
+
 def test_quantile():
     s = Series(np.random.randn(100))
 
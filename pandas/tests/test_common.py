@@ -2,6 +2,7 @@ from datetime import datetime
 import sys
 
 import nose
+from nose.tools import assert_raises
 import unittest
 
 from pandas import Series, DataFrame, date_range, DatetimeIndex
@@ -179,6 +180,40 @@ def test_ensure_int32():
     result = com._ensure_int32(values)
     assert(result.dtype == np.int32)
 
+def test_save_load_compression():
+    import os
+    df = DataFrame(np.random.randn(100, 4), columns=list('ABCD'))
+    path = '__tmp_save_compression__'
+
+    for compression in [None, 'gzip', 'bz2']:
+        try:
+            com.save(df, path, compression=compression)
+            assert(com._infer_compression(path) == compression)
+
+            # detected from the file contents
+            tm.assert_frame_equal(com.load(path), df)
+            tm.assert_frame_equal(DataFrame.load(path), df)
+
+            # explicitly specified
+            result = com.load(path, compression=compression)
+            tm.assert_frame_equal(result, df)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    try:
+        df.save(path, compression='gzip')
+        tm.assert_frame_equal(DataFrame.load(path), df)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    try:
+        assert_raises(ValueError, com.save, df, path, compression='zip')
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
 # TODO: fix this broken test
 
 # def test_console_encode():
@@ -194,6 +229,42 @@ def test_ensure_int32():
 #         expected = u"\u05d0".encode('utf-8')
 #         assert (result == expected)
 
+def test_array_memory_usage_views():
+    arr = np.arange(100, dtype=np.float64)
+
+    # a slice seen before its parent
+    seen = {}
+    total = (com._array_memory_usage(arr[10:20], seen=seen) +
+             com._array_memory_usage(arr, seen=seen))
+    assert(total == arr.nbytes)
+
+    # partially overlapping views
+    seen = {}
+    total = (com._array_memory_usage(arr[:60], seen=seen) +
+             com._array_memory_usage(arr[40:], seen=seen) +
+             com._array_memory_usage(arr[20:80], seen=seen))
+    assert(total == arr.nbytes)
+
+    # strided views only count the elements they use
+    seen = {}
+    total = (com._array_memory_usage(arr[::2], seen=seen) +
+             com._array_memory_usage(arr[::2], seen=seen))
+    assert(total == arr.nbytes // 2)
+
+    # strided views seen before their parent
+    seen = {}
+    total = (com._array_memory_usage(arr[::2], seen=seen) +
+             com._array_memory_usage(arr, seen=seen))
+    assert(total == arr.nbytes)
+
+    seen = {}
+    total = (com._array_memory_usage(arr[::2], seen=seen) +
+             com._array_memory_usage(arr[1::2], seen=seen) +
+             com._array_memory_usage(arr[:50], seen=seen) +
+             com._array_memory_usage(arr, seen=seen) +
+             com._array_memory_usage(arr[::2], seen=seen))
+    assert(total == arr.nbytes)
+
 def test_pprint_thing():
     if py3compat.PY3:
         raise nose.SkipTest
@@ -308,6 +379,15 @@ class TestTake(unittest.TestCase):
         result = com.take_1d(arr, [0, 2, -1])
         self.assert_(result.dtype == np.object_)
 
+    def test_1d_masked(self):
+        arr = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+
+        result = com.take_1d(arr, [2, 1, -1, 0])
+        self.assert_(isinstance(result, np.ma.MaskedArray))
+        self.assert_(result.dtype == arr.dtype)
+        self.assert_(np.array_equal(result.mask, [False, True, True, False]))
+        self.assert_(np.array_equal(result.compressed(), [3, 1]))
+
     def test_2d_bool(self):
         arr = np.array([[0, 1, 0],
                         [1, 0, 1],
@@ -352,6 +432,40 @@ class TestTake(unittest.TestCase):
         expected[:, [2, 4]] = np.nan
         tm.assert_almost_equal(result, expected)
 
+    def test_small_dtypes(self):
+        indexer = [0, 2, -1, 1, -1]
+
+        arr = np.random.randn(4, 3).astype(np.float32)
+        for axis in [0, 1]:
+            result = com.take_2d(arr, indexer, axis=axis)
+            self.assert_(result.dtype == np.float32)
+            expected = arr.take(indexer, axis=axis).astype(np.float64)
+            if axis == 0:
+                expected[[2, 4]] = np.nan
+            else:
+                expected[:, [2, 4]] = np.nan
+            tm.assert_almost_equal(result, expected)
+
+        result = com.take_1d(arr[:, 0], indexer)
+        self.assert_(result.dtype == np.float32)
+        self.assert_(np.isnan(result[[2, 4]]).all())
+
+        for dtype in [np.int8, np.int16]:
+            arr = np.arange(12, dtype=dtype).reshape((4, 3))
+
+            # no NAs, dtype preserved
+            result = com.take_2d(arr, [0, 2, 1], axis=0)
+            self.assert_(result.dtype == dtype)
+            self.assert_(np.array_equal(result, arr.take([0, 2, 1], axis=0)))
+
+            result = com.take_1d(arr[:, 0], [3, 1])
+            self.assert_(result.dtype == dtype)
+
+            # upcast for NAs
+            result = com.take_2d(arr, indexer, axis=1)
+            self.assert_(result.dtype == np.float64)
+            self.assert_(np.isnan(result[:, [2, 4]]).all())
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
                    exit=False)
@@ -98,6 +98,17 @@ class TestCategorical(unittest.TestCase):
         expected = value_counts(np.asarray(factor))
         tm.assert_series_equal(result, expected)
 
+    def test_value_counts_na_labels(self):
+        cat = Categorical(np.array([0, 1, 1, -1, 2, 1, -1]),
+                          ['a', 'b', 'c'])
+
+        result = value_counts(cat)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result.index[0], 'b')
+        self.assertEqual(result['b'], 3)
+        self.assertEqual(result['a'], 1)
+        self.assertEqual(result['c'], 1)
+
     def test_na_flags_int_levels(self):
         # #1457
 
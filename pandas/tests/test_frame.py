@@ -1730,6 +1730,111 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         should_be_view[0][0] = 97
         self.assertEqual(df.values[0, 0], 97)
 
+    def test_constructor_small_dtypes(self):
+        df = DataFrame({'a': np.arange(5, dtype='f4'),
+                        'b': np.arange(5, dtype='i2'),
+                        'c': np.arange(5, dtype='i1'),
+                        'd': np.arange(5, dtype='f8')})
+        self.assert_(df['a'].dtype == np.float32)
+        self.assert_(df['b'].dtype == np.int16)
+        self.assert_(df['c'].dtype == np.int8)
+        self.assert_(df['d'].dtype == np.float64)
+
+        df['e'] = np.arange(5, dtype='u2')
+        self.assert_(df['e'].dtype == np.uint16)
+
+        # reindexing
+        result = df.reindex([0, 2, 4])
+        assert_series_equal(result.dtypes, df.dtypes)
+
+        result = df.reindex(range(7))
+        self.assert_(result['a'].dtype == np.float32)
+        self.assert_(isnull(result['a'][5:]).all())
+
+        # fill
+        filled = result['a'].fillna(method='pad')
+        self.assert_(filled.dtype == np.float32)
+        self.assertEqual(filled[6], 4)
+
+        # arithmetic
+        small = df[['a', 'b']]
+        self.assert_(small.values.dtype == np.float32)
+        result = small * 2
+        self.assert_((result.dtypes == np.float32).all())
+        assert_almost_equal(result.values, small.values.astype('f8') * 2)
+
+    def test_categorical_column(self):
+        from pandas.core.categorical import Categorical
+        from pandas.core.internals import CategoricalBlock
+        from pandas.tools.merge import concat
+
+        cat = Categorical.from_array(['a', 'b', 'b', 'c', 'a'])
+        df = DataFrame({'cat': cat, 'val': np.arange(5.)})
+
+        self.assert_(df._data.is_categorical('cat'))
+        blocks = [b for b in df._data.blocks
+                  if isinstance(b, CategoricalBlock)]
+        self.assertEqual(len(blocks), 1)
+        self.assert_(blocks[0].values.dtype == np.int8)
+
+        expected = np.array(['a', 'b', 'b', 'c', 'a'], dtype=object)
+        self.assert_(np.array_equal(df['cat'].values, expected))
+        self.assert_(df['cat'].dtype == np.object_)
+
+        # missing rows are coded -1
+        result = df.reindex([0, 3, 7])
+        self.assert_(result._data.is_categorical('cat'))
+        self.assert_(isnull(result['cat'][7]))
+        self.assertEqual(result['cat'][3], 'c')
+
+        result = df.take([4, 1])
+        self.assert_(np.array_equal(result['cat'].values, ['a', 'b']))
+
+        # concat with shared and with differing levels
+        result = concat([df, df], ignore_index=True)
+        self.assert_(result._data.is_categorical('cat'))
+        self.assert_(np.array_equal(result['cat'].values,
+                                    np.concatenate([expected, expected])))
+
+        other = DataFrame({'cat': Categorical.from_array(['d', 'a']),
+                           'val': [5., 6.]})
+        result = concat([df, other], ignore_index=True)
+        self.assert_(result._data.is_categorical('cat'))
+        self.assert_(np.array_equal(result['cat'].values,
+                                    list(expected) + ['d', 'a']))
+
+        # pickle round trip keeps the levels
+        unpickled = pickle.loads(pickle.dumps(df))
+        self.assert_(unpickled._data.is_categorical('cat'))
+        assert_frame_equal(unpickled, df)
+
+        # setting a categorical column
+        df['cat2'] = Categorical.from_array(['x', 'y', 'x', 'y', 'x'])
+        self.assert_(df._data.is_categorical('cat2'))
+        self.assertEqual(df['cat2'][1], 'y')
+
+        self.assertRaises(Exception, df.__setitem__, 'cat3',
+                          Categorical.from_array(['x', 'y']))
+
+    def test_categorical_column_setitem(self):
+        from pandas.core.categorical import Categorical
+
+        for other in [{'val': np.arange(4.)}, {}]:
+            data = {'cat': Categorical.from_array(['a', 'b', 'a', 'c'])}
+            data.update(other)
+            df = DataFrame(data)
+            loc = list(df.columns).index('cat')
+
+            # frame writes reach the stored data, not only the cached column
+            df.ix[0, 'cat'] = 'c'
+            df.ix[df.index > 2, 'cat'] = 'd'
+            df.set_value(1, 'cat', 'e')
+
+            expected = ['c', 'e', 'a', 'd']
+            self.assertEqual(list(df['cat']), expected)
+            self.assertEqual(list(df.copy()['cat']), expected)
+            self.assertEqual(list(df.values[:, loc]), expected)
+
     def test_constructor_dtype_list_data(self):
         df = DataFrame([[1, '2'],
                         [None, 'a']], dtype=object)
@@ -1933,6 +2038,108 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         frame = DataFrame(np.empty((3, 0)))
         self.assert_(len(frame.columns) == 0)
 
+    def test_masked_na_storage(self):
+        from pandas.core.internals import MaskedIntBlock, MaskedBoolBlock
+
+        df = DataFrame({'i': np.arange(5), 'b': np.arange(5) % 2 == 0,
+                        'f': np.arange(5.)})
+
+        def _block_types(frame):
+            return set(type(b) for b in frame._data.blocks)
+
+        pan.set_na_storage('mask')
+        try:
+            result = df.reindex([0, 2, 7])
+            self.assert_(MaskedIntBlock in _block_types(result))
+            self.assert_(MaskedBoolBlock in _block_types(result))
+            self.assert_(result._data.is_masked('i'))
+
+            # retrieved as when upcast
+            pan.set_na_storage('upcast')
+            expected = df.reindex([0, 2, 7])
+            pan.set_na_storage('mask')
+            assert_frame_equal(result, expected)
+            assert_series_equal(result.dtypes, expected.dtypes)
+            assert_series_equal(result.count(), expected.count())
+            assert_series_equal(result.sum(), expected.sum())
+            self.assert_(isnull(result.xs(7)).all())
+
+            # storage stays compact
+            self.assert_(result._data.memory_usage() <
+                         expected._data.memory_usage())
+
+            # filling leaves the original dtype
+            filled = result.fillna(0)
+            self.assert_(filled['i'].dtype == np.int64)
+            self.assertEqual(filled['i'][7], 0)
+            self.assert_(filled['b'].dtype == np.object_)
+
+            shifted = df.shift(2)
+            self.assert_(shifted._data.is_masked('i'))
+            self.assert_(isnull(shifted['i'][:2]).all())
+            self.assert_(np.array_equal(shifted['i'][2:], [0, 1, 2]))
+
+            unpickled = pickle.loads(pickle.dumps(result))
+            self.assert_(unpickled._data.is_masked('i'))
+            assert_frame_equal(unpickled, result)
+
+            # no missing values, no mask
+            result = df.reindex([4, 3])
+            self.assert_(result['i'].dtype == np.int64)
+
+            mat = ma.masked_array(np.arange(6).reshape((3, 2)),
+                                  mask=[[0, 1], [0, 0], [1, 0]])
+            frame = DataFrame(mat)
+            self.assert_(frame._data.is_masked(0))
+            self.assert_(isnull(frame[1][0]))
+            self.assertEqual(frame[1][1], 3)
+        finally:
+            pan.set_na_storage('upcast')
+
+        self.assertRaises(ValueError, pan.set_na_storage, 'foo')
+
+    def test_masked_na_storage_precision(self):
+        big = 2 ** 53 + 1
+        df = DataFrame({'a': np.array([big, 1, 2], dtype=np.int64),
+                        'b': np.arange(3)})
+
+        pan.set_na_storage('mask')
+        try:
+            result = df.reindex([0, 1, 2, 5])
+            self.assert_(result._data.is_masked('a'))
+
+            # not rounded through float64
+            self.assertEqual(result['a'][0], big)
+            self.assertEqual(result.ix[0, 'a'], big)
+            self.assertEqual(result.values[0, 0], big)
+            self.assert_(isnull(result['a'][5]))
+            self.assert_(result['b'].dtype == np.float64)
+
+            # reductions on the masked int64 values
+            sums = result.sum()
+            self.assert_(sums.dtype == np.int64)
+            self.assertEqual(sums['a'], big + 3)
+            self.assertEqual(result.max()['a'], big)
+            self.assertEqual(result.min()['a'], 1)
+            assert_series_equal(result.mean(), df.mean())
+            self.assertEqual(result['a'].sum(), big + 3)
+            self.assertEqual(result['a'].max(), big)
+
+            result['c'] = 0.5
+            sums = result.sum()
+            self.assertEqual(sums['a'], big + 3)
+            self.assertEqual(sums['c'], 2.)
+
+            # items without missing values are not upcast
+            mat = ma.masked_array(df.values, mask=[[0, 1], [0, 0], [0, 0]])
+            result = DataFrame(mat, columns=df.columns)
+            self.assert_(result._data.is_masked('a'))
+            self.assert_(result['a'].dtype == np.int64)
+            self.assertEqual(result['a'][0], big)
+            self.assert_(result['b'].dtype == np.float64)
+        finally:
+            pan.set_na_storage('upcast')
+
     def test_constructor_maskedarray(self):
         mat = ma.masked_all((2, 3), dtype=float)
 
@@ -3894,6 +4101,43 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         assert_frame_equal(frame, recons)
         os.remove(path)
 
+    def test_to_excel_chunked(self):
+        try:
+            import xlwt
+            import xlrd
+            import openpyxl
+        except ImportError:
+            raise nose.SkipTest
+
+        df = DataFrame({'A': np.random.randn(25),
+                        'B': np.arange(25),
+                        'C': pan.date_range('1/1/2000', periods=25),
+                        'D': ['foo', 'bar', 'baz', 'qux', 'x'] * 5},
+                       columns=['A', 'B', 'C', 'D'])
+        df['A'][::3] = nan
+        df['D'][1] = nan
+
+        for ext in ['xls', 'xlsx']:
+            path = '__tmp__.' + ext
+
+            calls = []
+            def progress(written, total):
+                calls.append((written, total))
+
+            df.to_excel(path, 'test1', chunksize=10, progress=progress)
+            self.assertEqual(calls, [(10, 25), (20, 25), (25, 25)])
+
+            reader = ExcelFile(path)
+            recons = reader.parse('test1', index_col=0)
+            recons['B'] = recons['B'].astype(np.int64)
+
+            # datetime64 values are written as date cells
+            self.assertEqual(list(recons['C']), list(df['C']))
+            assert_frame_equal(df.drop(['C'], axis=1),
+                               recons.drop(['C'], axis=1))
+
+            os.remove(path)
+
     def test_to_excel_periodindex(self):
         try:
             import xlwt
@@ -4049,6 +4293,24 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         frame.info(verbose=False)
         sys.stdout = sys.__stdout__
 
+    def test_memory_usage(self):
+        df = DataFrame({'a': np.random.randn(1000),
+                        'b': np.arange(1000),
+                        'c': ['foo'] * 1000})
+        values = 3 * 8 * 1000
+        self.assertEqual(df.memory_usage(index=False), values)
+        self.assertEqual(df.memory_usage(),
+                         values + df.index.nbytes + df.columns.nbytes)
+        self.assert_(df.memory_usage(deep=True) > df.memory_usage())
+
+        io = StringIO()
+        df.info(buf=io)
+        self.assert_('memory usage' in io.getvalue())
+
+        io = StringIO()
+        df.info(buf=io, memory_usage=False)
+        self.assert_('memory usage' not in io.getvalue())
+
     def test_info_duplicate_columns(self):
         io = StringIO()
 
@@ -4414,6 +4676,28 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         assert_frame_equal(result, expected)
         assert_frame_equal(result2, expected)
 
+    def test_isin(self):
+        df = DataFrame({'A': [1, 2, 3, 4], 'B': ['a', 'b', 'c', 'd'],
+                        'C': [1.5, 2.5, 3.5, 4.5]})
+
+        result = df.isin([2, 'c', 4.5])
+        expected = DataFrame({'A': [False, True, False, False],
+                              'B': [False, False, True, False],
+                              'C': [False, False, False, True]})
+        assert_frame_equal(result, expected)
+
+        result = df.isin({'A': [1, 3], 'B': ['d']})
+        expected = DataFrame({'A': [True, False, True, False],
+                              'B': [False, False, False, True],
+                              'C': [False] * 4})
+        assert_frame_equal(result, expected)
+
+        # duplicate columns
+        df = DataFrame([[1, 2], [3, 4]], columns=['A', 'A'])
+        result = df.isin([2, 3])
+        self.assert_(np.array_equal(result.values, [[False, True],
+                                                    [True, False]]))
+
     def test_drop_duplicates(self):
         df = DataFrame({'AAA' : ['foo', 'bar', 'foo', 'bar',
                                'foo', 'bar', 'bar', 'foo'],
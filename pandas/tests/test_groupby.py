@@ -8,7 +8,8 @@ from pandas import bdate_range
 from pandas.core.index import Index, MultiIndex
 from pandas.core.common import rands
 from pandas.core.api import Categorical, DataFrame
-from pandas.core.groupby import GroupByError, SpecificationError, DataError
+from pandas.core.groupby import (GroupByError, SpecificationError, DataError,
+                                 GroupByAccumulator)
 from pandas.core.series import Series
 from pandas.util.testing import (assert_panel_equal, assert_frame_equal,
                                  assert_series_equal, assert_almost_equal)
@@ -21,6 +22,7 @@ import numpy as np
 from numpy.testing import assert_equal
 
 import pandas.core.nanops as nanops
+import pandas.lib as lib
 
 import pandas.util.testing as tm
 
@@ -97,9 +99,7 @@ class TestGroupBy(unittest.TestCase):
         assert_series_equal(agged, grouped.agg(np.mean)) # shorthand
         assert_series_equal(agged, grouped.mean())
 
-        # Cython only returning floating point for now...
-        assert_series_equal(grouped.agg(np.sum).astype(float),
-                            grouped.sum())
+        assert_series_equal(grouped.agg(np.sum), grouped.sum())
 
         transformed = grouped.transform(lambda x: x * x.sum())
         self.assertEqual(transformed[7], 12)
@@ -1075,6 +1075,60 @@ class TestGroupBy(unittest.TestCase):
 
         assert_series_equal(result, expected)
 
+    def test_cython_agg_int64_precision(self):
+        big = 2 ** 60
+        frame = DataFrame({'a': [0, 1, 0, 1],
+                           'b': np.array([big, 1, 3, big], dtype=np.int64)})
+        result = frame.groupby('a')['b'].sum()
+        self.assert_(result.dtype == np.int64)
+        self.assertEqual(result[0], big + 3)
+        self.assertEqual(result[1], big + 1)
+
+    def test_cython_agg_preserves_dtype(self):
+        frame = DataFrame({'a': [0, 1, 0, 1],
+                           'b': np.array([4, 3, 2, 1], dtype=np.int32),
+                           'c': np.array([1.5, np.nan, 2., 3.],
+                                         dtype=np.float32)})
+        grouped = frame.groupby('a')
+
+        expected = {'min': ([2, 1], [1.5, 3.]),
+                    'max': ([4, 3], [2., 3.]),
+                    'first': ([4, 3], [1.5, 3.]),
+                    'last': ([2, 1], [2., 3.])}
+        for op, (b, c) in expected.iteritems():
+            result = getattr(grouped, op)()
+            self.assert_(result['b'].dtype == np.int32)
+            self.assert_(result['c'].dtype == np.float32)
+            self.assert_(np.array_equal(result['b'], b))
+            self.assert_(np.array_equal(result['c'], c))
+
+        result = grouped.sum()
+        self.assert_(result['b'].dtype == np.int64)
+        self.assert_(result['c'].dtype == np.float32)
+        self.assert_(np.array_equal(result['b'], [6, 4]))
+
+        result = grouped['c'].count()
+        self.assert_(result.dtype == np.int64)
+        self.assert_(np.array_equal(result, [2, 1]))
+
+    def test_cython_agg_datetime64(self):
+        stamps = bdate_range('1/3/2012', periods=5).asi8.take([2, 0, 1, 3, 4])
+        stamps[3] = lib.iNaT
+        s = Series(stamps.view('M8[ns]'))
+        grouped = s.groupby([0, 1, 0, 0, 1])
+
+        expected = {'min': stamps[[2, 1]],
+                    'max': stamps[[0, 4]],
+                    'first': stamps[[0, 1]],
+                    'last': stamps[[2, 4]]}
+        for op, values in expected.iteritems():
+            result = getattr(grouped, op)()
+            self.assert_(result.dtype == 'M8[ns]')
+            self.assert_(np.array_equal(result.values.view('i8'), values))
+
+        result = grouped.count()
+        self.assert_(np.array_equal(result, [2, 2]))
+
     def test_cython_agg_nothing_to_agg(self):
         frame = DataFrame({'a': np.random.randint(0, 5, 50),
                            'b': ['foo', 'bar'] * 25})
@@ -1430,6 +1484,31 @@ class TestGroupBy(unittest.TestCase):
 
         assert_frame_equal(result, expected)
 
+    def test_apply_n_jobs(self):
+        df = self.df
+        grouped = df[['C', 'D']].groupby([df['A'], df['B']])
+
+        # results are combined in group order like the serial apply
+        for f in [_demean, _describe]:
+            expected = grouped.apply(f)
+            for backend in ['process', 'thread']:
+                for n_jobs in [2, 3, -1]:
+                    result = grouped.apply(f, n_jobs=n_jobs, backend=backend)
+                    assert_frame_equal(result, expected)
+
+        grouped = self.df.groupby('A')['C']
+        expected = grouped.apply(lambda x: x.sum() * 2)
+        result = grouped.apply(lambda x: x.sum() * 2, n_jobs=2,
+                               backend='thread')
+        assert_series_equal(result, expected)
+
+        # more workers than groups
+        result = grouped.apply(_describe, n_jobs=10)
+        assert_series_equal(result, grouped.apply(_describe))
+
+        self.assertRaises(ValueError, grouped.apply, _describe, n_jobs=2,
+                          backend='foo')
+
     def test_apply_corner(self):
         result = self.tsframe.groupby(lambda x: x.year).apply(lambda x: x * 2)
         expected = self.tsframe * 2
@@ -1712,6 +1791,58 @@ class TestGroupBy(unittest.TestCase):
         result = grouped.sum()
         _check_groupby(df, result, ['a', 'b'], 'd')
 
+    def test_groupby_nosort_multi(self):
+        df = DataFrame({'A' : ['b', 'a', 'b', 'c', None, 'a'],
+                        'B' : [2, 1, 2, 1, 1, 3],
+                        'C' : np.arange(6.)})
+
+        result = df.groupby(['A', 'B'], sort=False)['C'].sum()
+        expected = df.groupby(['A', 'B'])['C'].sum()
+
+        # groups come back in order of first appearance
+        self.assertEqual(list(result.index),
+                         [('b', 2), ('a', 1), ('c', 1), ('a', 3)])
+        assert_series_equal(result.reindex(expected.index), expected)
+
+        # the levels are sorted, so sortlevel matches sort=True
+        self.assertEqual(list(result.index.levels[0]), ['a', 'b', 'c'])
+        assert_series_equal(result.sortlevel(), expected)
+        assert_frame_equal(result.unstack(), expected.unstack())
+
+        result = df.groupby(['B', 'A'], sort=False).mean()
+        expected = df.groupby(['B', 'A']).mean()
+        self.assertEqual(list(result.index),
+                         [(2, 'b'), (1, 'a'), (1, 'c'), (3, 'a')])
+        assert_frame_equal(result.reindex(expected.index), expected)
+        assert_frame_equal(result.sortlevel(), expected)
+
+    def test_groupby_accumulator(self):
+        df = DataFrame({'A' : np.random.randint(0, 10, 1000),
+                        'B' : np.random.randint(0, 3, 1000),
+                        'C' : np.random.randn(1000),
+                        'D' : np.random.randint(0, 100, 1000)})
+        df['C'][::7] = np.nan
+        df['C'][df['A'] == 3] = np.nan
+
+        arg = {'C' : ['count', 'sum', 'mean', 'var', 'std', 'min', 'max'],
+               'D' : ['sum', 'min', 'max', 'mean']}
+        for keys in ['A', ['A', 'B']]:
+            acc = GroupByAccumulator(keys, arg)
+            for i in range(0, len(df), 97):
+                acc.update(df[i:i + 97])
+            assert_frame_equal(acc.result(), df.groupby(keys).agg(arg))
+
+        arg = {'C' : 'var', 'D' : 'sum'}
+        acc = GroupByAccumulator('A', arg)
+        acc.update(df[:500])
+        acc.update(df[:0])
+        acc.update(df[500:])
+        assert_frame_equal(acc.result(), df.groupby('A').agg(arg))
+
+        self.assertRaises(ValueError, GroupByAccumulator('A', arg).result)
+        self.assertRaises(ValueError, GroupByAccumulator, 'A',
+                          {'C' : 'median'})
+
     def test_intercept_builtin_sum(self):
         import __builtin__
         s = Series([1., 2., np.nan, 3.])
@@ -1753,6 +1884,74 @@ class TestGroupBy(unittest.TestCase):
 
         assert_series_equal(result, expected)
 
+    def test_cython_transforms(self):
+        df = DataFrame({'A': np.random.randint(0, 10, 100),
+                        'B': np.random.randn(100).round(1),
+                        'C': np.random.randint(0, 5, 100)})
+        df['B'][::5] = np.nan
+        grouped = df.groupby('A')
+
+        def _check(op, f):
+            result = op(grouped)
+            for col in ['B', 'C']:
+                expected = df[col].astype(float)
+                for _, piece in df.groupby('A')[col]:
+                    expected[piece.index] = f(piece)
+                assert_series_equal(result[col].astype(float), expected)
+
+        _check(lambda g: g.cumsum(), lambda x: x.cumsum())
+        _check(lambda g: g.cumprod(), lambda x: x.cumprod())
+        _check(lambda g: g.cummin(), lambda x: x.cummin())
+        _check(lambda g: g.cummax(), lambda x: x.cummax())
+        _check(lambda g: g.shift(2), lambda x: x.shift(2))
+        _check(lambda g: g.shift(-1), lambda x: x.shift(-1))
+        _check(lambda g: g.diff(), lambda x: x.diff())
+        for method in ['average', 'min', 'max', 'first']:
+            _check(lambda g: g.rank(method=method, ascending=False),
+                   lambda x: x.rank(method=method, ascending=False))
+
+        self.assert_(grouped.cumsum()['C'].dtype == np.int64)
+
+        result = grouped['B'].cumsum()
+        self.assert_(result.index.equals(df.index))
+        self.assertEqual(result.name, 'B')
+
+    def test_cumcount(self):
+        df = DataFrame({'A': ['a', 'b', 'a', None, 'b', 'a'],
+                        'B': np.arange(6)})
+        result = df.groupby('A').cumcount()
+        expected = Series([0, 0, 1, np.nan, 1, 2])
+        assert_series_equal(result, expected)
+
+        result = df.groupby('A')['B'].cumcount()
+        assert_series_equal(result, expected)
+
+    def test_reuse_on(self):
+        grouped = self.df.groupby(['A', 'B'])
+        other = self.df.copy()
+        other['C'] = other['C'] * 2
+
+        result = grouped.reuse_on(other)
+        self.assert_(result.grouper is grouped.grouper)
+        assert_frame_equal(result.sum(), other.groupby(['A', 'B']).sum())
+
+        result = grouped.reuse_on(other['D']).mean()
+        expected = other['D'].groupby([other['A'], other['B']]).mean()
+        assert_series_equal(result, expected)
+
+        # the keys need not be columns of the new object
+        result = grouped.reuse_on(other[['C']]).sum()
+        assert_frame_equal(result, other.groupby(['A', 'B'])[['C']].sum())
+
+        self.assertRaises(ValueError, grouped.reuse_on, other[:-1])
+
+    def test_groupby_grouper_object(self):
+        grouped = self.df.groupby(['A', 'B'])
+        result = self.df.groupby(grouped.grouper)['C'].sum()
+        assert_series_equal(result, grouped['C'].sum())
+
+        self.assertRaises(ValueError, self.df[:-1].groupby, grouped.grouper)
+
     def test_dont_clobber_name_column(self):
         df = DataFrame({'key': ['a', 'a', 'a', 'b', 'b', 'b'],
                         'name' : ['foo', 'bar', 'baz'] * 2})
@@ -1875,6 +2074,33 @@ class TestGroupBy(unittest.TestCase):
 
         self.assertRaises(SpecificationError, grouped.agg, funcs)
 
+    def test_agg_multiple_stats_one_pass(self):
+        df = DataFrame({'A': np.random.randint(0, 5, 100),
+                        'B': np.random.randn(100)})
+        df['B'][::4] = np.nan
+        df['B'][df['A'] == 3] = np.nan
+
+        stats = ['sum', 'count', 'mean', 'var', 'std', 'min', 'max',
+                 'first', 'last']
+        grouped = df.groupby('A')['B']
+        result = grouped.agg(stats)
+        expected = DataFrame(dict((stat, getattr(grouped, stat)())
+                                  for stat in stats), columns=stats)
+        assert_frame_equal(result, expected)
+        self.assert_(result['count'].dtype == np.int64)
+
+        result = grouped.agg([np.sum, np.mean, np.std])
+        assert_frame_equal(result, expected[['sum', 'mean', 'std']])
+
+        # resample keeps the empty bins
+        ts = Series(np.arange(10.), index=bdate_range('1/2/2012',
+                                                      periods=10))
+        ts = ts[[0, 1, 8, 9]]
+        result = ts.resample('D', how=stats)
+        expected = DataFrame(dict((stat, ts.resample('D', how=stat))
+                                  for stat in stats), columns=stats)
+        assert_frame_equal(result, expected)
+
     def test_more_flexible_frame_multi_function(self):
         from pandas import concat
 
@@ -1989,6 +2215,20 @@ class TestGroupBy(unittest.TestCase):
         expected = ord_data.groupby(ord_labels, sort=False).describe()
         assert_frame_equal(desc_result, expected)
 
+    def test_groupby_categorical_column(self):
+        levels = ['foo', 'bar', 'baz', 'qux']
+        labels = np.random.randint(0, 4, size=100)
+
+        df = DataFrame({'key': Categorical(labels, levels),
+                        'value': np.random.randn(100)})
+        self.assert_(df._data.is_categorical('key'))
+
+        result = df.groupby('key')['value'].mean()
+
+        expected = df['value'].groupby(np.asarray(df['key'])).mean()
+        expected = expected.reindex(levels)
+        assert_series_equal(result, expected)
+
     def test_groupby_groups_datetimeindex(self):
         # #1430
         from pandas.tseries.api import DatetimeIndex
@@ -2103,6 +2343,14 @@ def assert_fp_equal(a, b):
     assert((np.abs(a - b) < 1e-12).all())
 
 
+def _demean(group):
+    return group - group.mean()
+
+
+def _describe(group):
+    return group.describe()
+
+
 def _check_groupby(df, result, keys, field, f=lambda x: x.sum()):
     tups = map(tuple, df[keys].values)
     tups = com._asarray_tuplesafe(tups)
@@ -1,8 +1,11 @@
 # pylint: disable=E1101,E1103,W0232
 
 from datetime import datetime, timedelta
+import gc
 import operator
 import pickle
+import threading
+import time
 import unittest
 import nose
 import os
@@ -11,7 +14,7 @@ import numpy as np
 from numpy.testing import assert_array_equal
 
 from pandas.core.categorical import Factor
-from pandas.core.index import Index, Int64Index, MultiIndex
+from pandas.core.index import Index, Int64Index, RangeIndex, MultiIndex
 from pandas.util.testing import assert_almost_equal
 from pandas.util import py3compat
 import pandas.core.common as com
@@ -22,6 +25,7 @@ from pandas.tseries.index import _to_m8
 import pandas.tseries.offsets as offsets
 
 import pandas as pd
+import pandas.lib as lib
 from pandas.lib import Timestamp
 
 class TestIndex(unittest.TestCase):
@@ -301,6 +305,33 @@ class TestIndex(unittest.TestCase):
         # non-iterable input
         self.assertRaises(Exception, first.diff, 0.5)
 
+    def test_diff_sorted_merge(self):
+        # monotonic float labels
+        first = Index([1.5, 2.5, 2.5, 3.5, 4.5])
+        result = first.diff([2.5, 4.5, 6.5])
+        self.assert_(np.array_equal(result, [1.5, 3.5]))
+
+        # not monotonic, hashed
+        first = Index(['d', 'a', 'c', 'b'])
+        result = first.diff(Index(['x', 'c']))
+        self.assert_(np.array_equal(result, ['a', 'b', 'd']))
+
+        # keeps the datetime type and time zone
+        rng = pd.date_range('1/1/2000', periods=5, tz='US/Eastern')
+        for first in [rng, rng[::-1]]:
+            result = first.diff(rng[1:4])
+            self.assert_(isinstance(result, pd.DatetimeIndex))
+            self.assertEqual(result.tz, rng.tz)
+            self.assert_(np.array_equal(result.asi8, rng.asi8[[0, 4]]))
+
+    def test_float_union_intersection(self):
+        first = Index([1.5, 2.5, 3.5])
+        second = Index([2.5, 3.5, 4.5])
+        self.assert_(np.array_equal(first.union(second),
+                                    [1.5, 2.5, 3.5, 4.5]))
+        self.assert_(np.array_equal(first.intersection(second), [2.5, 3.5]))
+        self.assert_(first.union(second).dtype == np.object_)
+
     def test_pickle(self):
         def testit(index):
             pickled = pickle.dumps(index)
@@ -332,6 +363,15 @@ class TestIndex(unittest.TestCase):
     def test_summary(self):
         self._check_method_works(Index.summary)
 
+    def test_memory_usage(self):
+        self.assertEqual(self.intIndex.memory_usage(),
+                         self.intIndex.values.nbytes)
+
+        # deep includes the python objects themselves
+        shallow = self.strIndex.memory_usage()
+        self.assertEqual(shallow, self.strIndex.values.nbytes)
+        self.assert_(self.strIndex.memory_usage(deep=True) > shallow)
+
     def test_format(self):
         self._check_method_works(Index.format)
 
@@ -498,6 +538,11 @@ class TestIndex(unittest.TestCase):
         self.assert_(len(result) == 0)
         self.assert_(result.dtype == np.bool_)
 
+        # sorted integer labels
+        idx = Int64Index(np.arange(0, 100, 3))
+        result = idx.isin([9, 10, 99])
+        self.assert_(np.array_equal(result.nonzero()[0], [3, 33]))
+
     def test_boolean_cmp(self):
         values = [1,2,3,4]
 
@@ -856,6 +901,318 @@ class TestInt64Index(unittest.TestCase):
         self.assertTrue(len(r) < 100)
         self.assertTrue( "..." in r)
 
+class TestRangeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = RangeIndex(0, 20, 2, name='foo')
+
+    def test_constructor(self):
+        index = RangeIndex(5)
+        self.assert_(np.array_equal(index, np.arange(5)))
+        self.assert_(isinstance(index, Int64Index))
+
+        index = RangeIndex(10, 0, -3)
+        self.assert_(np.array_equal(index, [10, 7, 4, 1]))
+        self.assertEqual(index._stop, -2)
+
+        self.assertRaises(ValueError, RangeIndex, 0, 10, 0)
+
+    def test_default_index(self):
+        s = pd.Series(np.arange(5.))
+        self.assert_(isinstance(s.index, RangeIndex))
+        df = pd.DataFrame(np.random.randn(3, 2))
+        self.assert_(isinstance(df.index, RangeIndex))
+        self.assert_(isinstance(df.columns, RangeIndex))
+
+    def test_get_loc(self):
+        self.assertEqual(self.index.get_loc(6), 3)
+        self.assertEqual(self.index.get_loc(6.0), 3)
+        self.assertRaises(KeyError, self.index.get_loc, 5)
+        self.assertRaises(KeyError, self.index.get_loc, 20)
+        self.assertRaises(KeyError, self.index.get_loc, -2)
+        self.assertRaises(KeyError, self.index.get_loc, 'a')
+        self.assert_(6 in self.index)
+        self.assert_(7 not in self.index)
+        self.assert_('a' not in self.index)
+
+        index = RangeIndex(10, 0, -3)
+        self.assertEqual(index.get_loc(4), 2)
+        self.assertRaises(KeyError, index.get_loc, 5)
+
+        # lookups do not build the hash table engine
+        self.assert_('_engine' not in self.index.__dict__)
+
+    def test_get_value(self):
+        s = pd.Series(np.arange(10.), index=RangeIndex(10, 0, -1))
+        self.assertEqual(s[3], 7.)
+        self.assertRaises(KeyError, s.__getitem__, 0)
+        s[3] = 100
+        self.assertEqual(s[3], 100.)
+        self.assert_(np.array_equal(s[s > 5].values, [6., 100., 8., 9.]))
+
+    def test_float_keys(self):
+        # float keys are coerced as by the Int64Index engine
+        other = Int64Index(np.arange(0, 20, 2))
+        for key in [6.0, 6.5, np.float64(6.9), 0.5]:
+            self.assertEqual(self.index.get_loc(key), other.get_loc(key))
+            self.assertEqual(key in self.index, key in other)
+        self.assertRaises(KeyError, self.index.get_loc, 5.5)
+        self.assertRaises(KeyError, self.index.get_loc, 20.5)
+        self.assertRaises(KeyError, self.index.get_loc, np.nan)
+
+        s = pd.Series(np.arange(5.))
+        self.assert_(isinstance(s.index, RangeIndex))
+        self.assertEqual(s[2.5], s[2])
+        self.assertEqual(s[2.5], s.get(2.5))
+        self.assertEqual(s.ix[2.5], s[2])
+        self.assertRaises(KeyError, s.__getitem__, 5.5)
+
+    def test_get_indexer(self):
+        target = Int64Index([4, 5, 18, 20, -2, 0])
+        result = self.index.get_indexer(target)
+        expected = Int64Index(np.arange(0, 20, 2)).get_indexer(target)
+        self.assert_(np.array_equal(result, expected))
+
+        index = RangeIndex(10, 0, -3)
+        result = index.get_indexer(target)
+        expected = Int64Index(index.values).get_indexer(target)
+        self.assert_(np.array_equal(result, expected))
+
+        result = self.index.get_indexer(target, method='pad')
+        expected = Int64Index(np.arange(0, 20, 2)).get_indexer(target,
+                                                               method='pad')
+        self.assert_(np.array_equal(result, expected))
+
+    def test_slice(self):
+        for key in [slice(2, 7), slice(None, None, -1), slice(1, 9, 3),
+                    slice(-3, None), slice(5, 2)]:
+            result = self.index[key]
+            self.assert_(isinstance(result, RangeIndex))
+            self.assert_(np.array_equal(result, self.index.values[key]))
+            self.assertEqual(result.name, 'foo')
+            self.assertEqual(list(result), range(0, 20, 2)[key])
+
+    def test_take(self):
+        result = self.index.take([3, 0, -1])
+        self.assert_(np.array_equal(result, [6, 0, 18]))
+        self.assertEqual(result.name, 'foo')
+        self.assertRaises(IndexError, self.index.take, [10])
+
+    def test_equals(self):
+        self.assert_(self.index.equals(RangeIndex(0, 20, 2)))
+        self.assert_(self.index.equals(RangeIndex(0, 19, 2)))
+        self.assert_(not self.index.equals(RangeIndex(0, 20, 4)))
+        self.assert_(self.index.equals(Int64Index(np.arange(0, 20, 2))))
+        self.assert_(RangeIndex(0).equals(RangeIndex(5, 5)))
+
+    def test_union(self):
+        result = RangeIndex(0, 10).union(RangeIndex(10, 20))
+        self.assert_(isinstance(result, RangeIndex))
+        self.assert_(np.array_equal(result, np.arange(20)))
+
+        result = self.index.union(RangeIndex(10, 30, 2, name='foo'))
+        self.assert_(isinstance(result, RangeIndex))
+        self.assert_(np.array_equal(result, np.arange(0, 30, 2)))
+        self.assertEqual(result.name, 'foo')
+
+        # not a range
+        result = self.index.union(RangeIndex(1, 10, 2))
+        expected = np.union1d(np.arange(0, 20, 2), np.arange(1, 10, 2))
+        self.assert_(np.array_equal(result, expected))
+
+    def test_intersection(self):
+        pairs = [(RangeIndex(0, 20, 4), RangeIndex(2, 30, 6)),
+                 (RangeIndex(0, 10), RangeIndex(5, 15)),
+                 (RangeIndex(0, 10, 2), RangeIndex(1, 10, 2)),
+                 (RangeIndex(0, 5), RangeIndex(5, 10)),
+                 (RangeIndex(3, 100, 7), RangeIndex(-5, 80, 3))]
+        for a, b in pairs:
+            result = a.intersection(b)
+            self.assert_(isinstance(result, RangeIndex))
+            expected = np.intersect1d(a.values, b.values)
+            self.assert_(np.array_equal(result, expected))
+
+        result = self.index.intersection(Int64Index([2, 3, 4]))
+        self.assert_(np.array_equal(result, [2, 4]))
+
+    def test_derived_arrays(self):
+        result = self.index + 1
+        self.assert_(type(result) == Int64Index)
+        self.assert_(np.array_equal(result, np.arange(1, 21, 2)))
+
+        result = self.index[[1, 3]]
+        self.assert_(not isinstance(result, RangeIndex))
+
+    def test_pickle(self):
+        unpickled = pickle.loads(pickle.dumps(self.index))
+        self.assert_(isinstance(unpickled, RangeIndex))
+        self.assert_(unpickled.equals(self.index))
+        self.assertEqual(unpickled.name, 'foo')
+
+        s = pd.Series(np.arange(5.))
+        unpickled = pickle.loads(pickle.dumps(s))
+        self.assert_(isinstance(unpickled.index, RangeIndex))
+        tm.assert_series_equal(unpickled, s)
+
+class TestEngineMemory(unittest.TestCase):
+
+    def setUp(self):
+        gc.collect()
+        pd.set_engine_memory_limit(None)
+        pd.reset_engine_stats()
+
+    def tearDown(self):
+        pd.set_engine_memory_limit(None)
+
+    def test_stats(self):
+        before = pd.get_engine_stats()
+        index = Index(['c', 'a', 'b'])
+        index.get_loc('a')
+        stats = pd.get_engine_stats()
+        self.assertEqual(stats['populated'], before['populated'] + 1)
+        self.assert_(stats['bytes'] > before['bytes'])
+
+        index._cleanup()
+        self.assertEqual(pd.get_engine_stats(), before)
+
+        index.get_loc('a')
+        del index
+        gc.collect()
+        self.assertEqual(pd.get_engine_stats(), before)
+
+    def test_shared_engine(self):
+        index = Int64Index(np.random.permutation(100))
+        view = index[:]
+        self.assert_(view is not index)
+        self.assert_(view._engine is index._engine)
+        self.assertEqual(pd.get_engine_stats()['shared'], 1)
+
+        # different labels
+        other = Int64Index(index.values.copy())
+        self.assert_(other._engine is not index._engine)
+        self.assert_(index[1:]._engine is not index._engine)
+
+        s1 = pd.Series(np.arange(100.), index=index)
+        s2 = pd.Series(np.arange(100.), index=index)
+        self.assert_(s1.index._engine is s2.index._engine)
+
+        self.assert_(index._shallow_copy()._engine is index._engine)
+
+    def test_engine_not_shared_over_reused_buffer(self):
+        arr = np.array([10, 30, 20, 40, 50])
+        self.assertEqual(Index(arr).get_loc(30), 1)
+
+        # a new index over the mutated buffer builds its own table
+        arr[:] = [30, 10, 20, 40, 50]
+        self.assertEqual(Index(arr).get_loc(30), 0)
+        s = pd.Series(np.arange(5), index=Index(arr))
+        self.assertEqual(s[30], 0)
+
+    def test_memory_limit(self):
+        first = Index(['c', 'a', 'b'])
+        second = Index(['f', 'e', 'd'])
+        first.get_loc('a')
+        second.get_loc('e')
+
+        # engines still alive elsewhere are older and are cleared first
+        nbytes = second._engine.mapping.memory_usage()
+        evictions = pd.get_engine_stats()['evictions']
+        pd.set_engine_memory_limit(nbytes)
+        self.assert_(first._engine.mapping is None)
+        self.assert_(second._engine.mapping is not None)
+        stats = pd.get_engine_stats()
+        self.assert_(stats['evictions'] > evictions)
+        self.assertEqual(stats['bytes'], nbytes)
+
+        # lookups repopulate the table, evicting the older one
+        evictions = stats['evictions']
+        self.assertEqual(first.get_loc('b'), 2)
+        self.assert_(second._engine.mapping is None)
+        self.assertEqual(pd.get_engine_stats()['evictions'], evictions + 1)
+
+        self.assertRaises(ValueError, pd.set_engine_memory_limit, -1)
+        pd.set_engine_memory_limit(None)
+        self.assert_(pd.get_engine_memory_limit() is None)
+
+class TestThreadedLookups(unittest.TestCase):
+
+    def _run_threads(self, func, n=8):
+        results = [None] * n
+
+        def run(i):
+            results[i] = func()
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_engine_populated_once(self):
+        labels = np.array(['c', 'a', 'b', 'd'], dtype=object)
+        calls = []
+
+        def vgetter():
+            calls.append(1)
+            # give other threads the chance to race us
+            time.sleep(0.01)
+            return labels
+
+        engine = lib.ObjectEngine(vgetter, len(labels))
+        results = self._run_threads(lambda: engine.get_loc('b'))
+        self.assertEqual(results, [2] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assert_(engine.is_unique)
+
+    def test_engines_populate_independently(self):
+        building = threading.Event()
+        release = threading.Event()
+
+        def slow_vgetter():
+            building.set()
+            release.wait(10)
+            return np.array(['a', 'b'], dtype=object)
+
+        slow = lib.ObjectEngine(slow_vgetter, 2)
+        other = lib.Int64Engine(lambda: np.arange(5, dtype=np.int64), 5)
+
+        slow_thread = threading.Thread(target=slow.get_loc, args=('b',))
+        slow_thread.start()
+        building.wait(10)
+        try:
+            # building one table does not block lookups in another index
+            result = []
+            thread = threading.Thread(
+                target=lambda: result.append(other.get_loc(3)))
+            thread.start()
+            thread.join(5)
+            self.assertEqual(result, [3])
+        finally:
+            release.set()
+            slow_thread.join()
+
+    def test_cache_readonly(self):
+        from pandas.util.decorators import cache_readonly
+
+        class Thing(object):
+
+            @cache_readonly
+            def value(self):
+                time.sleep(0.01)
+                return object()
+
+        thing = Thing()
+        results = self._run_threads(lambda: thing.value)
+        self.assert_(all(x is thing.value for x in results))
+
+    def test_index_lookups(self):
+        index = Index(['c', 'a', 'b', 'd'])
+        results = self._run_threads(lambda: (index.get_loc('d'),
+                                             index.is_unique,
+                                             index.is_monotonic))
+        self.assertEqual(results, [(3, True, False)] * 8)
+
 class TestMultiIndex(unittest.TestCase):
 
     def setUp(self):
@@ -869,6 +1226,18 @@ class TestMultiIndex(unittest.TestCase):
                                 labels=[major_labels, minor_labels],
                                 names=['first', 'second'])
 
+    def test_memory_usage(self):
+        index = MultiIndex(levels=self.index.levels,
+                           labels=self.index.labels)
+        before = index.memory_usage()
+        expected = (sum(lev.values.nbytes for lev in index.levels) +
+                    sum(lab.nbytes for lab in index.labels))
+        self.assertEqual(before, expected)
+
+        # materialized tuples are accounted for
+        index.values
+        self.assert_(index.memory_usage() > before)
+
     def test_constructor_single_level(self):
         single_level = MultiIndex(levels=[['foo', 'bar', 'baz', 'qux']],
                                   labels=[[0, 1, 2, 3]],
@@ -1675,6 +2044,59 @@ class TestMultiIndex(unittest.TestCase):
                                    [0, 1, 2, 0, 0, 1, 2]])
         self.assert_(index.has_duplicates)
 
+    def test_duplicated(self):
+        index = MultiIndex(levels=[[0, 1], [0, 1, 2]],
+                           labels=[[0, 0, 0, 0, 1, 1, 1],
+                                   [0, 1, 2, 0, 0, 1, 1]])
+        expected = [False, False, False, True, False, False, True]
+        self.assert_(np.array_equal(index.duplicated(), expected))
+        expected = [True, False, False, False, False, True, False]
+        self.assert_(np.array_equal(index.duplicated(take_last=True),
+                                    expected))
+        self.assert_(not self.index.duplicated().any())
+
+    def test_lookups_without_tuples(self):
+        index = MultiIndex(levels=self.index.levels,
+                           labels=self.index.labels)
+        self.assertEqual(index.get_loc(('qux', 'one')), 4)
+        self.assert_(('bar', 'one') in index)
+        self.assert_(('bar', 'two') not in index)
+        self.assert_(index.is_unique)
+
+        target = MultiIndex.from_tuples([('baz', 'two'), ('bar', 'two'),
+                                         ('foo', 'one'), ('abc', 'one')])
+        self.assert_(np.array_equal(index.get_indexer(target),
+                                    [3, -1, 0, -1]))
+
+        result = index.isin([('foo', 'two'), ('qux', 'one'), ('abc', 'x')])
+        self.assert_(np.array_equal(result, [False, True, False, False,
+                                             True, False]))
+        self.assert_(index._tuples is None)
+
+    def test_lookups_overflow(self):
+        # cartesian product of the levels does not fit in int64
+        levels = [np.arange(10000)] * 5
+        labels = [np.array([0, 1, 2, 9999, 0]),
+                  np.array([5, 5, 5, 9999, 5]),
+                  np.array([1, 2, 3, 9999, 1]),
+                  np.array([0, 0, 0, 9999, 0]),
+                  np.array([7, 8, 9, 9999, 7])]
+        index = MultiIndex(levels=levels, labels=labels)
+        self.assert_(index._codes_overflow)
+        self.assert_(not index.is_unique)
+        self.assert_(np.array_equal(index.duplicated(),
+                                    [False, False, False, False, True]))
+
+        index = index[:4]
+        self.assert_(index.is_unique)
+        self.assertEqual(index.get_loc((2, 5, 3, 0, 9)), 2)
+        self.assertRaises(KeyError, index.get_loc, (2, 5, 3, 0, 8))
+        target = index[::-1]
+        self.assert_(np.array_equal(index.get_indexer(target),
+                                    [3, 2, 1, 0]))
+        self.assert_(np.array_equal(index.isin([(1, 5, 2, 0, 8)]),
+                                    [False, True, False, False]))
+
     def test_tolist(self):
         result = self.index.tolist()
         exp = list(self.index.values)
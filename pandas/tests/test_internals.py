@@ -64,7 +64,7 @@ class TestBlock(unittest.TestCase):
 
     def test_constructor(self):
         int32block = get_int32_ex(['a'])
-        self.assert_(int32block.dtype == np.int64)
+        self.assert_(int32block.dtype == np.int32)
 
     def test_pickle(self):
         import pickle
@@ -323,6 +323,88 @@ class TestBlockManager(unittest.TestCase):
         mgr = BlockManager(blocks, [items, np.arange(index_sz)])
         self.assert_(mgr.as_matrix().dtype == np.int64)
 
+    def test_as_matrix_small_dtypes(self):
+        items = Index(['a', 'b'])
+        index = np.arange(3)
+
+        def _mgr(*dtypes):
+            blocks = [make_block(np.ones((1, 3), dtype=dt), [it], items)
+                      for it, dt in zip(items, dtypes)]
+            return BlockManager(blocks, [items, index])
+
+        self.assert_(_mgr('f4', 'f4').as_matrix().dtype == np.float32)
+        self.assert_(_mgr('f4', 'i2').as_matrix().dtype == np.float32)
+        self.assert_(_mgr('i1', 'i2').as_matrix().dtype == np.int16)
+        self.assert_(_mgr('f4', 'i8').as_matrix().dtype == np.float64)
+
+    def test_form_blocks_small_dtypes(self):
+        index = np.arange(3)
+        arrays = [np.zeros(3, dtype=dt) for dt in ['f4', 'f8', 'f4', 'i2']]
+        items = Index(['a', 'b', 'c', 'd'])
+        blocks = form_blocks(arrays, items, [items, index])
+
+        dtypes = sorted(blk.dtype.name for blk in blocks)
+        self.assertEqual(dtypes, ['float32', 'float64', 'int16'])
+
+        for blk in blocks:
+            if blk.dtype == np.float32:
+                self.assert_(blk.items.equals(Index(['a', 'c'])))
+
+    def test_categorical_block(self):
+        from pandas.core.categorical import Categorical
+
+        index = np.arange(4)
+        items = Index(['a', 'b', 'c'])
+        arrays = [Categorical.from_array(['x', 'y', 'x', 'z']),
+                  Categorical.from_array(['x', 'x', 'y', 'y']),
+                  np.zeros(4)]
+        blocks = form_blocks(arrays, items, [items, index])
+        mgr = BlockManager(blocks, [items, index])
+
+        # categorical blocks never consolidate with one another
+        mgr = mgr.consolidate()
+        cat_blocks = [b for b in mgr.blocks
+                      if isinstance(b, internals.CategoricalBlock)]
+        self.assertEqual(len(cat_blocks), 2)
+
+        self.assert_(mgr.is_categorical('a'))
+        self.assert_(not mgr.is_categorical('c'))
+
+        blk = [b for b in cat_blocks if 'a' in b.items][0]
+        result = blk.take(np.array([3, -1, 0]), axis=1)
+        self.assert_(isinstance(result, internals.CategoricalBlock))
+        self.assert_(np.array_equal(result.values[0], [2, -1, 0]))
+        self.assert_(result.levels.equals(blk.levels))
+
+    def test_masked_blocks(self):
+        values = np.ma.masked_array(np.arange(6).reshape((2, 3)),
+                                    mask=[[0, 1, 0], [0, 0, 0]])
+        items = Index(['a', 'b'])
+        blk = make_block(values, items, items)
+        self.assert_(isinstance(blk, internals.MaskedIntBlock))
+        self.assert_(blk.dtype == np.float64)
+        self.assert_(np.array_equal(blk.notnull_counts(), [2, 3]))
+
+        result = blk.reindex_axis(np.array([2, -1, 1]), None, True, axis=1)
+        self.assert_(isinstance(result, internals.MaskedIntBlock))
+        assert_almost_equal(result.get('a'), [2, np.nan, np.nan])
+        assert_almost_equal(result.get('b'), [5, np.nan, 4])
+
+        result = blk.delete('a')
+        self.assert_(isinstance(result, internals.IntBlock))
+        self.assert_(not isinstance(result, internals.MaskedBlock))
+
+        # masked and unmasked blocks are not consolidated together
+        other = make_block(np.arange(3).reshape((1, 3)), ['c'],
+                           Index(['a', 'b', 'c']))
+        blk.ref_items = other.ref_items
+        self.assertEqual(len(internals._consolidate([blk, other],
+                                                    other.ref_items)), 2)
+
+        mgr = BlockManager([blk, other], [other.ref_items, np.arange(3)])
+        self.assert_(np.array_equal(mgr.notnull_counts(), [2, 3, 3]))
+        assert_almost_equal(mgr.as_matrix()[0], [0, np.nan, 2])
+
     def test_as_matrix_datetime(self):
         items = Index(['h', 'g'])
         blocks = [get_dt_ex(['h']), get_dt_ex(['g'])]
@@ -422,6 +504,88 @@ class TestBlockManager(unittest.TestCase):
         except KeyError:
             pass # this is the expected exception
 
+class TestConsolidationPolicy(unittest.TestCase):
+
+    def setUp(self):
+        internals.reset_consolidation_stats()
+
+    def tearDown(self):
+        internals.reset_consolidation_policy()
+
+    def _make_frame(self, ncols=10):
+        df = DataFrame(index=range(100))
+        for i in range(ncols):
+            df[i] = np.random.randn(100)
+        return df
+
+    def test_eager(self):
+        df = self._make_frame()
+        self.assertEqual(len(df._data.blocks), 10)
+
+        df.values
+        self.assert_(df._data.is_consolidated())
+
+        stats = internals.get_consolidation_stats()
+        self.assertEqual(stats['consolidations'], 1)
+        self.assertEqual(stats['blocks_merged'], 9)
+        self.assertEqual(stats['bytes_copied'], 10 * 100 * 8)
+
+        internals.reset_consolidation_stats()
+        df.values
+        stats = internals.get_consolidation_stats()
+        self.assertEqual(stats['consolidations'], 0)
+
+    def test_lazy(self):
+        internals.set_consolidation_policy('lazy')
+
+        df = self._make_frame()
+        df['a'] = 'foo'
+        df2 = df.reindex(df.index[::-1])
+        df.fillna(0)
+        self.assert_(not df._data.is_consolidated())
+        self.assert_(not df2._data.is_consolidated())
+        self.assertEqual(internals.get_consolidation_stats()['consolidations'],
+                         0)
+        self.assert_(internals.get_consolidation_stats()['deferred'] > 0)
+        self.assert_(df._is_mixed_type)
+
+        df.consolidate(inplace=True)
+        self.assert_(df._data.is_consolidated())
+        self.assertEqual(internals.get_consolidation_stats()['consolidations'],
+                         1)
+
+    def test_lazy_values_view(self):
+        internals.set_consolidation_policy('lazy')
+
+        # a view of single-dtype data is still possible
+        df = self._make_frame()
+        self.assert_(not df._is_mixed_type)
+        df.values[5] = 5
+        self.assert_((df.values[5] == 5).all())
+        self.assert_(df._data.is_consolidated())
+
+    def test_threshold(self):
+        internals.set_consolidation_policy('threshold', max_blocks=5)
+
+        df = self._make_frame(4)
+        df.reindex(df.index[::-1])
+        self.assert_(not df._data.is_consolidated())
+
+        df = self._make_frame(6)
+        self.assertEqual(len(df._data.blocks), 1)
+
+        df = self._make_frame(4)
+        internals.set_consolidation_policy(max_blocks=3)
+        df.reindex(df.index[::-1])
+        self.assert_(df._data.is_consolidated())
+
+    def test_bad_mode(self):
+        self.assertRaises(ValueError, internals.set_consolidation_policy,
+                          'sometimes')
+        self.assertEqual(internals.get_consolidation_policy(),
+                         {'mode': 'eager', 'max_blocks': 100})
+
+
 if __name__ == '__main__':
     # unittest.main()
     import nose
@@ -1,8 +1,10 @@
+import gc
 import unittest
 
 import numpy as np
 
 from pandas.core.generic import NDFrame
+import pandas.core.generic as generic
 import pandas.util.testing as t
 
 class TestNDFrame(unittest.TestCase):
@@ -23,6 +25,87 @@ class TestNDFrame(unittest.TestCase):
         casted = self.ndf.astype(int)
         self.assert_(casted.values.dtype == np.int64)
 
+
+class TestItemCache(unittest.TestCase):
+
+    def setUp(self):
+        self.maxsize = generic.get_item_cache_size()
+        generic.set_item_cache_size(3)
+        generic.reset_item_cache_stats()
+
+    def tearDown(self):
+        generic.set_item_cache_size(self.maxsize)
+        generic.reset_item_cache_stats()
+
+    def test_lru_eviction(self):
+        df = t.makeDataFrame()
+        df['E'] = 1.
+        cache = df._item_cache
+
+        a = df['A']
+        df['B']
+        df['C']
+        self.assert_(df['A'] is a)
+
+        # B is least recently used
+        df['D']
+        self.assertEqual(len(cache), 3)
+        self.assert_('B' not in cache)
+        self.assert_('A' in cache)
+
+        stats = generic.get_item_cache_stats()
+        self.assertEqual(stats['misses'], 4)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['evictions'], 1)
+
+        for col in df.columns:
+            df[col]
+        self.assert_(len(cache) <= 3)
+
+    def test_evicted_item_still_referenced(self):
+        df = t.makeDataFrame()
+        a = df['A']
+        for col in ['B', 'C', 'D']:
+            df[col]
+        self.assert_('A' not in df._item_cache)
+
+        # still alive, so the same object comes back
+        self.assert_(df['A'] is a)
+        self.assertEqual(generic.get_item_cache_stats()['weak_hits'], 1)
+
+        del a
+        df['B']
+        df['C']
+        df['D']
+        gc.collect()
+        generic.reset_item_cache_stats()
+        df['A']
+        self.assertEqual(generic.get_item_cache_stats()['misses'], 1)
+
+    def test_clear_and_delete(self):
+        df = t.makeDataFrame()
+        a = df['A']
+        df['B']
+        df['C']
+        df['D']
+
+        del df['A']
+        self.assert_('A' not in df.columns)
+        self.assertRaises(KeyError, df.__getitem__, 'A')
+
+        df['B'] = 0.
+        self.assertEqual(len(df._item_cache), 0)
+        self.assert_((df['B'] == 0).all())
+
+    def test_unbounded(self):
+        generic.set_item_cache_size(None)
+        df = t.makeDataFrame()
+        for col in df.columns:
+            df[col]
+        self.assertEqual(len(df._item_cache), len(df.columns))
+
+        self.assertRaises(ValueError, generic.set_item_cache_size, -1)
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
@@ -31,6 +31,12 @@ class PanelTests(object):
         unpickled = cPickle.loads(pickled)
         assert_frame_equal(unpickled['ItemA'], self.panel['ItemA'])
 
+    def test_memory_usage(self):
+        expected = sum(self.panel[item].values.nbytes
+                       for item in self.panel.items)
+        self.assertEqual(self.panel.memory_usage(index=False), expected)
+        self.assert_(self.panel.memory_usage() > expected)
+
     def test_cumsum(self):
         cumsum = self.panel.cumsum()
         assert_frame_equal(cumsum['ItemA'], self.panel['ItemA'].cumsum())
@@ -232,6 +232,20 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
 
         self.empty = Series([], index=[])
 
+    def test_memory_usage(self):
+        self.assertEqual(self.ts.memory_usage(index=False),
+                         self.ts.values.nbytes)
+        self.assertEqual(self.ts.memory_usage(),
+                         self.ts.values.nbytes + self.ts.index.nbytes)
+
+        # column of a frame only accounts for its own bytes
+        df = DataFrame(np.random.randn(100, 4))
+        col = df[0]
+        self.assertEqual(col.memory_usage(index=False), 800)
+
+        result = self.objSeries.memory_usage(deep=True)
+        self.assert_(result > self.objSeries.memory_usage())
+
     def test_constructor(self):
         # Recognize TimeSeries
         self.assert_(isinstance(self.ts, TimeSeries))
@@ -2859,6 +2873,15 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
         expected = Series([True, False, True, False, False, False, True, True])
         assert_series_equal(result, expected)
 
+        s = Series(np.arange(5), name='foo')
+        result = s.isin(set([1, 3]))
+        expected = Series([False, True, False, True, False], name='foo')
+        assert_series_equal(result, expected)
+
+        s = Series(date_range('1/1/2000', periods=3))
+        result = s.isin([s[1], '1/3/2000'])
+        assert_series_equal(result, Series([False, True, True]))
+
     def test_fillna_int(self):
         s = Series(np.random.randint(-100, 100, 50))
         self.assert_(s.fillna(inplace=True) is s)
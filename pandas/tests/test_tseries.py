@@ -1,5 +1,7 @@
 import unittest
 
+from nose.tools import assert_raises
+
 from numpy import nan
 import numpy as np
 from pandas import Index, isnull
@@ -132,6 +134,93 @@ def test_outer_join_indexer():
     assert_almost_equal(ares, [0])
     assert_almost_equal(bres, [0])
 
+def test_setdiff_indexer():
+    a = np.array([1, 2, 2, 3, 5, 5, 8], dtype=np.int64)
+    b = np.array([0, 2, 5, 5, 7], dtype=np.int64)
+
+    result = algos.setdiff_indexer_int64(a, b)
+    assert_almost_equal(result, [0, 3, 6])
+
+    result = algos.setdiff_indexer_int64(a, np.array([], dtype=np.int64))
+    assert_almost_equal(result, [0, 1, 3, 4, 6])
+
+    a = np.array(['a', 'b', 'c', 'd'], dtype=object)
+    b = np.array(['b', 'd', 'e'], dtype=object)
+    result = algos.setdiff_indexer_object(a, b)
+    assert_almost_equal(result, [0, 2])
+
+def test_take_int_na_raises():
+    values = np.arange(12, dtype=np.int64).reshape((3, 4))
+    indexer = np.array([0, -1, 2], dtype=np.int64)
+
+    assert_raises(ValueError, algos.take_1d_int64, values[:, 0], indexer)
+    assert_raises(ValueError, algos.take_2d_axis0_int64, values, indexer)
+    assert_raises(ValueError, algos.take_2d_multi_int64, values,
+                  np.array([0, 1], dtype=np.int64), indexer)
+
+    result = np.empty((2, 2), dtype=np.int64)
+    algos.take_2d_multi_int64(values, indexer[[0, 2]], indexer[[0, 2]],
+                              out=result)
+    assert(np.array_equal(result, [[0, 2], [8, 10]]))
+
+def test_take_1d_bounds():
+    values = np.arange(5.)
+
+    # indexes are checked before the loop, which skips bounds checking
+    assert_raises(IndexError, algos.take_1d_float64, values,
+                  np.array([0, 5], dtype=np.int64))
+    assert_raises(IndexError, algos.take_1d_float64, values,
+                  np.array([-2], dtype=np.int64))
+    assert_raises(IndexError, algos.take_1d_object, values.astype(object),
+                  np.array([7], dtype=np.int64))
+    assert_raises(ValueError, algos.take_1d_float64, values,
+                  np.array([0, 1], dtype=np.int64), out=np.empty(1))
+
+def test_count_level_labels():
+    mask = np.array([1, 1, 0, 1], dtype=np.uint8)
+    labels = np.array([0, -1, 1, 1], dtype=np.int64)
+
+    # NA labels are not counted
+    result = lib.count_level_1d(mask, labels, 2)
+    assert(np.array_equal(result, [1, 1]))
+
+    result = lib.count_level_2d(mask.reshape((4, 1)), labels, 2)
+    assert(np.array_equal(result, [[1], [1]]))
+
+    assert_raises(ValueError, lib.count_level_1d, mask, labels, 1)
+    assert_raises(ValueError, lib.group_count, labels, 1)
+
+def test_kernels_in_threads():
+    import threading
+
+    values = np.random.randn(10000, 3)
+    labels = np.random.randint(0, 50, size=10000).astype(np.int64)
+    indexer = np.random.permutation(10000).astype(np.int64)
+
+    def run():
+        out = np.empty((50, 3))
+        counts = np.zeros(50, dtype=np.int64)
+        lib.group_add(out, counts, values, labels)
+        taken = np.empty_like(values)
+        algos.take_2d_axis0_float64(values, indexer, out=taken)
+        return out, counts, taken
+
+    expected = run()
+    results = [None] * 4
+
+    def target(i):
+        results[i] = run()
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for result in results:
+        for left, right in zip(result, expected):
+            assert_almost_equal(left, right)
+
 def test_left_join_indexer():
     a = np.array([1, 2, 3, 4, 5], dtype=np.int64)
     b = np.array([0, 3, 5, 7, 9], dtype=np.int64)
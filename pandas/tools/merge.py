@@ -12,8 +12,10 @@ from pandas.core.series import Series
 from pandas.core.index import (Index, MultiIndex, _get_combined_index,
                                _ensure_index, _get_consensus_names,
                                _all_indexes_same)
-from pandas.core.internals import (IntBlock, BoolBlock, BlockManager,
-                                   make_block, _consolidate)
+from pandas.core.internals import (IntBlock, BoolBlock, CategoricalBlock,
+                                   MaskedBlock, BlockManager, make_block,
+                                   _consolidate, _codes_dtype, _masked_block,
+                                   get_na_storage)
 from pandas.util.decorators import cache_readonly, Appender, Substitution
 
 from pandas.sparse.frame import SparseDataFrame
@@ -224,6 +226,9 @@ class _MergeOperation(object):
                     left_na_indexer = left_indexer.take(na_indexer)
                     key_col.put(na_indexer, com.take_1d(self.left_join_keys[i],
                                                         left_na_indexer))
+
+                # not a view of the result when stored in a masked block
+                result[name] = key_col
             elif left_indexer is not None:
                 if name is None:
                     name = 'key_%d' % i
@@ -643,7 +648,7 @@ class _BlockJoinOperation(object):
             join_blocks = unit.get_upcasted_blocks()
             type_map = {}
             for blk in join_blocks:
-                type_map.setdefault(type(blk), []).append(blk)
+                type_map.setdefault(blk._consolidate_key, []).append(blk)
             blockmaps.append((unit, type_map))
 
         return blockmaps
@@ -682,6 +687,9 @@ class _BlockJoinOperation(object):
         """
         merge_chunks -> [(_JoinUnit, Block)]
         """
+        if _need_masked_merge(merge_chunks):
+            return self._merge_masked_blocks(merge_chunks)
+
         funit, fblock = merge_chunks[0]
         fidx = funit.indexer
 
@@ -717,6 +725,20 @@ class _BlockJoinOperation(object):
         new_block_items = _concat_indexes([b.items for _, b in merge_chunks])
         return make_block(out, new_block_items, self.result_items)
 
+    def _merge_masked_blocks(self, merge_chunks):
+        """
+        Integer / boolean blocks keeping missing values in a mask
+        """
+        to_concat = []
+        for unit, blk in merge_chunks:
+            if unit.indexer is not None:
+                blk = unit.reindex_block(blk, self.axis, self.result_items)
+            to_concat.append(blk.values)
+
+        new_values = com._concat_compat(to_concat, axis=0)
+        new_block_items = _concat_indexes([b.items for _, b in merge_chunks])
+        return make_block(new_values, new_block_items, self.result_items)
+
 
 class _JoinUnit(object):
     """
@@ -745,6 +767,8 @@ class _JoinUnit(object):
     def get_upcasted_blocks(self):
         # will short-circuit and not compute lneed_masking if indexer is None
         if self.need_masking:
+            if get_na_storage() == 'mask':
+                return _mask_blocks(self.blocks)
             return _upcast_blocks(self.blocks)
         return self.blocks
 
@@ -774,13 +798,41 @@ def _may_need_upcasting(blocks):
     return False
 
 
+def _need_masked_merge(merge_chunks):
+    for unit, block in merge_chunks:
+        if isinstance(block, MaskedBlock):
+            return True
+    return False
+
+
+def _mask_blocks(blocks):
+    """
+    Make integer and boolean blocks masked and consolidate if necessary
+    """
+    new_blocks = []
+    for block in blocks:
+        if (isinstance(block, (IntBlock, BoolBlock)) and
+            not isinstance(block, MaskedBlock)):
+            newb = _masked_block(np.ma.asarray(block.values), block.items,
+                                 block.ref_items, keep_mask=True)
+        else:
+            newb = block
+        new_blocks.append(newb)
+
+    # use any ref_items
+    return _consolidate(new_blocks, newb.ref_items)
+
+
 def _upcast_blocks(blocks):
     """
     Upcast and consolidate if necessary
     """
     new_blocks = []
     for block in blocks:
-        if isinstance(block, IntBlock):
+        if isinstance(block, MaskedBlock):
+            newb = make_block(block.get_values(block.dtype), block.items,
+                              block.ref_items)
+        elif isinstance(block, IntBlock):
             newb = make_block(block.values.astype(float), block.items,
                               block.ref_items)
         elif isinstance(block, BoolBlock):
@@ -794,6 +846,35 @@ def _upcast_blocks(blocks):
     return _consolidate(new_blocks, newb.ref_items)
 
 
+def _as_masked_blocks(data, dtypes):
+    """
+    Blocks of data with integer or boolean items of the given dtypes merged
+    into one masked block per dtype
+    """
+    new_blocks = []
+    to_merge = {}
+    for blk in data.blocks:
+        if (isinstance(blk, (IntBlock, BoolBlock)) and
+            blk.values.dtype.name in dtypes):
+            to_merge.setdefault(blk.values.dtype.name, []).append(blk)
+        else:
+            new_blocks.append(blk)
+
+    for dtype, blocks in to_merge.iteritems():
+        values = np.ma.vstack([np.ma.asarray(b.values) for b in blocks])
+        items = _concat_indexes([b.items for b in blocks])
+
+        # in the order of the items of data
+        order = data.items.get_indexer(items).argsort()
+        values = values.take(order, axis=0)
+        items = items.take(order)
+
+        new_blocks.append(_masked_block(values, items, data.items,
+                                        keep_mask=True))
+
+    return BlockManager(new_blocks, data.axes, do_integrity_check=False)
+
+
 def _get_all_block_kinds(blockmaps):
     kinds = set()
     for mapping in blockmaps:
@@ -967,10 +1048,21 @@ class _Concatenator(object):
     def _prepare_blocks(self):
         reindexed_data = self._get_reindexed_data()
 
+        reindexed_data = [data.consolidate() for data in reindexed_data]
+
+        # line up masked blocks with unmasked blocks of the same dtype
+        masked_dtypes = set(blk.values.dtype.name
+                            for data in reindexed_data
+                            for blk in data.blocks
+                            if isinstance(blk, MaskedBlock))
+        if masked_dtypes:
+            reindexed_data = [_as_masked_blocks(data, masked_dtypes)
+                              for data in reindexed_data]
+
         blockmaps = []
         for data in reindexed_data:
-            data = data.consolidate()
-            type_map = dict((type(blk), blk) for blk in data.blocks)
+            type_map = dict((blk._consolidate_key, blk)
+                            for blk in data.blocks)
             blockmaps.append(type_map)
         return blockmaps
 
@@ -986,8 +1078,11 @@ class _Concatenator(object):
                 stacked_block = self._concat_blocks(klass_blocks)
                 new_blocks.append(stacked_block)
 
-            if self.axis == 0 and self.ignore_index:
-                self.new_axes[0] = self._get_fresh_axis()
+            # a fresh axis along whichever axis is concatenated; leaving it
+            # None sends row-wise concat down the item-by-item fallback,
+            # which decodes categorical columns
+            if self.ignore_index:
+                self.new_axes[self.axis] = self._get_fresh_axis()
 
             for blk in new_blocks:
                 blk.ref_items = self.new_axes[0]
@@ -1024,7 +1119,13 @@ class _Concatenator(object):
         return reindexed_data
 
     def _concat_blocks(self, blocks):
-        values_list = [b.values for b in blocks if b is not None]
+        to_concat = [b for b in blocks if b is not None]
+
+        levels = None
+        if isinstance(to_concat[0], CategoricalBlock):
+            levels, values_list = _conform_categorical_codes(to_concat)
+        else:
+            values_list = [b.values for b in to_concat]
         concat_values = com._concat_compat(values_list, axis=self.axis)
 
         if self.axis > 0:
@@ -1032,7 +1133,8 @@ class _Concatenator(object):
             if not _all_indexes_same([b.items for b in blocks]):
                 raise Exception('dtypes are not consistent throughout '
                                 'DataFrames')
-            return make_block(concat_values, blocks[0].items, self.new_axes[0])
+            return make_block(concat_values, blocks[0].items, self.new_axes[0],
+                              levels=levels)
         else:
             offsets = np.r_[0, np.cumsum([len(x._data.axes[0]) for
                                             x in self.objs])]
@@ -1046,9 +1148,11 @@ class _Concatenator(object):
 
             if self.ignore_index:
                 ref_items = self._get_fresh_axis()
-                return make_block(concat_values, concat_items, ref_items)
+                return make_block(concat_values, concat_items, ref_items,
+                                  levels=levels)
 
-            return make_block(concat_values, concat_items, self.new_axes[0])
+            return make_block(concat_values, concat_items, self.new_axes[0],
+                              levels=levels)
 
     def _concat_single_item(self, item):
         all_values = []
@@ -1156,6 +1260,296 @@ class _Concatenator(object):
                                 % str(overlap))
 
 
+#----------------------------------------------------------------------
+# Incrementally build DataFrame objects
+
+
+class DataFrameBuilder(object):
+    """
+    Accumulate rows or small DataFrames and produce a single DataFrame at
+    the end. Unlike calling DataFrame.append / concat in a loop, which
+    copies all of the data accumulated so far on every call, values are
+    appended to growable per-column buffers with amortised doubling, so
+    building a frame from n batches costs O(total size).
+
+    Parameters
+    ----------
+    columns : sequence, default None
+        Initial column order. Columns first seen in appended data are added
+        at the end
+    ignore_index : boolean, default False
+        If True, do not keep the index labels of the appended data; the
+        result is labeled 0, ..., n - 1. Required to append dicts
+    capacity : int, default 1024
+        Initial number of rows reserved in each buffer
+
+    Examples
+    --------
+    >>> builder = DataFrameBuilder()
+    >>> for batch in batches:
+    ...     builder.append(batch)
+    >>> df = builder.get_result()
+    """
+    _row_chunksize = 1024
+
+    def __init__(self, columns=None, ignore_index=False, capacity=1024):
+        self.ignore_index = ignore_index
+        self.capacity = max(int(capacity), 1)
+
+        self.columns = []
+        self._buffers = {}
+        self._nrows = 0
+
+        self._index = None
+        self._index_names = None
+        self._multi_index = False
+
+        self._pending = []
+        self._pending_names = []
+
+        if columns is not None:
+            for col in columns:
+                self._add_column(col)
+
+    def __len__(self):
+        return self._nrows + len(self._pending)
+
+    def __repr__(self):
+        return '%s: %d rows, %d columns' % (type(self).__name__, len(self),
+                                            len(self.columns))
+
+    def append(self, other):
+        """
+        Append data to the builder
+
+        Parameters
+        ----------
+        other : DataFrame, Series, dict or list of these
+            A Series (with its name as the index label) or dict is appended
+            as a single row
+        """
+        if isinstance(other, (list, tuple)):
+            for obj in other:
+                self.append(obj)
+        elif isinstance(other, DataFrame):
+            self._flush_rows()
+            self._append_frame(other)
+        elif isinstance(other, (Series, dict)):
+            name = getattr(other, 'name', None)
+            if name is None and not self.ignore_index:
+                raise Exception('Can only append a Series or dict if '
+                                'ignore_index=True')
+            self._pending.append(other)
+            self._pending_names.append(name)
+            if len(self._pending) >= self._row_chunksize:
+                self._flush_rows()
+        else:
+            raise TypeError('Cannot append object of type %s'
+                            % type(other).__name__)
+
+    def get_result(self):
+        """
+        Return the accumulated data as a DataFrame. The builder can continue
+        to be appended to afterwards
+
+        Returns
+        -------
+        result : DataFrame
+        """
+        from pandas.core.frame import _arrays_to_mgr
+
+        self._flush_rows()
+        n = self._nrows
+
+        if self.ignore_index or self._index is None:
+            index = Index(np.arange(n))
+        elif self._multi_index:
+            index = MultiIndex.from_tuples(self._index.get_values(n),
+                                           names=self._index_names)
+        else:
+            index = Index(self._index.get_values(n).copy(),
+                          name=self._index_names[0])
+
+        columns = Index(self.columns)
+        arrays = []
+        for col in self.columns:
+            buf = self._buffers[col]
+            buf.fill_na(n)
+            arrays.append(buf.get_values(n))
+
+        # the trimmed buffers are views, stacking them into blocks is the one
+        # copy made
+        mgr = _arrays_to_mgr(arrays, columns, index, columns)
+        return DataFrame(mgr)
+
+    def _add_column(self, col):
+        if col in self._buffers:
+            return
+        self.columns.append(col)
+        self._buffers[col] = _ColumnBuffer(self.capacity)
+
+    def _flush_rows(self):
+        if not self._pending:
+            return
+        rows = self._pending
+        names = self._pending_names
+        self._pending = []
+        self._pending_names = []
+
+        index = None if self.ignore_index else names
+        self._append_frame(DataFrame(rows, index=index))
+
+    def _append_frame(self, frame):
+        n = len(frame)
+        if n == 0:
+            return
+
+        for col in frame.columns:
+            self._add_column(col)
+
+        # go through the blocks to avoid materializing the Series
+        for block in frame._data.blocks:
+            values = block.get_values(block.dtype)
+            for i, item in enumerate(block.items):
+                buf = self._buffers[item]
+                buf.fill_na(self._nrows)
+                buf.append(values[i])
+
+        if not self.ignore_index:
+            self._append_index(frame.index)
+
+        self._nrows += n
+
+    def _append_index(self, index):
+        if self._index is None:
+            self._index = _ColumnBuffer(self.capacity)
+            self._index_names = list(index.names)
+            self._multi_index = isinstance(index, MultiIndex)
+        elif self._index_names != list(index.names):
+            self._index_names = [None] * len(self._index_names)
+
+        if self._multi_index and not isinstance(index, MultiIndex):
+            raise Exception('Cannot append data with a flat index to data '
+                            'with a MultiIndex')
+
+        if self._multi_index:
+            values = index.values
+        else:
+            values = np.asarray(index)
+        self._index.append(values)
+
+
+class _ColumnBuffer(object):
+    """
+    Growable 1-d array, upcast as needed to hold everything appended to it
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = None
+        self.length = 0
+
+    def get_values(self, n):
+        if self.values is None:
+            return np.empty(n, dtype=np.object_)
+        return self.values[:n]
+
+    def append(self, values):
+        values = np.asarray(values)
+        k = len(values)
+        if self.values is None:
+            self.values = np.empty(max(self.capacity, k), dtype=values.dtype)
+        else:
+            dtype = _get_append_dtype(self.values.dtype, values.dtype)
+            if dtype != self.values.dtype:
+                self.values = self.values.astype(dtype)
+            self._reserve(self.length + k)
+
+        self.values[self.length:self.length + k] = values
+        self.length += k
+
+    def fill_na(self, n):
+        """
+        Pad with missing values up to length n
+        """
+        k = n - self.length
+        if k <= 0:
+            return
+
+        if self.values is None:
+            self.values = np.empty(max(self.capacity, n), dtype=np.float64)
+        else:
+            if com._need_upcast(self.values) and \
+                    not com.is_datetime64_dtype(self.values):
+                self.values = com._maybe_upcast(self.values)
+            self._reserve(n)
+
+        if com.is_datetime64_dtype(self.values):
+            self.values.view(np.int64)[self.length:n] = lib.iNaT
+        else:
+            self.values[self.length:n] = np.nan
+        self.length = n
+
+    def _reserve(self, n):
+        cap = len(self.values)
+        if n <= cap:
+            return
+        new_values = np.empty(max(n, 2 * cap), dtype=self.values.dtype)
+        new_values[:self.length] = self.values[:self.length]
+        self.values = new_values
+
+
+def _get_append_dtype(left, right):
+    """
+    dtype able to hold values of both dtypes, following the same rules as
+    concatenating blocks
+    """
+    if left == right:
+        return left
+
+    kinds = set([_get_dtype_kind(left), _get_dtype_kind(right)])
+    if kinds == set(['int']) or kinds == set(['float']):
+        return np.promote_types(left, right)
+    elif kinds == set(['int', 'float']):
+        return np.dtype(np.float64)
+    return np.dtype(np.object_)
+
+
+def _get_dtype_kind(dtype):
+    if com.is_datetime64_dtype(dtype):
+        return 'datetime'
+    elif com.is_integer_dtype(dtype):
+        return 'int'
+    elif com.is_float_dtype(dtype):
+        return 'float'
+    elif issubclass(dtype.type, np.bool_):
+        return 'bool'
+    return 'object'
+
+
+def _conform_categorical_codes(blocks):
+    """
+    Codes of categorical blocks against common levels: unchanged if all the
+    levels match, otherwise recoded against the union of the levels
+    """
+    levels = blocks[0].levels
+    if all(blk.levels.equals(levels) for blk in blocks[1:]):
+        return levels, [blk.values for blk in blocks]
+
+    for blk in blocks[1:]:
+        levels = levels.union(blk.levels)
+
+    dtype = _codes_dtype(len(levels))
+    values_list = []
+    for blk in blocks:
+        indexer = levels.get_indexer(blk.levels).astype(dtype)
+        codes = indexer.take(com._ensure_platform_int(blk.values))
+        codes[blk.values == -1] = -1
+        values_list.append(codes)
+
+    return levels, values_list
+
+
 def _concat_indexes(indexes):
     return indexes[0].append(indexes[1:])
 
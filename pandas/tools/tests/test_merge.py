@@ -280,6 +280,31 @@ class TestMerge(unittest.TestCase):
                               'b': [2, 2]}, index=df.index)
         tm.assert_frame_equal(result, expected)
 
+    def test_join_masked_na_storage(self):
+        from pandas.core.internals import set_na_storage
+
+        left = DataFrame({'a': np.arange(5), 'b': np.arange(5) > 2})
+        right = DataFrame({'c': [1, 2], 'd': [True, False]}, index=[1, 3])
+
+        expected = left.join(right)
+
+        set_na_storage('mask')
+        try:
+            result = left.join(right)
+            self.assert_(result._data.is_masked('c'))
+            self.assert_(result._data.is_masked('d'))
+            self.assert_(not result._data.is_masked('a'))
+            self.assert_(result['a'].dtype == np.int64)
+            assert_frame_equal(result, expected)
+
+            left2 = left.reset_index()
+            right2 = right.reset_index()
+            expected = merge(left2, right2, on='index', how='outer')
+            result = merge(left2, right2, on='index', how='outer')
+            assert_frame_equal(result, expected)
+        finally:
+            set_na_storage('upcast')
+
     def test_join_index_mixed(self):
         df1 = DataFrame({'A': 1., 'B': 2, 'C': 'foo', 'D': True},
                         index=np.arange(10),
@@ -411,11 +436,14 @@ class TestMerge(unittest.TestCase):
         a = DataFrame(randn(10,2), columns=['a','b'])
         b = DataFrame(randn(10,1), columns=['c']).astype(np.float32)
         joined = a.join(b)
+        self.assert_(joined['c'].dtype == np.float32)
         expected = a.join(b.astype('f8'))
-        assert_frame_equal(joined, expected)
+        assert_frame_equal(joined.astype('f8'), expected)
 
         joined = b.join(a)
-        assert_frame_equal(expected, joined.reindex(columns=['a', 'b', 'c']))
+        self.assert_(joined['c'].dtype == np.float32)
+        assert_frame_equal(expected,
+                           joined.reindex(columns=['a', 'b', 'c']).astype('f8'))
 
         a = np.random.randint(0, 5, 100)
         b = np.random.random(100).astype('Float64')
@@ -424,7 +452,12 @@ class TestMerge(unittest.TestCase):
         xpdf = DataFrame({'a': a, 'b' : b, 'c' : c.astype('Float64')})
         s = DataFrame(np.random.random(5).astype('f'), columns=['md'])
         rs = df.merge(s, left_on='a', right_index=True)
+        self.assert_(rs['c'].dtype == np.float32)
+        self.assert_(rs['md'].dtype == np.float32)
+
         xp = xpdf.merge(s.astype('f8'), left_on='a', right_index=True)
+        rs['c'] = rs['c'].astype('f8')
+        rs['md'] = rs['md'].astype('f8')
         assert_frame_equal(rs, xp)
 
     def test_join_many_non_unique_index(self):
@@ -917,6 +950,32 @@ class TestConcatenate(unittest.TestCase):
         self.mixed_frame = self.frame.copy()
         self.mixed_frame['foo'] = 'bar'
 
+    def test_concat_masked_na_storage(self):
+        from pandas.core.internals import set_na_storage
+
+        df = DataFrame({'a': np.arange(5), 'b': np.arange(5) > 2})
+
+        set_na_storage('mask')
+        try:
+            reindexed = df.reindex([1, 7])
+            result = concat([df, reindexed])
+            self.assert_(result._data.is_masked('a'))
+            self.assert_(result._data.is_masked('b'))
+            self.assert_(np.isnan(result['a'].values[-1]))
+            self.assert_(np.array_equal(result['a'].values[:6],
+                                        [0, 1, 2, 3, 4, 1]))
+
+            # no missing values
+            result = concat([df, df])
+            self.assert_(result['a'].dtype == np.int64)
+
+            # outer join of the other axis
+            result = concat([df, reindexed.rename(columns={'a': 'c'})],
+                            axis=1)
+            self.assert_(result._data.is_masked('c'))
+        finally:
+            set_na_storage('upcast')
+
     def test_append(self):
         begin_index = self.frame.index[:5]
         end_index = self.frame.index[5:]
@@ -1168,6 +1227,25 @@ class TestConcatenate(unittest.TestCase):
 
         tm.assert_frame_equal(v1, expected)
 
+    def test_concat_ignore_index_rows_blocks(self):
+        # row-wise concat with ignore_index stays on the block path, so
+        # categorical columns are not decoded column by column
+        df1 = DataFrame({'cat': Categorical.from_array(['a', 'b', 'a']),
+                         'val': np.arange(3, dtype='i2')},
+                        index=['x', 'y', 'z'])
+        df2 = DataFrame({'cat': Categorical.from_array(['b', 'c']),
+                         'val': np.arange(2, dtype='i2')},
+                        index=['x', 'y'])
+
+        result = concat([df1, df2], ignore_index=True)
+        self.assert_(result.index.equals(Index(np.arange(5))))
+        self.assert_(result._data.is_categorical('cat'))
+        self.assert_(result['val'].dtype == np.int16)
+
+        expected = concat([df1, df2])
+        expected.index = np.arange(5)
+        tm.assert_frame_equal(result, expected)
+
     def test_concat_multiindex_with_keys(self):
         index = MultiIndex(levels=[['foo', 'bar', 'baz', 'qux'],
                                    ['one', 'two', 'three']],
@@ -1501,6 +1579,89 @@ class TestConcatenate(unittest.TestCase):
 
         self.assertEqual(len(left), len(right))
 
+class TestDataFrameBuilder(unittest.TestCase):
+
+    def test_append_frames(self):
+        pieces = [tm.makeTimeDataFrame()[i * 5:(i + 1) * 5]
+                  for i in range(6)]
+
+        builder = DataFrameBuilder(capacity=4)
+        for piece in pieces:
+            builder.append(piece)
+        self.assertEqual(len(builder), 30)
+
+        result = builder.get_result()
+        expected = concat(pieces)
+        assert_frame_equal(result, expected)
+        self.assert_(isinstance(result.index, DatetimeIndex))
+        self.assert_(result._data.is_consolidated())
+
+        # can keep appending
+        builder.append(pieces[0])
+        assert_frame_equal(builder.get_result(), concat(pieces + pieces[:1]))
+
+    def test_append_mixed(self):
+        df1 = DataFrame({'a': np.arange(3), 'b': ['x', 'y', 'z'],
+                         'c': [True, False, True],
+                         'd': date_range('1/1/2000', periods=3)})
+        df2 = DataFrame({'a': [1.5, 2.5], 'e': [1, 2]}, index=[3, 4])
+
+        builder = DataFrameBuilder()
+        builder.append(df1)
+        builder.append(df2)
+        result = builder.get_result()
+
+        self.assertEqual(list(result.columns), ['a', 'b', 'c', 'd', 'e'])
+        assert_almost_equal(result['a'], [0, 1, 2, 1.5, 2.5])
+        assert_almost_equal(result['b'], ['x', 'y', 'z', nan, nan])
+        assert_almost_equal(result['c'], [True, False, True, nan, nan])
+        assert_almost_equal(result['e'], [nan, nan, nan, 1, 2])
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertEqual(result['c'].dtype, np.object_)
+        self.assertEqual(result['d'].dtype, 'M8[ns]')
+        self.assert_(isnull(result['d'][3:]).all())
+        self.assert_(isnull(result['e'][:3]).all())
+
+    def test_append_rows(self):
+        rows = [{'a': i, 'b': 'foo%d' % i} for i in range(2500)]
+
+        builder = DataFrameBuilder(columns=['b', 'a'], ignore_index=True)
+        for row in rows:
+            builder.append(row)
+        result = builder.get_result()
+
+        expected = DataFrame(rows, columns=['b', 'a'])
+        assert_frame_equal(result, expected)
+
+        # named rows keep their labels
+        builder = DataFrameBuilder()
+        builder.append(Series({'a': 1, 'b': 2}, name='x'))
+        builder.append([Series({'a': 3, 'b': 4}, name='y')])
+        result = builder.get_result()
+        expected = DataFrame({'a': [1, 3], 'b': [2, 4]}, index=['x', 'y'])
+        assert_frame_equal(result, expected)
+
+        builder = DataFrameBuilder()
+        self.assertRaises(Exception, builder.append, {'a': 1})
+
+    def test_multiindex(self):
+        index = MultiIndex.from_tuples([('a', 1), ('a', 2), ('b', 1)],
+                                       names=['first', 'second'])
+        df = DataFrame(np.random.randn(3, 2), index=index)
+
+        builder = DataFrameBuilder()
+        builder.append(df)
+        builder.append(df)
+        result = builder.get_result()
+        assert_frame_equal(result, concat([df, df]))
+        self.assertEqual(result.index.names, ['first', 'second'])
+
+    def test_empty(self):
+        builder = DataFrameBuilder(columns=['a', 'b'])
+        result = builder.get_result()
+        self.assertEqual(len(result), 0)
+        self.assertEqual(list(result.columns), ['a', 'b'])
+
 class TestOrderedMerge(unittest.TestCase):
 
     def setUp(self):
@@ -12,6 +12,7 @@ from pandas.tseries.frequencies import infer_freq, to_offset, get_period_alias
 from pandas.tseries.offsets import DateOffset, generate_range, Tick
 from pandas.tseries.tools import parse_time_string, normalize_date
 from pandas.util.decorators import cache_readonly
+import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.tseries.offsets as offsets
 import pandas.tseries.tools as tools
@@ -122,6 +123,8 @@ class DatetimeIndex(Int64Index):
     _left_indexer = _join_i8_wrapper(_algos.left_join_indexer_int64)
     _left_indexer_unique = _join_i8_wrapper(
         _algos.left_join_indexer_unique_int64, with_indexers=False)
+    _setdiff_indexer = _join_i8_wrapper(_algos.setdiff_indexer_int64,
+                                        with_indexers=False)
     _arrmap = None
 
     __eq__ = _dt_index_cmp('__eq__')
@@ -575,8 +578,8 @@ class DatetimeIndex(Int64Index):
             except ValueError:
                 return self.asobject.isin(values)
 
-        value_set = set(values.asi8)
-        return lib.ismember(self.asi8, value_set)
+        return algos.isin(self.asi8, values.asi8,
+                          is_sorted=self.is_monotonic)
 
     def to_datetime(self, dayfirst=False):
         return self.copy()
@@ -76,3 +76,13 @@ df = DataFrame(randn(10000, 100))
 # as far back as the earliest test currently in the suite
 frame_iteritems = Benchmark('for name,col in df.iteritems(): pass', setup,
                                      start_date=datetime(2010, 6, 1))
+
+#----------------------------------------------------------------------
+# column access on a wide frame (bounded item cache)
+
+setup = common_setup + """
+df = DataFrame(randn(100, 10000))
+"""
+
+frame_getitem_wide = Benchmark('for col in df.columns: df[col]', setup,
+                               start_date=datetime(2012, 12, 1))
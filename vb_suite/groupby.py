@@ -39,6 +39,52 @@ stmt3 = "df.groupby(['key1', 'key2']).sum()"
 groupby_multi_cython = Benchmark(stmt3, setup,
                                  start_date=datetime(2011, 7, 1))
 
+groupby_multi_reuse_grouper = \
+    Benchmark("grouped.reuse_on(df).sum()",
+              setup + "grouped = df.groupby(['key1', 'key2']); grouped.sum()",
+              start_date=datetime(2012, 11, 1))
+
+groupby_multi_cython_nosort = \
+    Benchmark("df.groupby(['key1', 'key2'], sort=False).sum()", setup,
+              start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# apply in a worker pool
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame({'key' : np.random.randint(0, 100, size=N),
+                'value' : np.random.randn(N)})
+grouped = df.groupby('key')['value']
+"""
+
+groupby_apply_serial = Benchmark("grouped.apply(np.median)", setup,
+                                 start_date=datetime(2012, 11, 1))
+
+groupby_apply_4jobs = Benchmark("grouped.apply(np.median, n_jobs=4)", setup,
+                                start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# chunked aggregation
+
+setup = common_setup + """
+from pandas.core.groupby import GroupByAccumulator
+
+N = 1000000
+df = DataFrame({'key' : np.random.randint(0, 10000, size=N),
+                'value' : np.random.randn(N)})
+arg = {'value' : ['count', 'mean', 'var', 'min', 'max']}
+
+def accumulate(chunksize):
+    acc = GroupByAccumulator('key', arg)
+    for i in range(0, N, chunksize):
+        acc.update(df[i:i + chunksize])
+    return acc.result()
+"""
+
+groupby_accumulator_10chunks = Benchmark("accumulate(N // 10)", setup,
+                                         start_date=datetime(2012, 11, 1))
+
 stmt = "df.groupby(['key1', 'key2'])['data1'].agg(np.std)"
 groupby_multi_series_op = Benchmark(stmt, setup,
                                     start_date=datetime(2011, 8, 1))
@@ -98,6 +144,12 @@ groupby_multi_different_numpy_functions = \
                                                    'value3' : np.sum})""",
               setup, start_date=datetime(2011, 9, 1))
 
+groupby_multi_stats_one_column = \
+    Benchmark("""df.groupby(['key1', 'key2']).agg({'value1' : ['mean', 'std',
+                                                               'min', 'max',
+                                                               'count']})""",
+              setup, start_date=datetime(2012, 11, 1))
+
 #----------------------------------------------------------------------
 # size() speed
 
@@ -173,6 +225,39 @@ groupby_first = Benchmark('data.groupby(labels).first()', setup,
 groupby_last = Benchmark('data.groupby(labels).last()', setup,
                           start_date=datetime(2012, 5, 1))
 
+#----------------------------------------------------------------------
+# int64 and datetime64 values, no casting to float64
+
+setup = common_setup + """
+labels = np.arange(10000).repeat(10)
+labels = labels.take(np.random.permutation(len(labels)))
+ints = Series(np.random.randint(0, 1000, size=len(labels)).astype('i8'))
+stamps = Series(ints.values * 10 ** 9 + 1325376000 * 10 ** 9).astype('M8[ns]')
+"""
+
+groupby_sum_int64 = Benchmark('ints.groupby(labels).sum()', setup,
+                              start_date=datetime(2012, 11, 1))
+
+groupby_max_datetime64 = Benchmark('stamps.groupby(labels).max()', setup,
+                                   start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# group-wise transforms, many small groups
+
+setup = common_setup + """
+labels = np.random.randint(0, 100000, size=500000)
+data = Series(np.random.randn(len(labels)))
+"""
+
+groupby_cumsum = Benchmark('data.groupby(labels).cumsum()', setup,
+                           start_date=datetime(2012, 11, 1))
+
+groupby_shift = Benchmark('data.groupby(labels).shift()', setup,
+                          start_date=datetime(2012, 11, 1))
+
+groupby_rank = Benchmark('data.groupby(labels).rank()', setup,
+                         start_date=datetime(2012, 11, 1))
+
 
 #----------------------------------------------------------------------
 # groupby_indices replacement, chop up Series
@@ -220,3 +305,34 @@ groupby_simple_compress_timing = \
     Benchmark('df.groupby(labels).mean()', setup,
               start_date=datetime(2011, 8, 1))
 
+
+#----------------------------------------------------------------------
+# thread scaling: the same aggregations run one after another and in four
+# threads; the numeric kernels release the GIL so the threads can run on
+# several cores
+
+setup = common_setup + """
+import threading
+
+N = 1000000
+frames = [DataFrame(np.random.randn(N, 4)) for _ in range(4)]
+labels = np.random.randint(0, 1000, size=N)
+
+def aggregate(df):
+    df.groupby(labels).sum()
+
+def run_threaded(nthreads):
+    for i in range(0, len(frames), nthreads):
+        threads = [threading.Thread(target=aggregate, args=(df,))
+                   for df in frames[i:i + nthreads]]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+"""
+
+groupby_sum_1thread = Benchmark('run_threaded(1)', setup,
+                                start_date=datetime(2012, 11, 1))
+
+groupby_sum_4threads = Benchmark('run_threaded(4)', setup,
+                                 start_date=datetime(2012, 11, 1))
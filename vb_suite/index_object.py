@@ -33,3 +33,71 @@ index_int64_union = Benchmark('left.union(right)', setup,
 
 index_int64_intersection = Benchmark('left.intersection(right)', setup,
                                      start_date=datetime(2011, 1, 1))
+
+#----------------------------------------------------------------------
+# sorted-merge set operations
+
+setup = common_setup + """
+N = 100000
+floats = Index(np.arange(N) * 0.5)
+floats2 = Index(np.arange(N // 2, N * 2) * 0.5)
+strs = Index(sorted(tm.makeStringIndex(N)))
+strs2 = strs[::3]
+rng = date_range('1/1/2000', periods=N, freq='T')
+rng2 = rng[::3]
+"""
+
+index_float_union = Benchmark('floats.union(floats2)', setup,
+                              start_date=datetime(2012, 11, 1))
+
+index_float_intersection = Benchmark('floats.intersection(floats2)', setup,
+                                     start_date=datetime(2012, 11, 1))
+
+index_str_diff = Benchmark('strs.diff(strs2)', setup,
+                           start_date=datetime(2012, 11, 1))
+
+index_datetime_diff = Benchmark('rng.diff(rng2)', setup,
+                                start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# default range index
+
+setup = common_setup + """
+N = 1000000
+s = Series(np.random.randn(N))
+rng = RangeIndex(N)
+rng2 = RangeIndex(N // 2, N * 2, 3)
+"""
+
+range_index_getitem = Benchmark('s[N // 3]', setup,
+                                start_date=datetime(2012, 11, 1))
+
+range_index_intersection = Benchmark('rng.intersection(rng2)', setup,
+                                     start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# MultiIndex lookups on the level labels
+
+setup = common_setup + """
+mi = MultiIndex.from_arrays([np.arange(1000).repeat(1000),
+                             np.tile(np.arange(1000), 1000)])
+target = mi[::7]
+"""
+
+multiindex_is_unique = Benchmark('MultiIndex(levels=mi.levels, '
+                                 'labels=mi.labels).is_unique', setup,
+                                 start_date=datetime(2012, 11, 1))
+
+multiindex_get_indexer = Benchmark('mi.get_indexer(target)', setup,
+                                   start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# shared index engines
+
+setup = common_setup + """
+idx = Index(np.arange(100000).astype(object))
+idx.get_loc(5)
+"""
+
+index_view_get_loc = Benchmark('idx[:].get_loc(5)', setup,
+                               start_date=datetime(2012, 11, 1))
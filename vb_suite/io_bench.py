@@ -44,3 +44,12 @@ df = DataFrame(np.random.randn(3000, 30))
 """
 frame_to_csv = Benchmark("df.to_csv('__test__.csv')", setup,
                          start_date=datetime(2011, 1, 1))
+
+#----------------------------------------------------------------------
+# to_excel
+
+write_excel_xls = Benchmark("df.to_excel('__test__.xls', 'sheet1')", setup2,
+                            start_date=datetime(2012, 12, 1))
+
+write_excel_xlsx = Benchmark("df.to_excel('__test__.xlsx', 'sheet1')", setup2,
+                             start_date=datetime(2012, 12, 1))
@@ -167,3 +167,28 @@ right = DataFrame({'key' : np.arange(10000),
 """
 
 stmt = "ordered_merge(left, right, on='key', left_by='group')"
+
+#----------------------------------------------------------------------
+# Building a DataFrame from many small pieces
+
+setup = common_setup + """
+pieces = [DataFrame(np.random.randn(100, 10)) for _ in xrange(200)]
+
+def append_loop():
+    result = pieces[0]
+    for piece in pieces[1:]:
+        result = result.append(piece)
+    return result
+
+def builder_loop():
+    builder = DataFrameBuilder()
+    for piece in pieces:
+        builder.append(piece)
+    return builder.get_result()
+"""
+
+append_frame_loop = Benchmark('append_loop()', setup,
+                              start_date=datetime(2012, 12, 1))
+
+dataframe_builder_loop = Benchmark('builder_loop()', setup,
+                                   start_date=datetime(2012, 12, 1))
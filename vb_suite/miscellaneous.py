@@ -32,3 +32,23 @@ all = uniques.repeat(10)
 
 match_strings = Benchmark("match(all, uniques)", setup,
                           start_date=datetime(2012, 5, 12))
+
+#----------------------------------------------------------------------
+# isin
+
+setup = common_setup + """
+s_int = Series(np.random.randint(0, 100000, 1000000))
+s_float = s_int.astype(float)
+s_str = Series(tm.makeStringIndex(1000)).repeat(1000)
+int_values = np.random.randint(0, 100000, 1000)
+str_values = list(s_str[:100])
+"""
+
+series_isin_int64 = Benchmark("s_int.isin(int_values)", setup,
+                              start_date=datetime(2012, 11, 1))
+
+series_isin_float64 = Benchmark("s_float.isin(int_values)", setup,
+                                start_date=datetime(2012, 11, 1))
+
+series_isin_strings = Benchmark("s_str.isin(str_values)", setup,
+                                start_date=datetime(2012, 11, 1))
@@ -16,6 +16,18 @@ statement = "df.reindex(columns=df.columns[1:5])"
 reindex_frame_columns = Benchmark(statement, setup,
                                   name='dataframe_reindex_columns')
 
+setup = common_setup + """
+df = DataFrame(index=range(10000),
+               data=np.random.rand(10000, 30).astype('f4'),
+               columns=range(30))
+indexer = np.arange(20000) - 5000
+"""
+statement = "df.reindex(indexer)"
+
+reindex_frame_float32 = Benchmark(statement, setup,
+                                  name='dataframe_reindex_float32',
+                                  start_date=datetime(2012, 12, 1))
+
 #----------------------------------------------------------------------
 
 setup = common_setup + """